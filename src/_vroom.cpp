@@ -1,4 +1,5 @@
 #include "bind/_main.cpp"
+#include "bind/serialization.cpp"
 #include "bind/utils.cpp"
 
 #include "bind/amount.cpp"
@@ -10,11 +11,11 @@
 #include "bind/time_window.cpp"
 #include "bind/vehicle.cpp"
 
+#include "bind/generic/matrix.cpp"
+
 #include "bind/input/input.cpp"
 #include "bind/input/vehicle_step.cpp"
 
-#include "bind/generic/matrix.cpp"
-
 #include "bind/solution/route.cpp"
 #include "bind/solution/solution.cpp"
 #include "bind/solution/step.cpp"
@@ -139,7 +140,10 @@ PYBIND11_MODULE(_vroom, m) {
 
   py::class_<vroom::Server>(m, "Server")
       .def(py::init<std::string &, std::string &, std::string &>(),
-           py::arg("host") = "0.0.0.0", py::arg("port") = "5000", py::arg("path") = "");
+           py::arg("host") = "0.0.0.0", py::arg("port") = "5000", py::arg("path") = "")
+      .def_readonly("host", &vroom::Server::host)
+      .def_readonly("port", &vroom::Server::port)
+      .def_readonly("path", &vroom::Server::path);
 
   py::class_<vroom::Violations>(m, "Violations")
       .def(py::init<>())
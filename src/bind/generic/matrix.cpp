@@ -1,30 +1,147 @@
+#include <algorithm>
+#include <cstring>
+#include <limits>
+#include <string>
+#include <thread>
+#include <vector>
+
+#include <pybind11/numpy.h>
 #include <pybind11/pybind11.h>
 
 #include "structures/generic/matrix.h"
+#include "utils/exception.h"
 
 namespace py = pybind11;
 
+// Copy values into the matrix storage, widening and scaling them on the way.
+template <class T>
+void fill_scaled(uint32_t *target, const T *source, std::size_t count,
+                 uint32_t scale) {
+  uint64_t largest = 0;
+  for (std::size_t i = 0; i < count; i++) {
+    const uint64_t value = static_cast<uint64_t>(source[i]) * scale;
+    largest = std::max(largest, value);
+    target[i] = static_cast<uint32_t>(value);
+  }
+  if (largest > std::numeric_limits<uint32_t>::max())
+    throw vroom::InputException("Scaled matrix value exceeds uint32 range.");
+}
+
+// Fill a matrix from any two-dimensional array in a single pass.
+//
+// C-contiguous uint32 and uint16 buffers are copied straight over with the
+// GIL released. Anything else is cast by numpy directly into the matrix
+// storage, so no intermediate uint32 copy of the full block is ever
+// allocated. Values are multiplied by `scale` along the way.
+vroom::Matrix<uint32_t> matrix_from_array(const py::array &array,
+                                          uint32_t scale = 1) {
+  if (array.ndim() != 2 || array.shape(0) != array.shape(1))
+    throw std::runtime_error("Incompatible buffer format!");
+  const std::size_t size = array.shape(0);
+  vroom::Matrix<uint32_t> matrix(size);
+  if (size == 0)
+    return matrix;
+
+  uint32_t *target = matrix.get_data();
+  const std::size_t count = size * size;
+  const bool contiguous = array.flags() & py::array::c_style;
+  if (contiguous && py::isinstance<py::array_t<uint32_t>>(array)) {
+    const auto *source = static_cast<const uint32_t *>(array.data());
+    py::gil_scoped_release release;
+    if (scale == 1)
+      std::memcpy(target, source, sizeof(uint32_t) * count);
+    else
+      fill_scaled(target, source, count, scale);
+  } else if (contiguous && py::isinstance<py::array_t<uint16_t>>(array)) {
+    const auto *source = static_cast<const uint16_t *>(array.data());
+    py::gil_scoped_release release;
+    fill_scaled(target, source, count, scale);
+  } else {
+    // Unowned view on the matrix storage; py::none() as base avoids a copy.
+    py::array_t<uint32_t> view({size, size}, target, py::none());
+    py::module_::import("numpy").attr("copyto")(view, array,
+                                                py::arg("casting") = "unsafe");
+    if (scale != 1) {
+      py::gil_scoped_release release;
+      fill_scaled(target, target, count, scale);
+    }
+  }
+  return matrix;
+}
+
+// Extract the rows and columns `indices` of a full matrix.
+//
+// The full matrix is typically a large, possibly memory-mapped, array shared
+// by many problems. Rows are split between `nb_threads` threads, with the
+// GIL released.
+vroom::Matrix<uint32_t> sub_matrix_from_array(
+    const py::array_t<uint32_t, py::array::c_style | py::array::forcecast>
+        &full,
+    const py::array_t<int64_t, py::array::c_style | py::array::forcecast>
+        &indices,
+    unsigned nb_threads = 1) {
+  if (full.ndim() != 2 || full.shape(0) != full.shape(1))
+    throw std::runtime_error("Incompatible buffer format!");
+  const std::size_t pool_size = full.shape(0);
+  const std::size_t size = indices.size();
+  const int64_t *index = indices.data();
+  for (std::size_t i = 0; i < size; i++) {
+    if (index[i] < 0 || static_cast<std::size_t>(index[i]) >= pool_size)
+      throw vroom::InputException("Location index " +
+                                  std::to_string(index[i]) +
+                                  " outside of matrix pool.");
+  }
+
+  vroom::Matrix<uint32_t> matrix(size);
+  const uint32_t *source = full.data();
+  uint32_t *target = matrix.get_data();
+  auto fill_rows = [&](std::size_t begin, std::size_t end) {
+    for (std::size_t i = begin; i < end; i++) {
+      const uint32_t *row = source + index[i] * pool_size;
+      uint32_t *out = target + i * size;
+      for (std::size_t j = 0; j < size; j++)
+        out[j] = row[index[j]];
+    }
+  };
+
+  py::gil_scoped_release release;
+  nb_threads = std::max(1u, std::min<unsigned>(nb_threads, size));
+  if (nb_threads == 1) {
+    fill_rows(0, size);
+    return matrix;
+  }
+  const std::size_t chunk = (size + nb_threads - 1) / nb_threads;
+  std::vector<std::thread> threads;
+  for (std::size_t begin = 0; begin < size; begin += chunk)
+    threads.emplace_back(fill_rows, begin, std::min(begin + chunk, size));
+  for (auto &thread : threads)
+    thread.join();
+  return matrix;
+}
+
 void init_matrix(py::module_ &m) {
 
   py::class_<vroom::Matrix<uint32_t>>(m, "Matrix", py::buffer_protocol())
       .def(py::init<std::size_t>(), py::arg("size") = 0)
       .def(py::init([](vroom::Matrix<uint32_t> &m) { return m; }))
-      .def(py::init([](const py::buffer &b) {
-        py::buffer_info info = b.request();
-        if (info.format != py::format_descriptor<uint32_t>::format() ||
-            info.ndim != 2 || info.shape[0] != info.shape[1])
-          throw std::runtime_error("Incompatible buffer format!");
-        auto v = new vroom::Matrix<uint32_t>(info.shape[0]);
-        memcpy(v->get_data(), info.ptr,
-               sizeof(uint32_t) * (size_t)(v->size() * v->size()));
-        return v;
-      }))
+      .def(py::init(&matrix_from_array), py::arg("array"),
+           py::arg("scale") = 1)
       .def_buffer([](vroom::Matrix<uint32_t> &m) -> py::buffer_info {
         return py::buffer_info(m.get_data(), sizeof(uint32_t),
                                py::format_descriptor<uint32_t>::format(), 2,
                                {m.size(), m.size()},
-                               {sizeof(uint32_t) * m.size(), m.size()});
+                               {sizeof(uint32_t) * m.size(), sizeof(uint32_t)});
       })
+      .def("__reduce__",
+           [](py::object self) {
+             auto &matrix = self.cast<vroom::Matrix<uint32_t> &>();
+             const auto view = py::array_t<uint32_t>(
+                 {matrix.size(), matrix.size()}, matrix.get_data(), self);
+             return py::make_tuple(py::type::of(self), py::make_tuple(view));
+           })
       .def("get_sub_matrix", &vroom::Matrix<uint32_t>::get_sub_matrix)
       .def("size", &vroom::Matrix<uint32_t>::size);
+
+  m.def("_sub_matrix", &sub_matrix_from_array, py::arg("full"),
+        py::arg("indices"), py::arg("nb_threads") = 1);
 }
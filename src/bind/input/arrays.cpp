@@ -0,0 +1,622 @@
+#include <cmath>
+#include <optional>
+#include <string>
+#include <vector>
+
+#include <pybind11/numpy.h>
+#include <pybind11/pybind11.h>
+#include <pybind11/stl.h>
+
+#include "structures/vroom/input/input.h"
+
+namespace py = pybind11;
+
+template <typename T>
+using _Array = py::array_t<T, py::array::c_style | py::array::forcecast>;
+
+void check_array_shape(const py::array &array, const std::string &name,
+                       py::ssize_t rows, py::ssize_t ndim = 1) {
+  if (array.ndim() != ndim || array.shape(0) != rows)
+    throw vroom::InputException("Wrong shape for " + name + "; expected " +
+                                std::to_string(rows) + " rows.");
+}
+
+void check_strings_length(const std::optional<std::vector<std::string>> &strings,
+                          py::ssize_t rows, const std::string &name) {
+  if (strings.has_value() && (py::ssize_t)strings.value().size() != rows)
+    throw vroom::InputException("Wrong length for " + name + "; expected " +
+                                std::to_string(rows) + " rows.");
+}
+
+template <typename T>
+const T *optional_data(const std::optional<_Array<T>> &array, py::ssize_t rows,
+                       const std::string &name) {
+  if (!array.has_value())
+    return nullptr;
+  check_array_shape(array.value(), name, rows);
+  return array.value().data();
+}
+
+// Value of row `i`, or nothing if the array is missing or the row invalid.
+template <typename T>
+std::optional<T> optional_value(const T *values, const bool *valid,
+                                py::ssize_t i) {
+  if (values == nullptr || (valid != nullptr && !valid[i]))
+    return std::nullopt;
+  return values[i];
+}
+
+std::vector<std::optional<vroom::Location>>
+locations_from_arrays(const std::optional<_Array<int64_t>> &indices,
+                      const std::optional<_Array<double>> &coordinates,
+                      py::ssize_t size, const std::string &name) {
+  // Negative indices and NaN coordinates are interpreted as missing.
+  std::vector<std::optional<vroom::Location>> locations(size);
+  if (indices.has_value()) {
+    check_array_shape(indices.value(), name, size);
+    auto index = indices.value().unchecked<1>();
+    for (py::ssize_t i = 0; i < size; i++) {
+      if (index(i) < 0)
+        continue;
+      if (index(i) > std::numeric_limits<vroom::Index>::max())
+        throw vroom::InputException("Invalid location index " +
+                                    std::to_string(index(i)) + " in " + name +
+                                    ".");
+      locations[i] = vroom::Location(static_cast<vroom::Index>(index(i)));
+    }
+  } else if (coordinates.has_value()) {
+    check_array_shape(coordinates.value(), name, size, 2);
+    if (coordinates.value().shape(1) != 2)
+      throw vroom::InputException("Wrong shape for " + name +
+                                  "; expected longitude and latitude columns.");
+    auto coords = coordinates.value().unchecked<2>();
+    for (py::ssize_t i = 0; i < size; i++)
+      if (!std::isnan(coords(i, 0)) && !std::isnan(coords(i, 1)))
+        locations[i] =
+            vroom::Location(vroom::Coordinates{coords(i, 0), coords(i, 1)});
+  }
+  return locations;
+}
+
+std::vector<vroom::Amount>
+amounts_from_array(const std::optional<_Array<int64_t>> &array,
+                   py::ssize_t size, std::size_t width,
+                   const std::string &name) {
+  std::vector<vroom::Amount> amounts;
+  amounts.reserve(size);
+  if (!array.has_value()) {
+    amounts.assign(size, vroom::Amount(width));
+    return amounts;
+  }
+  check_array_shape(array.value(), name, size, 2);
+  if ((std::size_t)array.value().shape(1) != width)
+    throw vroom::InputException("Inconsistent amount width for " + name + ".");
+  auto values = array.value().unchecked<2>();
+  for (py::ssize_t i = 0; i < size; i++) {
+    vroom::Amount amount(width);
+    for (std::size_t j = 0; j < width; j++)
+      amount[j] = values(i, j);
+    amounts.push_back(std::move(amount));
+  }
+  return amounts;
+}
+
+vroom::Skills skills_from_bitmask(uint64_t bitmask) {
+  vroom::Skills skills;
+  for (vroom::Skill skill = 0; bitmask; skill++, bitmask >>= 1)
+    if (bitmask & 1)
+      skills.insert(skill);
+  return skills;
+}
+
+// Skills of each row, either from bitmasks or from flat skills stored with
+// `offsets` marking where the skills of each row start.
+std::vector<vroom::Skills>
+skills_from_arrays(const std::optional<_Array<uint64_t>> &bitmasks,
+                   const std::optional<_Array<vroom::Skill>> &values,
+                   const std::optional<_Array<int64_t>> &offsets,
+                   py::ssize_t size) {
+  std::vector<vroom::Skills> skills(size);
+  if (bitmasks.has_value() && values.has_value())
+    throw vroom::InputException("Skills given both as bitmasks and as lists.");
+  if (bitmasks.has_value()) {
+    auto bitmask = optional_data(bitmasks, size, "skills");
+    for (py::ssize_t i = 0; i < size; i++)
+      skills[i] = skills_from_bitmask(bitmask[i]);
+    return skills;
+  }
+  if (values.has_value() != offsets.has_value())
+    throw vroom::InputException("Both skill values and offsets required.");
+  if (!values.has_value())
+    return skills;
+  auto value = values.value().unchecked<1>();
+  check_array_shape(offsets.value(), "skill offsets", size + 1);
+  auto offset = offsets.value().unchecked<1>();
+  if (offset(0) != 0 || offset(size) != value.shape(0))
+    throw vroom::InputException("Invalid skill offsets.");
+  for (py::ssize_t i = 0; i < size; i++) {
+    if (offset(i + 1) < offset(i))
+      throw vroom::InputException("Invalid skill offsets.");
+    for (auto k = offset(i); k < offset(i + 1); k++)
+      skills[i].insert(value(k));
+  }
+  return skills;
+}
+
+std::vector<std::vector<vroom::TimeWindow>>
+time_windows_from_arrays(const std::optional<_Array<uint32_t>> &starts,
+                         const std::optional<_Array<uint32_t>> &ends,
+                         const std::optional<_Array<int64_t>> &offsets,
+                         py::ssize_t size, const std::string &name) {
+  std::vector<std::vector<vroom::TimeWindow>> tws(
+      size, std::vector<vroom::TimeWindow>(1, vroom::TimeWindow()));
+  if (starts.has_value() != ends.has_value())
+    throw vroom::InputException("Both " + name + " starts and ends required.");
+  if (!starts.has_value())
+    return tws;
+  auto start = starts.value().unchecked<1>();
+  auto end = ends.value().unchecked<1>();
+  if (start.shape(0) != end.shape(0))
+    throw vroom::InputException("Inconsistent " + name +
+                                " starts and ends lengths.");
+
+  if (!offsets.has_value()) {
+    check_array_shape(starts.value(), name + " starts", size);
+    for (py::ssize_t i = 0; i < size; i++)
+      tws[i][0] = vroom::TimeWindow(start(i), end(i));
+    return tws;
+  }
+
+  check_array_shape(offsets.value(), name + " offsets", size + 1);
+  auto offset = offsets.value().unchecked<1>();
+  if (offset(0) != 0 || offset(size) != start.shape(0))
+    throw vroom::InputException("Invalid " + name + " offsets.");
+  for (py::ssize_t i = 0; i < size; i++) {
+    if (offset(i + 1) < offset(i))
+      throw vroom::InputException("Invalid " + name + " offsets.");
+    if (offset(i + 1) == offset(i))
+      continue;
+    tws[i].clear();
+    tws[i].reserve(offset(i + 1) - offset(i));
+    for (auto k = offset(i); k < offset(i + 1); k++)
+      tws[i].emplace_back(start(k), end(k));
+  }
+  return tws;
+}
+
+// Columns describing where and when a job, pickup or delivery takes place.
+struct _TaskColumns {
+  std::string name;
+  std::vector<std::optional<vroom::Location>> locations;
+  const vroom::UserDuration *setup;
+  const vroom::UserDuration *service;
+  std::vector<std::vector<vroom::TimeWindow>> tws;
+  const std::optional<std::vector<std::string>> &descriptions;
+
+  _TaskColumns(const std::string &name, py::ssize_t size,
+               const std::optional<_Array<int64_t>> &location_indices,
+               const std::optional<_Array<double>> &coordinates,
+               const std::optional<_Array<vroom::UserDuration>> &default_setup,
+               const std::optional<_Array<vroom::UserDuration>> &default_service,
+               const std::optional<_Array<uint32_t>> &tw_starts,
+               const std::optional<_Array<uint32_t>> &tw_ends,
+               const std::optional<_Array<int64_t>> &tw_offsets,
+               const std::optional<std::vector<std::string>> &descriptions)
+      : name(name),
+        locations(locations_from_arrays(location_indices, coordinates, size,
+                                        name + " locations")),
+        setup(optional_data(default_setup, size, name + " default_setup")),
+        service(
+            optional_data(default_service, size, name + " default_service")),
+        tws(time_windows_from_arrays(tw_starts, tw_ends, tw_offsets, size,
+                                     name + " time window")),
+        descriptions(descriptions) {
+    check_strings_length(descriptions, size, name + " descriptions");
+  }
+
+  const vroom::Location &location(py::ssize_t i, vroom::Id id) const {
+    if (!locations[i].has_value())
+      throw vroom::InputException("Missing location for " + name + " " +
+                                  std::to_string(id) + ".");
+    return locations[i].value();
+  }
+
+  std::string description(py::ssize_t i) const {
+    return descriptions.has_value() ? descriptions.value()[i] : "";
+  }
+};
+
+void add_jobs_from_arrays(
+    vroom::Input &self, const _Array<vroom::Id> &ids,
+    const std::optional<_Array<int64_t>> &location_indices,
+    const std::optional<_Array<double>> &coordinates,
+    const std::optional<_Array<vroom::UserDuration>> &default_setup,
+    const std::optional<_Array<vroom::UserDuration>> &default_service,
+    const std::optional<_Array<int64_t>> &delivery,
+    const std::optional<_Array<int64_t>> &pickup,
+    const std::optional<_Array<uint64_t>> &skills,
+    const std::optional<_Array<vroom::Skill>> &skill_values,
+    const std::optional<_Array<int64_t>> &skill_offsets,
+    const std::optional<_Array<vroom::Priority>> &priority,
+    const std::optional<_Array<uint32_t>> &tw_starts,
+    const std::optional<_Array<uint32_t>> &tw_ends,
+    const std::optional<_Array<int64_t>> &tw_offsets,
+    const std::optional<std::vector<std::string>> &descriptions) {
+  const py::ssize_t size = ids.size();
+  check_array_shape(ids, "ids", size);
+
+  std::size_t width = 0;
+  if (delivery.has_value())
+    width = delivery.value().ndim() == 2 ? delivery.value().shape(1) : 0;
+  else if (pickup.has_value())
+    width = pickup.value().ndim() == 2 ? pickup.value().shape(1) : 0;
+
+  _TaskColumns columns("job", size, location_indices, coordinates,
+                       default_setup, default_service, tw_starts, tw_ends,
+                       tw_offsets, descriptions);
+  auto deliveries = amounts_from_array(delivery, size, width, "delivery");
+  auto pickups = amounts_from_array(pickup, size, width, "pickup");
+  auto skill_sets =
+      skills_from_arrays(skills, skill_values, skill_offsets, size);
+  auto priority_ptr = optional_data(priority, size, "priority");
+
+  auto id = ids.unchecked<1>();
+  self.jobs.reserve(self.jobs.size() + size);
+  for (py::ssize_t i = 0; i < size; i++) {
+    self.add_job(vroom::Job(
+        id(i), columns.location(i, id(i)),
+        columns.setup ? columns.setup[i] : 0,
+        columns.service ? columns.service[i] : 0, std::move(deliveries[i]),
+        std::move(pickups[i]), std::move(skill_sets[i]),
+        priority_ptr ? priority_ptr[i] : 0, columns.tws[i],
+        columns.description(i)));
+  }
+}
+
+void add_shipments_from_arrays(
+    vroom::Input &self, const _Array<vroom::Id> &pickup_ids,
+    const std::optional<_Array<int64_t>> &pickup_location_indices,
+    const std::optional<_Array<double>> &pickup_coordinates,
+    const std::optional<_Array<vroom::UserDuration>> &pickup_default_setup,
+    const std::optional<_Array<vroom::UserDuration>> &pickup_default_service,
+    const std::optional<_Array<uint32_t>> &pickup_tw_starts,
+    const std::optional<_Array<uint32_t>> &pickup_tw_ends,
+    const std::optional<_Array<int64_t>> &pickup_tw_offsets,
+    const std::optional<std::vector<std::string>> &pickup_descriptions,
+    const _Array<vroom::Id> &delivery_ids,
+    const std::optional<_Array<int64_t>> &delivery_location_indices,
+    const std::optional<_Array<double>> &delivery_coordinates,
+    const std::optional<_Array<vroom::UserDuration>> &delivery_default_setup,
+    const std::optional<_Array<vroom::UserDuration>> &delivery_default_service,
+    const std::optional<_Array<uint32_t>> &delivery_tw_starts,
+    const std::optional<_Array<uint32_t>> &delivery_tw_ends,
+    const std::optional<_Array<int64_t>> &delivery_tw_offsets,
+    const std::optional<std::vector<std::string>> &delivery_descriptions,
+    const std::optional<_Array<int64_t>> &amount,
+    const std::optional<_Array<uint64_t>> &skills,
+    const std::optional<_Array<vroom::Skill>> &skill_values,
+    const std::optional<_Array<int64_t>> &skill_offsets,
+    const std::optional<_Array<vroom::Priority>> &priority) {
+  const py::ssize_t size = pickup_ids.size();
+  check_array_shape(pickup_ids, "pickup ids", size);
+  check_array_shape(delivery_ids, "delivery ids", size);
+
+  std::size_t width = 0;
+  if (amount.has_value())
+    width = amount.value().ndim() == 2 ? amount.value().shape(1) : 0;
+
+  _TaskColumns pickups("pickup", size, pickup_location_indices,
+                       pickup_coordinates, pickup_default_setup,
+                       pickup_default_service, pickup_tw_starts, pickup_tw_ends,
+                       pickup_tw_offsets, pickup_descriptions);
+  _TaskColumns deliveries("delivery", size, delivery_location_indices,
+                          delivery_coordinates, delivery_default_setup,
+                          delivery_default_service, delivery_tw_starts,
+                          delivery_tw_ends, delivery_tw_offsets,
+                          delivery_descriptions);
+  auto amounts = amounts_from_array(amount, size, width, "amount");
+  auto skill_sets =
+      skills_from_arrays(skills, skill_values, skill_offsets, size);
+  auto priority_ptr = optional_data(priority, size, "priority");
+
+  auto pickup_id = pickup_ids.unchecked<1>();
+  auto delivery_id = delivery_ids.unchecked<1>();
+  self.jobs.reserve(self.jobs.size() + 2 * size);
+  for (py::ssize_t i = 0; i < size; i++) {
+    const auto &skill_set = skill_sets[i];
+    auto priority_ = priority_ptr ? priority_ptr[i] : 0;
+    self.add_shipment(
+        vroom::Job(pickup_id(i), vroom::JOB_TYPE::PICKUP,
+                   pickups.location(i, pickup_id(i)),
+                   pickups.setup ? pickups.setup[i] : 0,
+                   pickups.service ? pickups.service[i] : 0, amounts[i],
+                   skill_set, priority_, pickups.tws[i],
+                   pickups.description(i)),
+        vroom::Job(delivery_id(i), vroom::JOB_TYPE::DELIVERY,
+                   deliveries.location(i, delivery_id(i)),
+                   deliveries.setup ? deliveries.setup[i] : 0,
+                   deliveries.service ? deliveries.service[i] : 0, amounts[i],
+                   skill_set, priority_, deliveries.tws[i],
+                   deliveries.description(i)));
+  }
+}
+
+void add_vehicles_from_arrays(
+    vroom::Input &self, const _Array<vroom::Id> &ids,
+    const std::optional<_Array<int64_t>> &start_indices,
+    const std::optional<_Array<double>> &start_coordinates,
+    const std::optional<_Array<int64_t>> &end_indices,
+    const std::optional<_Array<double>> &end_coordinates,
+    const std::optional<std::vector<std::string>> &profiles,
+    const std::optional<_Array<int64_t>> &capacity,
+    const std::optional<_Array<uint64_t>> &skills,
+    const std::optional<_Array<vroom::Skill>> &skill_values,
+    const std::optional<_Array<int64_t>> &skill_offsets,
+    const std::optional<_Array<uint32_t>> &tw_starts,
+    const std::optional<_Array<uint32_t>> &tw_ends,
+    const std::optional<_Array<vroom::UserCost>> &cost_fixed,
+    const std::optional<_Array<vroom::UserCost>> &cost_per_hour,
+    const std::optional<_Array<vroom::UserCost>> &cost_per_km,
+    const std::optional<_Array<double>> &speed_factor,
+    const std::optional<_Array<uint64_t>> &max_tasks,
+    const std::optional<_Array<bool>> &max_tasks_valid,
+    const std::optional<_Array<vroom::UserDuration>> &max_travel_time,
+    const std::optional<_Array<bool>> &max_travel_time_valid,
+    const std::optional<_Array<vroom::UserDistance>> &max_distance,
+    const std::optional<_Array<bool>> &max_distance_valid,
+    const std::optional<std::vector<std::string>> &descriptions) {
+  const py::ssize_t size = ids.size();
+  check_array_shape(ids, "ids", size);
+
+  std::size_t width = 0;
+  if (capacity.has_value())
+    width = capacity.value().ndim() == 2 ? capacity.value().shape(1) : 0;
+
+  auto starts =
+      locations_from_arrays(start_indices, start_coordinates, size, "start");
+  auto ends = locations_from_arrays(end_indices, end_coordinates, size, "end");
+  auto capacities = amounts_from_array(capacity, size, width, "capacity");
+  auto tws = time_windows_from_arrays(tw_starts, tw_ends, std::nullopt, size,
+                                      "time window");
+  auto skill_sets =
+      skills_from_arrays(skills, skill_values, skill_offsets, size);
+
+  auto fixed_ptr = optional_data(cost_fixed, size, "cost_fixed");
+  auto per_hour_ptr = optional_data(cost_per_hour, size, "cost_per_hour");
+  auto per_km_ptr = optional_data(cost_per_km, size, "cost_per_km");
+  auto speed_ptr = optional_data(speed_factor, size, "speed_factor");
+  auto max_tasks_ptr = optional_data(max_tasks, size, "max_tasks");
+  auto travel_ptr = optional_data(max_travel_time, size, "max_travel_time");
+  auto distance_ptr = optional_data(max_distance, size, "max_distance");
+  auto max_tasks_valid_ptr =
+      optional_data(max_tasks_valid, size, "max_tasks_valid");
+  auto travel_valid_ptr =
+      optional_data(max_travel_time_valid, size, "max_travel_time_valid");
+  auto distance_valid_ptr =
+      optional_data(max_distance_valid, size, "max_distance_valid");
+  check_strings_length(profiles, size, "profiles");
+  check_strings_length(descriptions, size, "descriptions");
+
+  auto id = ids.unchecked<1>();
+  self.vehicles.reserve(self.vehicles.size() + size);
+  for (py::ssize_t i = 0; i < size; i++) {
+    self.add_vehicle(vroom::Vehicle(
+        id(i), starts[i], ends[i],
+        profiles.has_value() ? profiles.value()[i] : vroom::DEFAULT_PROFILE,
+        capacities[i], std::move(skill_sets[i]), tws[i][0], std::vector<vroom::Break>(),
+        descriptions.has_value() ? descriptions.value()[i] : "",
+        vroom::VehicleCosts(
+            fixed_ptr ? fixed_ptr[i] : 0,
+            per_hour_ptr ? per_hour_ptr[i] : vroom::DEFAULT_COST_PER_HOUR,
+            per_km_ptr ? per_km_ptr[i] : vroom::DEFAULT_COST_PER_KM),
+        speed_ptr ? speed_ptr[i] : 1.,
+        optional_value(max_tasks_ptr, max_tasks_valid_ptr, i),
+        optional_value(travel_ptr, travel_valid_ptr, i),
+        optional_value(distance_ptr, distance_valid_ptr, i)));
+  }
+}
+
+template <typename T> T *mutable_data(py::array_t<T> &array) {
+  return static_cast<T *>(array.request().ptr);
+}
+
+// Store the skills of each row flat, with `skill_offsets` marking where the
+// skills of each row start.
+template <typename Getter>
+void set_skill_columns(py::dict &columns, std::size_t size, Getter skills_of) {
+  std::vector<vroom::Skill> skills;
+  auto offsets = py::array_t<int64_t>(size + 1);
+  auto offsets_ptr = mutable_data(offsets);
+  offsets_ptr[0] = 0;
+  for (std::size_t i = 0; i < size; i++) {
+    const vroom::Skills &row = skills_of(i);
+    skills.insert(skills.end(), row.begin(), row.end());
+    offsets_ptr[i + 1] = skills.size();
+  }
+  columns["skills"] = py::array_t<vroom::Skill>(skills.size(), skills.data());
+  columns["skill_offsets"] = offsets;
+}
+
+void set_location_columns(py::dict &columns, const std::string &name,
+                          const std::vector<const vroom::Location *> &locs) {
+  const auto size = locs.size();
+  auto index = py::array_t<int64_t>(size);
+  auto lon = py::array_t<double>(size);
+  auto lat = py::array_t<double>(size);
+  auto index_ptr = mutable_data(index);
+  auto lon_ptr = mutable_data(lon);
+  auto lat_ptr = mutable_data(lat);
+  for (std::size_t i = 0; i < size; i++) {
+    const auto *loc = locs[i];
+    index_ptr[i] = (loc && loc->user_index()) ? loc->index() : -1;
+    const bool has_coords = loc && loc->has_coordinates();
+    lon_ptr[i] = has_coords ? loc->lon() : std::nan("");
+    lat_ptr[i] = has_coords ? loc->lat() : std::nan("");
+  }
+  columns[py::str(name + "_index")] = index;
+  columns[py::str(name + "_lon")] = lon;
+  columns[py::str(name + "_lat")] = lat;
+}
+
+template <typename Getter>
+py::array_t<int64_t> amounts_to_array(std::size_t size, std::size_t width,
+                                      Getter amount) {
+  auto array = py::array_t<int64_t>({size, width});
+  auto ptr = mutable_data(array);
+  for (std::size_t i = 0; i < size; i++)
+    for (std::size_t j = 0; j < width; j++)
+      ptr[i * width + j] = amount(i)[j];
+  return array;
+}
+
+py::dict jobs_to_arrays(const vroom::Input &self) {
+  const auto &jobs = self.jobs;
+  const std::size_t size = jobs.size();
+  const std::size_t width = size ? jobs.front().delivery.size() : 0;
+
+  auto id = py::array_t<vroom::Id>(size);
+  auto id_ptr = mutable_data(id);
+  auto type = py::array_t<uint8_t>(size);
+  auto type_ptr = mutable_data(type);
+  auto setup = py::array_t<vroom::UserDuration>(size);
+  auto setup_ptr = mutable_data(setup);
+  auto service = py::array_t<vroom::UserDuration>(size);
+  auto service_ptr = mutable_data(service);
+  auto priority = py::array_t<vroom::Priority>(size);
+  auto priority_ptr = mutable_data(priority);
+  auto tw_offsets = py::array_t<int64_t>(size + 1);
+  py::list description;
+
+  std::vector<const vroom::Location *> locations;
+  std::vector<uint32_t> tw_starts, tw_ends;
+  locations.reserve(size);
+
+  auto offsets_ptr = mutable_data(tw_offsets);
+  offsets_ptr[0] = 0;
+  for (std::size_t i = 0; i < size; i++) {
+    const auto &job = jobs[i];
+    id_ptr[i] = job.id;
+    type_ptr[i] = static_cast<uint8_t>(job.type);
+    setup_ptr[i] = vroom::utils::scale_to_user_duration(job.default_setup);
+    service_ptr[i] =
+        vroom::utils::scale_to_user_duration(job.default_service);
+    priority_ptr[i] = job.priority;
+    locations.push_back(&job.location);
+    for (const auto &tw : job.tws) {
+      if (tw.is_default())
+        continue;
+      tw_starts.push_back(vroom::utils::scale_to_user_duration(tw.start));
+      tw_ends.push_back(vroom::utils::scale_to_user_duration(tw.end));
+    }
+    offsets_ptr[i + 1] = tw_starts.size();
+    description.append(job.description);
+  }
+
+  py::dict columns;
+  columns["id"] = id;
+  columns["type"] = type;
+  set_location_columns(columns, "location", locations);
+  columns["default_setup"] = setup;
+  columns["default_service"] = service;
+  columns["delivery"] = amounts_to_array(
+      size, width, [&](std::size_t i) -> auto & { return jobs[i].delivery; });
+  columns["pickup"] = amounts_to_array(
+      size, width, [&](std::size_t i) -> auto & { return jobs[i].pickup; });
+  set_skill_columns(columns, size, [&](std::size_t i) -> auto & {
+    return jobs[i].skills;
+  });
+  columns["priority"] = priority;
+  columns["tw_starts"] = py::array_t<uint32_t>(tw_starts.size(), tw_starts.data());
+  columns["tw_ends"] = py::array_t<uint32_t>(tw_ends.size(), tw_ends.data());
+  columns["tw_offsets"] = tw_offsets;
+  columns["description"] = description;
+  return columns;
+}
+
+py::dict vehicles_to_arrays(const vroom::Input &self) {
+  const auto &vehicles = self.vehicles;
+  const std::size_t size = vehicles.size();
+  const std::size_t width = size ? vehicles.front().capacity.size() : 0;
+
+  // Unbounded values and default time windows are marked with -1.
+  auto id = py::array_t<vroom::Id>(size);
+  auto id_ptr = mutable_data(id);
+  auto tw_start = py::array_t<int64_t>(size);
+  auto tw_start_ptr = mutable_data(tw_start);
+  auto tw_end = py::array_t<int64_t>(size);
+  auto tw_end_ptr = mutable_data(tw_end);
+  auto cost_fixed = py::array_t<int64_t>(size);
+  auto cost_fixed_ptr = mutable_data(cost_fixed);
+  auto cost_per_hour = py::array_t<int64_t>(size);
+  auto cost_per_hour_ptr = mutable_data(cost_per_hour);
+  auto cost_per_km = py::array_t<int64_t>(size);
+  auto cost_per_km_ptr = mutable_data(cost_per_km);
+  auto max_tasks = py::array_t<int64_t>(size);
+  auto max_tasks_ptr = mutable_data(max_tasks);
+  auto max_travel_time = py::array_t<int64_t>(size);
+  auto max_travel_time_ptr = mutable_data(max_travel_time);
+  auto max_distance = py::array_t<int64_t>(size);
+  auto max_distance_ptr = mutable_data(max_distance);
+  py::list profile, description;
+
+  std::vector<const vroom::Location *> starts, ends;
+  starts.reserve(size);
+  ends.reserve(size);
+
+  for (std::size_t i = 0; i < size; i++) {
+    const auto &vehicle = vehicles[i];
+    id_ptr[i] = vehicle.id;
+    starts.push_back(vehicle.start.has_value() ? &vehicle.start.value()
+                                               : nullptr);
+    ends.push_back(vehicle.end.has_value() ? &vehicle.end.value() : nullptr);
+    const bool default_tw = vehicle.tw.is_default();
+    tw_start_ptr[i] =
+        default_tw ? -1
+                   : static_cast<int64_t>(
+                         vroom::utils::scale_to_user_duration(vehicle.tw.start));
+    tw_end_ptr[i] =
+        default_tw ? -1
+                   : static_cast<int64_t>(
+                         vroom::utils::scale_to_user_duration(vehicle.tw.end));
+    cost_fixed_ptr[i] =
+        vroom::utils::scale_to_user_cost(vehicle.costs.fixed);
+    cost_per_hour_ptr[i] = vehicle.costs.per_hour;
+    cost_per_km_ptr[i] = vehicle.costs.per_km;
+    max_tasks_ptr[i] =
+        vehicle.max_tasks == vroom::DEFAULT_MAX_TASKS ? -1
+                                                   : static_cast<int64_t>(vehicle.max_tasks);
+    max_travel_time_ptr[i] =
+        vehicle.max_travel_time == vroom::DEFAULT_MAX_TRAVEL_TIME
+            ? -1
+            : static_cast<int64_t>(
+                  vroom::utils::scale_to_user_duration(vehicle.max_travel_time));
+    max_distance_ptr[i] =
+        vehicle.max_distance == vroom::DEFAULT_MAX_DISTANCE
+            ? -1
+            : static_cast<int64_t>(vehicle.max_distance);
+    profile.append(vehicle.profile);
+    description.append(vehicle.description);
+  }
+
+  py::dict columns;
+  columns["id"] = id;
+  set_location_columns(columns, "start", starts);
+  set_location_columns(columns, "end", ends);
+  columns["profile"] = profile;
+  columns["capacity"] = amounts_to_array(size, width, [&](std::size_t i) -> auto & {
+    return vehicles[i].capacity;
+  });
+  set_skill_columns(columns, size, [&](std::size_t i) -> auto & {
+    return vehicles[i].skills;
+  });
+  columns["tw_start"] = tw_start;
+  columns["tw_end"] = tw_end;
+  columns["cost_fixed"] = cost_fixed;
+  columns["cost_per_hour"] = cost_per_hour;
+  columns["cost_per_km"] = cost_per_km;
+  columns["max_tasks"] = max_tasks;
+  columns["max_travel_time"] = max_travel_time;
+  columns["max_distance"] = max_distance;
+  columns["description"] = description;
+  return columns;
+}
@@ -0,0 +1,88 @@
+#include <optional>
+#include <string>
+#include <unordered_map>
+#include <unordered_set>
+#include <vector>
+
+#include <pybind11/pybind11.h>
+
+#include "structures/vroom/input/input.h"
+
+#include "bind/private_member.h"
+
+namespace py = pybind11;
+
+// Copies of an input that skip the checks and lookups done while adding
+// jobs and vehicles. The solver owns its matrices by value, so they are
+// copied as flat blocks, and so are jobs and vehicles. What the solver
+// derives from all of them is rebuilt on every solve and left out.
+
+using _Locations = std::vector<vroom::Location>;
+using _LocationRanks = std::unordered_map<vroom::Location, vroom::Index>;
+using _LocationSet = std::unordered_set<vroom::Location>;
+using _IndexSet = std::unordered_set<vroom::Index>;
+using _TypeRanks = std::unordered_map<std::string, vroom::Index,
+                                      vroom::StringHash, std::equal_to<>>;
+
+_INPUT_MEMBER(_NoAdditionYet, bool, _no_addition_yet)
+_INPUT_MEMBER(_HasAllCoordinates, bool, _has_all_coordinates)
+_INPUT_MEMBER(_HasCustomLocationIndex, bool, _has_custom_location_index)
+_INPUT_MEMBER(_AllLocationsHaveCoords, bool, _all_locations_have_coords)
+_INPUT_MEMBER(_InputLocations, _Locations, _locations)
+_INPUT_MEMBER(_LocationsToIndex, _LocationRanks, _locations_to_index)
+_INPUT_MEMBER(_LocationsUsedSeveralTimes, _LocationSet,
+              _locations_used_several_times)
+_INPUT_MEMBER(_MatricesUsedIndex, _IndexSet, _matrices_used_index)
+_INPUT_MEMBER(_MaxMatricesUsedIndex, vroom::Index, _max_matrices_used_index)
+_INPUT_MEMBER(_VehicleTypes, std::vector<std::string>, _vehicle_types)
+_INPUT_MEMBER(_TypeToRank, _TypeRanks, _type_to_rank_in_vehicle_types)
+_INPUT_MEMBER(_AmountSize, std::optional<unsigned>, _amount_size)
+_INPUT_MEMBER(_Zero, vroom::Amount, _zero)
+
+template <typename Tag>
+void copy_member(vroom::Input &target, const vroom::Input &source) {
+  target.*private_member(Tag()) = source.*private_member(Tag());
+}
+
+// Copy the problem of `source` into `target`, a fresh input with the same
+// routing configuration.
+void fork_from(vroom::Input &target, const vroom::Input &source) {
+  py::gil_scoped_release release;
+  // Jobs and vehicles hold const members, so swap rather than assign.
+  std::vector<vroom::Job> jobs(source.jobs);
+  target.jobs.swap(jobs);
+  std::vector<vroom::Vehicle> vehicles(source.vehicles);
+  target.vehicles.swap(vehicles);
+  target.job_id_to_rank = source.job_id_to_rank;
+  target.pickup_id_to_rank = source.pickup_id_to_rank;
+  target.delivery_id_to_rank = source.delivery_id_to_rank;
+
+  copy_member<_DurationsMatrices>(target, source);
+  copy_member<_DistancesMatrices>(target, source);
+  copy_member<_CostsMatrices>(target, source);
+  copy_member<_Geometry>(target, source);
+  copy_member<_HasTW>(target, source);
+  copy_member<_HasSkills>(target, source);
+  copy_member<_HasJobs>(target, source);
+  copy_member<_HasShipments>(target, source);
+  copy_member<_HasInitialRoutes>(target, source);
+  copy_member<_HomogeneousLocations>(target, source);
+  copy_member<_HomogeneousProfiles>(target, source);
+  copy_member<_HomogeneousCosts>(target, source);
+  copy_member<_Profiles>(target, source);
+  copy_member<_ProfilesRequiringDistances>(target, source);
+  copy_member<_MaxCostPerHour>(target, source);
+  copy_member<_NoAdditionYet>(target, source);
+  copy_member<_HasAllCoordinates>(target, source);
+  copy_member<_HasCustomLocationIndex>(target, source);
+  copy_member<_AllLocationsHaveCoords>(target, source);
+  copy_member<_InputLocations>(target, source);
+  copy_member<_LocationsToIndex>(target, source);
+  copy_member<_LocationsUsedSeveralTimes>(target, source);
+  copy_member<_MatricesUsedIndex>(target, source);
+  copy_member<_MaxMatricesUsedIndex>(target, source);
+  copy_member<_VehicleTypes>(target, source);
+  copy_member<_TypeToRank>(target, source);
+  copy_member<_AmountSize>(target, source);
+  copy_member<_Zero>(target, source);
+}
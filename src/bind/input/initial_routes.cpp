@@ -0,0 +1,89 @@
+#include <unordered_map>
+#include <unordered_set>
+#include <vector>
+
+#include "structures/vroom/input/input.h"
+#include "structures/vroom/solution/solution.h"
+
+#include "bind/private_member.h"
+
+// Initial routes for warm starts, given to the solver as vehicle steps.
+
+_INPUT_MEMBER(_HasInitialRoutes, bool, _has_initial_routes)
+
+using _VehicleSteps = std::vector<std::vector<vroom::VehicleStep>>;
+
+_VehicleSteps vehicle_steps(const vroom::Input &input) {
+  _VehicleSteps steps;
+  steps.reserve(input.vehicles.size());
+  for (const auto &vehicle : input.vehicles)
+    steps.push_back(vehicle.steps);
+  return steps;
+}
+
+void set_vehicle_steps(vroom::Input &input, const _VehicleSteps &steps) {
+  if (steps.size() != input.vehicles.size())
+    throw std::runtime_error("Expected steps for every vehicle.");
+  bool has_steps = false;
+  for (std::size_t v = 0; v < steps.size(); v++) {
+    // Steps hold a const id, so swap rather than assign.
+    std::vector<vroom::VehicleStep> copy(steps[v]);
+    input.vehicles[v].steps.swap(copy);
+    has_steps = has_steps || !steps[v].empty();
+  }
+  input.*private_member(_HasInitialRoutes()) = has_steps;
+}
+
+// Vehicle steps following the routes of a previous solution. Routes of
+// vehicles that are gone are dropped, and so are jobs that are gone, along
+// with shipments that lost their pickup or delivery.
+_VehicleSteps initial_routes(const vroom::Input &input,
+                             const vroom::Solution &solution) {
+  std::unordered_map<vroom::Id, vroom::Index> vehicle_id_to_rank;
+  for (vroom::Index v = 0; v < input.vehicles.size(); v++)
+    vehicle_id_to_rank.emplace(input.vehicles[v].id, v);
+
+  _VehicleSteps steps(input.vehicles.size());
+  std::unordered_set<vroom::Index> assigned;
+  for (const auto &route : solution.routes) {
+    const auto vehicle = vehicle_id_to_rank.find(route.vehicle);
+    if (vehicle == vehicle_id_to_rank.end())
+      continue;
+
+    // Ranks of the tasks of this route that still exist.
+    std::vector<std::pair<vroom::JOB_TYPE, vroom::Index>> tasks;
+    std::unordered_set<vroom::Index> ranks;
+    for (const auto &step : route.steps) {
+      if (step.step_type != vroom::STEP_TYPE::JOB)
+        continue;
+      const auto job_type = step.job_type.value();
+      const auto &id_to_rank =
+          job_type == vroom::JOB_TYPE::SINGLE   ? input.job_id_to_rank
+          : job_type == vroom::JOB_TYPE::PICKUP ? input.pickup_id_to_rank
+                                                : input.delivery_id_to_rank;
+      const auto rank = id_to_rank.find(step.id);
+      if (rank == id_to_rank.end() || assigned.contains(rank->second))
+        continue;
+      tasks.emplace_back(job_type, rank->second);
+      ranks.insert(rank->second);
+    }
+
+    auto &vehicle_steps = steps[vehicle->second];
+    std::unordered_set<vroom::Index> picked_up;
+    for (const auto &[job_type, rank] : tasks) {
+      // Shipments are stored as a pickup directly followed by its delivery.
+      if (job_type == vroom::JOB_TYPE::PICKUP) {
+        if (!ranks.contains(rank + 1))
+          continue;
+        picked_up.insert(rank);
+      } else if (job_type == vroom::JOB_TYPE::DELIVERY &&
+                 !picked_up.contains(rank - 1)) {
+        continue;
+      }
+      assigned.insert(rank);
+      vehicle_steps.emplace_back(job_type, input.jobs[rank].id,
+                                 vroom::ForcedService());
+    }
+  }
+  return steps;
+}
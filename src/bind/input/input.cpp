@@ -1,5 +1,6 @@
 #include <fstream>
 #include <map>
+#include <memory>
 
 #include <pybind11/operators.h>
 #include <pybind11/chrono.h>
@@ -8,8 +9,56 @@
 #include "structures/vroom/input/input.cpp"
 #include "utils/input_parser.cpp"
 
+#include "bind/input/arrays.cpp"
+#include "bind/input/initial_routes.cpp"
+#include "bind/input/mutation.cpp"
+#include "bind/input/json.cpp"
+#include "bind/input/state.cpp"
+#include "bind/input/fork.cpp"
+
 namespace py = pybind11;
 
+// Solving and checking release the GIL, so that other Python threads keep
+// running meanwhile. Among them are the routing proxies, which the native
+// routing wrappers may be waiting on.
+//
+// Their solutions are handed over in an opaque capsule, which Python code
+// cannot take views of, so that `Solution` may move out of it.
+
+constexpr const char *_NATIVE_SOLUTION = "vroom._NativeSolution";
+
+template <typename Function>
+py::capsule native_solution(vroom::Input &input, Function &&function) {
+  std::unique_ptr<vroom::Solution> solution;
+  {
+    py::gil_scoped_release release;
+    _MaxTasksGuard guard(input);
+    solution = std::make_unique<vroom::Solution>(function());
+  }
+  return py::capsule(solution.release(), _NATIVE_SOLUTION, [](void *pointer) {
+    delete static_cast<vroom::Solution *>(pointer);
+  });
+}
+
+py::capsule solve_input(vroom::Input &input, unsigned exploration_level,
+                        unsigned nb_threads, const vroom::Timeout &timeout) {
+  return native_solution(input, [&] {
+    return input.solve(exploration_level, nb_threads, timeout);
+  });
+}
+
+py::capsule solve_input_searches(vroom::Input &input, unsigned nb_searches,
+                                 unsigned depth, unsigned nb_threads,
+                                 const vroom::Timeout &timeout) {
+  return native_solution(input, [&] {
+    return input.solve(nb_searches, depth, nb_threads, timeout);
+  });
+}
+
+py::capsule check_input(vroom::Input &input, unsigned nb_thread) {
+  return native_solution(input, [&] { return input.check(nb_thread); });
+}
+
 void init_input(py::module_ &m) {
 
   py::class_<vroom::Input>(m, "Input")
@@ -27,27 +76,93 @@ void init_input(py::module_ &m) {
       .def_readonly("pickup_id_to_rank", &vroom::Input::pickup_id_to_rank)
       .def_readonly("delivery_id_to_rank", &vroom::Input::delivery_id_to_rank)
       .def_readonly("compatible_vehicles_for_job", &vroom::Input::compatible_vehicles_for_job)
-      .def("_from_json", &vroom::io::parse, py::arg("json_string"),
+      .def("_from_json", &from_json_buffer, py::arg("json"),
            py::arg("geometry"))
+      .def("_from_json_file", &from_json_file, py::arg("path"),
+           py::arg("geometry"))
+      .def("_from_json_stream", &from_json_stream, py::arg("stream"),
+           py::arg("geometry"), py::arg("chunk_size") = 1 << 20)
+      .def("_from_dict", &from_dict, py::arg("problem"), py::arg("geometry"))
       .def("_set_geometry", &vroom::Input::set_geometry)
+      .def("_vehicle_steps", &vehicle_steps)
+      .def("_set_vehicle_steps", &set_vehicle_steps, py::arg("steps"))
+      .def("_initial_routes", &initial_routes, py::arg("solution"))
       .def("_add_job", &vroom::Input::add_job)
       .def("_add_shipment", &vroom::Input::add_shipment)
       .def("_add_vehicle", &vroom::Input::add_vehicle)
+      .def("_fork_from", &fork_from, py::arg("source"))
+      .def("_remove_job", &remove_job, py::arg("id"))
+      .def("_remove_shipment", &remove_shipment, py::arg("pickup_id"))
+      .def("_update_job", &update_job, py::arg("id"), py::arg("job"))
+      .def("_remove_vehicle", &remove_vehicle, py::arg("id"))
+      .def("_update_vehicle", &update_vehicle, py::arg("id"),
+           py::arg("vehicle"))
+      .def("_add_jobs_from_arrays", &add_jobs_from_arrays, py::arg("ids"),
+           py::arg("location_indices"), py::arg("coordinates"),
+           py::arg("default_setup"), py::arg("default_service"),
+           py::arg("delivery"), py::arg("pickup"), py::arg("skills"),
+           py::arg("skill_values"), py::arg("skill_offsets"),
+           py::arg("priority"), py::arg("tw_starts"), py::arg("tw_ends"),
+           py::arg("tw_offsets"), py::arg("descriptions"))
+      .def("_add_shipments_from_arrays", &add_shipments_from_arrays,
+           py::arg("pickup_ids"), py::arg("pickup_location_indices"),
+           py::arg("pickup_coordinates"), py::arg("pickup_default_setup"),
+           py::arg("pickup_default_service"), py::arg("pickup_tw_starts"),
+           py::arg("pickup_tw_ends"), py::arg("pickup_tw_offsets"),
+           py::arg("pickup_descriptions"), py::arg("delivery_ids"),
+           py::arg("delivery_location_indices"),
+           py::arg("delivery_coordinates"), py::arg("delivery_default_setup"),
+           py::arg("delivery_default_service"), py::arg("delivery_tw_starts"),
+           py::arg("delivery_tw_ends"), py::arg("delivery_tw_offsets"),
+           py::arg("delivery_descriptions"), py::arg("amount"),
+           py::arg("skills"), py::arg("skill_values"),
+           py::arg("skill_offsets"), py::arg("priority"))
+      .def("_add_vehicles_from_arrays", &add_vehicles_from_arrays,
+           py::arg("ids"), py::arg("start_indices"),
+           py::arg("start_coordinates"), py::arg("end_indices"),
+           py::arg("end_coordinates"), py::arg("profiles"),
+           py::arg("capacity"), py::arg("skills"), py::arg("skill_values"),
+           py::arg("skill_offsets"), py::arg("tw_starts"),
+           py::arg("tw_ends"), py::arg("cost_fixed"), py::arg("cost_per_hour"),
+           py::arg("cost_per_km"), py::arg("speed_factor"),
+           py::arg("max_tasks"), py::arg("max_tasks_valid"),
+           py::arg("max_travel_time"), py::arg("max_travel_time_valid"),
+           py::arg("max_distance"), py::arg("max_distance_valid"),
+           py::arg("descriptions"))
+      .def("_jobs_columns", &jobs_to_arrays)
+      .def("_vehicles_columns", &vehicles_to_arrays)
+      .def("_state", &input_state)
+      .def("_load_state", &load_state, py::arg("state"))
       .def("_set_durations_matrix",
            [](vroom::Input &self, const std::string &profile,
               vroom::Matrix<vroom::UserDuration> &m) {
              self.set_durations_matrix(profile, std::move(m));
            })
+      .def("_set_durations_matrix",
+           [](vroom::Input &self, const std::string &profile,
+              const py::array &array) {
+             self.set_durations_matrix(profile, matrix_from_array(array));
+           })
       .def("_set_distances_matrix",
            [](vroom::Input &self, const std::string &profile,
               vroom::Matrix<vroom::UserDistance> &m) {
              self.set_distances_matrix(profile, std::move(m));
            })
+      .def("_set_distances_matrix",
+           [](vroom::Input &self, const std::string &profile,
+              const py::array &array) {
+             self.set_distances_matrix(profile, matrix_from_array(array));
+           })
       .def("_set_costs_matrix",
            [](vroom::Input &self, const std::string &profile,
               vroom::Matrix<vroom::UserCost> &m) {
              self.set_costs_matrix(profile, std::move(m));
            })
+      .def("_set_costs_matrix",
+           [](vroom::Input &self, const std::string &profile,
+              const py::array &array) {
+             self.set_costs_matrix(profile, matrix_from_array(array));
+           })
       .def("zero_amount", &vroom::Input::zero_amount)
       .def("apply_TSPFix", &vroom::Input::apply_TSPFix)
       .def("is_used_several_times", &vroom::Input::is_used_several_times)
@@ -65,19 +180,12 @@ void init_input(py::module_ &m) {
       .def("has_initial_routes", &vroom::Input::has_initial_routes)
       .def("vehicle_ok_with_job", &vroom::Input::has_initial_routes)
       .def("vehicle_ok_with_vehicle", &vroom::Input::has_initial_routes)
-      .def("_solve",
-          [](vroom::Input &self, unsigned exploration_level, unsigned nb_threads, const vroom::Timeout& timeout) {
-            return self.solve(exploration_level, nb_threads, timeout);
-          },
-          "Solve routing problem",
-          py::arg("exploration_level"), py::arg("nb_threads"), py::arg("timeout")
-          )
-      .def("_solve",
-          [](vroom::Input &self, unsigned nb_searches, unsigned depth, unsigned nb_threads, const vroom::Timeout& timeout) {
-            return self.solve(nb_searches, depth, nb_threads, timeout);
-          },
-          "Solve routing problem",
-          py::arg("nb_searches"), py::arg("depth"), py::arg("nb_threads"), py::arg("timeout")
-          )
-      .def("_check", &vroom::Input::check, "Check solution feasibility", py::arg("nb_thread") = 1);
+      .def("_solve", &solve_input, "Solve routing problem",
+           py::arg("exploration_level"), py::arg("nb_threads"),
+           py::arg("timeout"))
+      .def("_solve", &solve_input_searches, "Solve routing problem",
+           py::arg("nb_searches"), py::arg("depth"), py::arg("nb_threads"),
+           py::arg("timeout"))
+      .def("_check", &check_input, "Check solution feasibility",
+           py::arg("nb_thread") = 1);
 }
@@ -0,0 +1,149 @@
+#include <cerrno>
+#include <cstdio>
+#include <string>
+
+#include <pybind11/pybind11.h>
+
+#include "rapidjson/include/rapidjson/writer.h"
+
+#include "structures/vroom/input/input.h"
+#include "utils/input_parser.h"
+
+namespace py = pybind11;
+
+// JSON ingestion straight into the native parser, without going through a
+// Python string, and with the GIL released while parsing.
+
+void parse_released(vroom::Input &self, const std::string &json,
+                    bool geometry) {
+  py::gil_scoped_release release;
+  vroom::io::parse(self, json, geometry);
+}
+
+void from_json_buffer(vroom::Input &self, const py::buffer &buffer,
+                      bool geometry) {
+  const py::buffer_info info = buffer.request();
+  const auto *data = static_cast<const char *>(info.ptr);
+  const std::size_t size = info.size * info.itemsize;
+  std::string json;
+  {
+    py::gil_scoped_release release;
+    json.assign(data, size);
+  }
+  parse_released(self, json, geometry);
+}
+
+void from_json_file(vroom::Input &self, const py::object &path,
+                    bool geometry) {
+  const std::string name = py::str(path);
+  std::FILE *file = std::fopen(name.c_str(), "rb");
+  if (file == nullptr) {
+    PyErr_SetFromErrnoWithFilenameObject(PyExc_OSError, path.ptr());
+    throw py::error_already_set();
+  }
+  std::string json;
+  bool failed;
+  {
+    py::gil_scoped_release release;
+    char chunk[1 << 16];
+    std::size_t count;
+    if (std::fseek(file, 0, SEEK_END) == 0) {
+      const long size = std::ftell(file);
+      if (size > 0)
+        json.reserve(size);
+      std::rewind(file);
+    }
+    while ((count = std::fread(chunk, 1, sizeof(chunk), file)) > 0)
+      json.append(chunk, count);
+    failed = std::ferror(file);
+    std::fclose(file);
+  }
+  if (failed) {
+    PyErr_SetFromErrnoWithFilenameObject(PyExc_OSError, path.ptr());
+    throw py::error_already_set();
+  }
+  parse_released(self, json, geometry);
+}
+
+void from_json_stream(vroom::Input &self, const py::object &stream,
+                      bool geometry, std::size_t chunk_size = 1 << 20) {
+  const py::object read = stream.attr("read");
+  std::string json;
+  while (true) {
+    const py::object chunk = read(chunk_size);
+    if (py::isinstance<py::str>(chunk)) {
+      const auto text = chunk.cast<std::string_view>();
+      if (text.empty())
+        break;
+      json.append(text);
+    } else {
+      const py::buffer_info info = chunk.cast<py::buffer>().request();
+      if (info.size == 0)
+        break;
+      json.append(static_cast<const char *>(info.ptr),
+                  info.size * info.itemsize);
+    }
+  }
+  parse_released(self, json, geometry);
+}
+
+struct _StringStream {
+  using Ch = char;
+  std::string &out;
+  void Put(char c) { out.push_back(c); }
+  void Flush() {}
+};
+
+void write_json(rapidjson::Writer<_StringStream> &writer,
+                const py::handle &value) {
+  if (value.is_none()) {
+    writer.Null();
+  } else if (py::isinstance<py::bool_>(value)) {
+    writer.Bool(value.cast<bool>());
+  } else if (py::isinstance<py::int_>(value)) {
+    const auto number = value.cast<py::int_>();
+    if (number < py::int_(0))
+      writer.Int64(number.cast<int64_t>());
+    else
+      writer.Uint64(number.cast<uint64_t>());
+  } else if (py::isinstance<py::float_>(value)) {
+    writer.Double(value.cast<double>());
+  } else if (py::isinstance<py::str>(value)) {
+    const auto text = value.cast<std::string_view>();
+    writer.String(text.data(), text.size());
+  } else if (py::isinstance<py::dict>(value)) {
+    writer.StartObject();
+    for (const auto [key, item] : value.cast<py::dict>()) {
+      const std::string name = py::str(key);
+      writer.Key(name.data(), name.size());
+      write_json(writer, item);
+    }
+    writer.EndObject();
+  } else if (py::isinstance<py::list>(value) ||
+             py::isinstance<py::tuple>(value) ||
+             py::isinstance<py::set>(value)) {
+    writer.StartArray();
+    for (const auto item : value)
+      write_json(writer, item);
+    writer.EndArray();
+  } else if (py::hasattr(value, "tolist")) {
+    // Numpy arrays and scalars.
+    write_json(writer, value.attr("tolist")());
+  } else if (py::hasattr(value, "__index__")) {
+    write_json(writer, py::reinterpret_steal<py::object>(
+                           PyNumber_Index(value.ptr())));
+  } else {
+    throw py::type_error("Object of type " +
+                         py::str(py::type::handle_of(value).attr("__name__"))
+                             .cast<std::string>() +
+                         " is not JSON serializable");
+  }
+}
+
+void from_dict(vroom::Input &self, const py::dict &problem, bool geometry) {
+  std::string json;
+  _StringStream stream{json};
+  rapidjson::Writer<_StringStream> writer(stream);
+  write_json(writer, problem);
+  parse_released(self, json, geometry);
+}
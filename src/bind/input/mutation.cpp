@@ -0,0 +1,204 @@
+#include <algorithm>
+#include <format>
+#include <string>
+#include <unordered_map>
+#include <unordered_set>
+#include <vector>
+
+#include "structures/vroom/input/input.h"
+
+#include "bind/private_member.h"
+
+// Removing and replacing jobs and vehicles in place. Jobs and vehicles
+// have const members, so the vectors are rebuilt around the change rather
+// than assigned to, and the flags derived from them are recomputed. The
+// matrices and the registered locations are left as they are, and the
+// compatibility caches are filled anew on every solve.
+
+using _StringSet =
+    std::unordered_set<std::string, vroom::StringHash, std::equal_to<>>;
+using _CostMap = std::unordered_map<std::string, vroom::Cost,
+                                    vroom::StringHash, std::equal_to<>>;
+using _CheckJobMethod = void(vroom::Job &);
+
+_INPUT_MEMBER(_HasTW, bool, _has_TW)
+_INPUT_MEMBER(_HasSkills, bool, _has_skills)
+_INPUT_MEMBER(_HasJobs, bool, _has_jobs)
+_INPUT_MEMBER(_HasShipments, bool, _has_shipments)
+_INPUT_MEMBER(_HomogeneousLocations, bool, _homogeneous_locations)
+_INPUT_MEMBER(_HomogeneousProfiles, bool, _homogeneous_profiles)
+_INPUT_MEMBER(_HomogeneousCosts, bool, _homogeneous_costs)
+_INPUT_MEMBER(_Profiles, _StringSet, _profiles)
+_INPUT_MEMBER(_ProfilesRequiringDistances, _StringSet,
+              _profiles_requiring_distances)
+_INPUT_MEMBER(_MaxCostPerHour, _CostMap, _max_cost_per_hour)
+_INPUT_MEMBER(_CheckJob, _CheckJobMethod, check_job)
+
+// Solving lowers the max_tasks of vehicles to what the current jobs allow.
+// Restore the given values afterwards, so that later edits are solved
+// against the vehicles as they were added.
+class _MaxTasksGuard {
+public:
+  explicit _MaxTasksGuard(vroom::Input &input) : input(input) {
+    max_tasks.reserve(input.vehicles.size());
+    for (const auto &vehicle : input.vehicles)
+      max_tasks.push_back(vehicle.max_tasks);
+  }
+
+  ~_MaxTasksGuard() {
+    for (std::size_t v = 0; v < max_tasks.size(); v++)
+      input.vehicles[v].max_tasks = max_tasks[v];
+  }
+
+private:
+  vroom::Input &input;
+  std::vector<std::size_t> max_tasks;
+};
+
+template <typename T>
+std::vector<T> replaced(const std::vector<T> &items, std::size_t first,
+                        std::size_t count, const std::vector<T> &insert = {}) {
+  std::vector<T> result;
+  result.reserve(items.size() - count + insert.size());
+  // Ranged insertion would need assignable items.
+  for (std::size_t i = 0; i < first; i++)
+    result.push_back(items[i]);
+  for (const auto &item : insert)
+    result.push_back(item);
+  for (std::size_t i = first + count; i < items.size(); i++)
+    result.push_back(items[i]);
+  return result;
+}
+
+void refresh_jobs(vroom::Input &input) {
+  input.job_id_to_rank.clear();
+  input.pickup_id_to_rank.clear();
+  input.delivery_id_to_rank.clear();
+  input.compatible_vehicles_for_job.clear();
+  bool has_tw = false, has_skills = false, has_jobs = false,
+       has_shipments = false;
+  for (vroom::Index rank = 0; rank < input.jobs.size(); rank++) {
+    const auto &job = input.jobs[rank];
+    switch (job.type) {
+    case vroom::JOB_TYPE::SINGLE:
+      input.job_id_to_rank[job.id] = rank;
+      has_jobs = true;
+      break;
+    case vroom::JOB_TYPE::PICKUP:
+      input.pickup_id_to_rank[job.id] = rank;
+      has_shipments = true;
+      break;
+    case vroom::JOB_TYPE::DELIVERY:
+      input.delivery_id_to_rank[job.id] = rank;
+      break;
+    }
+    has_tw = has_tw || job.tws.size() != 1 || !job.tws[0].is_default();
+    has_skills = has_skills || !job.skills.empty();
+  }
+  for (const auto &vehicle : input.vehicles) {
+    has_tw = has_tw || !vehicle.tw.is_default() || !vehicle.breaks.empty();
+    has_skills = has_skills || !vehicle.skills.empty();
+  }
+  input.*private_member(_HasTW()) = has_tw;
+  input.*private_member(_HasSkills()) = has_skills;
+  input.*private_member(_HasJobs()) = has_jobs;
+  input.*private_member(_HasShipments()) = has_shipments;
+}
+
+void refresh_vehicles(vroom::Input &input) {
+  bool locations = true, profiles = true, costs = true, steps = false;
+  auto &all_profiles = input.*private_member(_Profiles());
+  auto &distance_profiles = input.*private_member(_ProfilesRequiringDistances());
+  auto &max_cost_per_hour = input.*private_member(_MaxCostPerHour());
+  all_profiles.clear();
+  distance_profiles.clear();
+  max_cost_per_hour.clear();
+  for (const auto &vehicle : input.vehicles) {
+    const auto &first = input.vehicles.front();
+    locations = locations && first.has_same_locations(vehicle);
+    profiles = profiles && first.has_same_profile(vehicle);
+    costs = costs && first.costs == vehicle.costs;
+    steps = steps || !vehicle.steps.empty();
+    all_profiles.insert(vehicle.profile);
+    if (vehicle.costs.per_km != 0)
+      distance_profiles.insert(vehicle.profile);
+    auto [search, inserted] =
+        max_cost_per_hour.try_emplace(vehicle.profile, vehicle.costs.per_hour);
+    if (!inserted)
+      search->second = std::max(search->second, vehicle.costs.per_hour);
+  }
+  input.*private_member(_HomogeneousLocations()) = locations;
+  input.*private_member(_HomogeneousProfiles()) = profiles;
+  input.*private_member(_HomogeneousCosts()) = costs;
+  input.*private_member(_HasInitialRoutes()) = steps;
+  // Flags shared by jobs and vehicles.
+  refresh_jobs(input);
+}
+
+vroom::Index job_rank(const std::unordered_map<vroom::Id, vroom::Index> &ranks,
+                      vroom::Id id, const char *kind) {
+  const auto search = ranks.find(id);
+  if (search == ranks.end())
+    throw vroom::InputException(std::format("Unknown {} id: {}.", kind, id));
+  return search->second;
+}
+
+vroom::Index vehicle_rank(const vroom::Input &input, vroom::Id id) {
+  const auto search =
+      std::ranges::find_if(input.vehicles, [id](const vroom::Vehicle &vehicle) {
+        return vehicle.id == id;
+      });
+  if (search == input.vehicles.end())
+    throw vroom::InputException(std::format("Unknown vehicle id: {}.", id));
+  return search - input.vehicles.begin();
+}
+
+void remove_job(vroom::Input &input, vroom::Id id) {
+  const auto rank = job_rank(input.job_id_to_rank, id, "job");
+  input.jobs = replaced(input.jobs, rank, 1);
+  refresh_jobs(input);
+}
+
+void remove_shipment(vroom::Input &input, vroom::Id pickup_id) {
+  // Shipments are stored as a pickup directly followed by its delivery.
+  const auto rank =
+      job_rank(input.pickup_id_to_rank, pickup_id, "pickup");
+  input.jobs = replaced(input.jobs, rank, 2);
+  refresh_jobs(input);
+}
+
+void update_job(vroom::Input &input, vroom::Id id, const vroom::Job &job) {
+  const auto rank = job_rank(input.job_id_to_rank, id, "job");
+  if (job.type != vroom::JOB_TYPE::SINGLE)
+    throw vroom::InputException("Wrong job type.");
+  if (job.id != id && input.job_id_to_rank.contains(job.id))
+    throw vroom::InputException(std::format("Duplicate job id: {}.", job.id));
+  std::vector<vroom::Job> update{job};
+  (input.*private_member(_CheckJob()))(update.front());
+  input.jobs = replaced(input.jobs, rank, 1, update);
+  refresh_jobs(input);
+}
+
+void remove_vehicle(vroom::Input &input, vroom::Id id) {
+  const auto rank = vehicle_rank(input, id);
+  input.vehicles = replaced(input.vehicles, rank, 1);
+  refresh_vehicles(input);
+}
+
+void update_vehicle(vroom::Input &input, vroom::Id id,
+                    const vroom::Vehicle &vehicle) {
+  const auto rank = vehicle_rank(input, id);
+  // Resolve locations and vehicle type the same way as new vehicles.
+  try {
+    input.add_vehicle(vehicle);
+  } catch (...) {
+    // The vehicle is appended before being checked.
+    input.vehicles.pop_back();
+    refresh_vehicles(input);
+    throw;
+  }
+  std::vector<vroom::Vehicle> update{input.vehicles.back()};
+  input.vehicles.pop_back();
+  input.vehicles = replaced(input.vehicles, rank, 1, update);
+  refresh_vehicles(input);
+}
@@ -0,0 +1,311 @@
+#include <optional>
+#include <string>
+#include <unordered_map>
+#include <vector>
+
+#include <pybind11/numpy.h>
+#include <pybind11/pybind11.h>
+
+#include "structures/vroom/input/input.h"
+
+#include "bind/private_member.h"
+
+namespace py = pybind11;
+
+// Pickled state of an input: jobs and vehicles as fixed-width columns with
+// their variable-length fields packed in a byte column, and matrices as
+// views on the solver storage.
+
+using _MatrixMap = std::unordered_map<std::string, vroom::Matrix<uint32_t>,
+                                      vroom::StringHash, std::equal_to<>>;
+
+_INPUT_MEMBER(_DurationsMatrices, _MatrixMap, _durations_matrices)
+_INPUT_MEMBER(_DistancesMatrices, _MatrixMap, _distances_matrices)
+_INPUT_MEMBER(_CostsMatrices, _MatrixMap, _costs_matrices)
+_INPUT_MEMBER(_Geometry, bool, _geometry)
+
+// Location flags in the state columns.
+constexpr uint8_t _HAS_LOCATION = 1;
+constexpr uint8_t _USER_INDEX = 2;
+constexpr uint8_t _HAS_COORDINATES = 4;
+
+struct _LocationState {
+  py::array_t<vroom::Index> index;
+  py::array_t<uint8_t> flags;
+  py::array_t<double> lon;
+  py::array_t<double> lat;
+
+  explicit _LocationState(std::size_t size)
+      : index(size), flags(size), lon(size), lat(size) {}
+
+  void set(std::size_t i, const std::optional<vroom::Location> &location) {
+    mutable_data(index)[i] = location ? location->index() : 0;
+    mutable_data(flags)[i] =
+        location ? _HAS_LOCATION | (location->user_index() ? _USER_INDEX : 0) |
+                       (location->has_coordinates() ? _HAS_COORDINATES : 0)
+                 : 0;
+    mutable_data(lon)[i] = location && location->has_coordinates()
+                               ? location->lon()
+                               : std::nan("");
+    mutable_data(lat)[i] = location && location->has_coordinates()
+                               ? location->lat()
+                               : std::nan("");
+  }
+
+  void store(py::dict &state, const std::string &name) const {
+    state[py::str(name + "_index")] = index;
+    state[py::str(name + "_flags")] = flags;
+    state[py::str(name + "_lon")] = lon;
+    state[py::str(name + "_lat")] = lat;
+  }
+};
+
+// Typed read access to the columns of a state.
+class _StateColumns {
+public:
+  explicit _StateColumns(const py::dict &state) : state(state) {}
+
+  template <typename T> const T *column(const std::string &name) {
+    auto array = state[py::str(name)].cast<_Array<T>>();
+    keep.push_back(array);
+    return array.data();
+  }
+
+  std::size_t size(const std::string &name) const {
+    return py::len(state[py::str(name)]);
+  }
+
+  std::string_view bytes(const std::string &name) {
+    const auto array = state[py::str(name)].cast<_Array<uint8_t>>();
+    keep.push_back(array);
+    return std::string_view(reinterpret_cast<const char *>(array.data()),
+                            array.size());
+  }
+
+  std::vector<std::optional<vroom::Location>>
+  locations(const std::string &name, std::size_t size) {
+    const auto *index = column<vroom::Index>(name + "_index");
+    const auto *flags = column<uint8_t>(name + "_flags");
+    const auto *lon = column<double>(name + "_lon");
+    const auto *lat = column<double>(name + "_lat");
+    std::vector<std::optional<vroom::Location>> locations(size);
+    for (std::size_t i = 0; i < size; i++) {
+      if (!(flags[i] & _HAS_LOCATION))
+        continue;
+      if (!(flags[i] & _HAS_COORDINATES))
+        locations[i] = vroom::Location(index[i]);
+      else if (flags[i] & _USER_INDEX)
+        locations[i] = vroom::Location(index[i], {lon[i], lat[i]});
+      else
+        locations[i] = vroom::Location(vroom::Coordinates({lon[i], lat[i]}));
+    }
+    return locations;
+  }
+
+  std::vector<vroom::Amount> amounts(const std::string &name,
+                                     std::size_t size) {
+    const auto array = state[py::str(name)].cast<_Array<int64_t>>();
+    keep.push_back(array);
+    check_array_shape(array, name, size, 2);
+    const std::size_t width = array.shape(1);
+    std::vector<vroom::Amount> amounts(size, vroom::Amount(width));
+    for (std::size_t i = 0; i < size; i++)
+      for (std::size_t j = 0; j < width; j++)
+        amounts[i][j] = array.data()[i * width + j];
+    return amounts;
+  }
+
+private:
+  const py::dict &state;
+  std::vector<py::array> keep;
+};
+
+py::array_t<uint8_t> bytes_column(const std::string &buffer) {
+  return py::array_t<uint8_t>(
+      buffer.size(), reinterpret_cast<const uint8_t *>(buffer.data()));
+}
+
+py::dict jobs_state(const vroom::Input &self) {
+  const auto &jobs = self.jobs;
+  const std::size_t size = jobs.size();
+  const std::size_t width = size ? jobs.front().delivery.size() : 0;
+
+  auto id = py::array_t<vroom::Id>(size);
+  auto type = py::array_t<uint8_t>(size);
+  auto setup = py::array_t<vroom::UserDuration>(size);
+  auto service = py::array_t<vroom::UserDuration>(size);
+  auto priority = py::array_t<vroom::Priority>(size);
+  _LocationState location(size);
+  _StateWriter extras;
+
+  for (std::size_t i = 0; i < size; i++) {
+    const auto &job = jobs[i];
+    mutable_data(id)[i] = job.id;
+    mutable_data(type)[i] = static_cast<uint8_t>(job.type);
+    mutable_data(setup)[i] =
+        vroom::utils::scale_to_user_duration(job.default_setup);
+    mutable_data(service)[i] =
+        vroom::utils::scale_to_user_duration(job.default_service);
+    mutable_data(priority)[i] = job.priority;
+    location.set(i, job.location);
+    extras.job_extras(job);
+  }
+
+  py::dict state;
+  state["id"] = id;
+  state["type"] = type;
+  location.store(state, "location");
+  state["default_setup"] = setup;
+  state["default_service"] = service;
+  state["delivery"] = amounts_to_array(
+      size, width, [&](std::size_t i) -> auto & { return jobs[i].delivery; });
+  state["pickup"] = amounts_to_array(
+      size, width, [&](std::size_t i) -> auto & { return jobs[i].pickup; });
+  state["priority"] = priority;
+  state["extras"] = bytes_column(extras.buffer);
+  return state;
+}
+
+py::dict vehicles_state(const vroom::Input &self) {
+  const auto &vehicles = self.vehicles;
+  const std::size_t size = vehicles.size();
+  const std::size_t width = size ? vehicles.front().capacity.size() : 0;
+
+  auto id = py::array_t<vroom::Id>(size);
+  auto costs = py::array_t<vroom::UserCost>({size, std::size_t(4)});
+  auto speed = py::array_t<double>(size);
+  auto max_tasks = py::array_t<uint64_t>(size);
+  auto travel_time = py::array_t<int64_t>(size);
+  auto distance = py::array_t<int64_t>(size);
+  _LocationState start(size), end(size);
+  _StateWriter extras;
+
+  for (std::size_t i = 0; i < size; i++) {
+    const auto &vehicle = vehicles[i];
+    mutable_data(id)[i] = vehicle.id;
+    start.set(i, vehicle.start);
+    end.set(i, vehicle.end);
+    auto cost = mutable_data(costs) + 4 * i;
+    cost[0] = vroom::utils::scale_to_user_cost(vehicle.costs.fixed);
+    cost[1] = vehicle.costs.per_hour;
+    cost[2] = vehicle.costs.per_km;
+    cost[3] = vehicle.costs.per_task_hour;
+    mutable_data(speed)[i] = speed_factor(vehicle);
+    mutable_data(max_tasks)[i] = vehicle.max_tasks;
+    mutable_data(travel_time)[i] = max_travel_time(vehicle);
+    mutable_data(distance)[i] = max_distance(vehicle);
+    extras.vehicle_extras(vehicle);
+  }
+
+  py::dict state;
+  state["id"] = id;
+  start.store(state, "start");
+  end.store(state, "end");
+  state["capacity"] = amounts_to_array(size, width, [&](std::size_t i) -> auto & {
+    return vehicles[i].capacity;
+  });
+  state["costs"] = costs;
+  state["speed_factor"] = speed;
+  state["max_tasks"] = max_tasks;
+  state["max_travel_time"] = travel_time;
+  state["max_distance"] = distance;
+  state["extras"] = bytes_column(extras.buffer);
+  return state;
+}
+
+// Views on the matrices held by `self`, keeping it alive.
+py::dict matrices_state(py::object self) {
+  auto &input = self.cast<vroom::Input &>();
+  py::dict state;
+  for (const auto &[kind, matrices] :
+       {std::pair{"durations", &(input.*private_member(_DurationsMatrices()))},
+        std::pair{"distances", &(input.*private_member(_DistancesMatrices()))},
+        std::pair{"costs", &(input.*private_member(_CostsMatrices()))}}) {
+    py::dict views;
+    for (auto &[profile, matrix] : *matrices) {
+      if (matrix.size() == 0)
+        continue;
+      views[py::str(profile)] = py::array_t<uint32_t>(
+          {matrix.size(), matrix.size()}, matrix.get_data(), self);
+    }
+    state[kind] = views;
+  }
+  return state;
+}
+
+py::dict input_state(py::object self) {
+  const auto &input = self.cast<const vroom::Input &>();
+  py::dict state;
+  state["geometry"] = input.*private_member(_Geometry());
+  state["jobs"] = jobs_state(input);
+  state["vehicles"] = vehicles_state(input);
+  state["matrices"] = matrices_state(self);
+  return state;
+}
+
+void load_jobs_state(vroom::Input &self, const py::dict &state) {
+  _StateColumns jobs(state);
+  const std::size_t size = jobs.size("id");
+  const auto *id = jobs.column<vroom::Id>("id");
+  const auto *type = jobs.column<uint8_t>("type");
+  const auto *setup = jobs.column<vroom::UserDuration>("default_setup");
+  const auto *service = jobs.column<vroom::UserDuration>("default_service");
+  const auto *priority = jobs.column<vroom::Priority>("priority");
+  const auto locations = jobs.locations("location", size);
+  const auto delivery = jobs.amounts("delivery", size);
+  const auto pickup = jobs.amounts("pickup", size);
+  _StateReader extras(jobs.bytes("extras"));
+
+  // Shipments are stored as a pickup directly followed by its delivery.
+  std::optional<vroom::Job> pickup_job;
+  for (std::size_t i = 0; i < size; i++) {
+    const auto job_type = static_cast<vroom::JOB_TYPE>(type[i]);
+    auto job = extras.job(id[i], job_type, locations[i].value(), setup[i],
+                          service[i], delivery[i], pickup[i], priority[i]);
+    if (job_type == vroom::JOB_TYPE::SINGLE)
+      self.add_job(job);
+    else if (job_type == vroom::JOB_TYPE::PICKUP)
+      pickup_job.emplace(std::move(job));
+    else
+      self.add_shipment(pickup_job.value(), job);
+  }
+}
+
+void load_vehicles_state(vroom::Input &self, const py::dict &state) {
+  _StateColumns vehicles(state);
+  const std::size_t size = vehicles.size("id");
+  const auto *id = vehicles.column<vroom::Id>("id");
+  const auto starts = vehicles.locations("start", size);
+  const auto ends = vehicles.locations("end", size);
+  const auto capacity = vehicles.amounts("capacity", size);
+  const auto *costs = vehicles.column<vroom::UserCost>("costs");
+  const auto *speed = vehicles.column<double>("speed_factor");
+  const auto *max_tasks = vehicles.column<uint64_t>("max_tasks");
+  const auto *travel_time = vehicles.column<int64_t>("max_travel_time");
+  const auto *distance = vehicles.column<int64_t>("max_distance");
+  _StateReader extras(vehicles.bytes("extras"));
+
+  for (std::size_t i = 0; i < size; i++) {
+    const auto *cost = costs + 4 * i;
+    self.add_vehicle(extras.vehicle(
+        id[i], starts[i], ends[i], capacity[i],
+        vroom::VehicleCosts(cost[0], cost[1], cost[2], cost[3]), speed[i],
+        max_tasks[i], travel_time[i], distance[i]));
+  }
+}
+
+void load_state(vroom::Input &self, const py::dict &state) {
+  self.set_geometry(state["geometry"].cast<bool>());
+  load_jobs_state(self, state["jobs"].cast<py::dict>());
+  load_vehicles_state(self, state["vehicles"].cast<py::dict>());
+  const auto matrices = state["matrices"].cast<py::dict>();
+  for (const auto [profile, array] : matrices["durations"].cast<py::dict>())
+    self.set_durations_matrix(profile.cast<std::string>(),
+                              matrix_from_array(array.cast<py::array>()));
+  for (const auto [profile, array] : matrices["distances"].cast<py::dict>())
+    self.set_distances_matrix(profile.cast<std::string>(),
+                              matrix_from_array(array.cast<py::array>()));
+  for (const auto [profile, array] : matrices["costs"].cast<py::dict>())
+    self.set_costs_matrix(profile.cast<std::string>(),
+                          matrix_from_array(array.cast<py::array>()));
+}
@@ -38,6 +38,15 @@ void init_job(py::module_ &m) {
            py::arg("service_per_type") = vroom::TypeToUserDurationMap())
       .def("index", &vroom::Job::index)
       .def("is_valid_start", &vroom::Job::is_valid_start)
+      .def(py::init([](const py::bytes &state) {
+        return _StateReader(std::string_view(state)).job();
+      }))
+      .def("_state",
+           [](const vroom::Job &job) {
+             _StateWriter writer;
+             writer.job(job);
+             return py::bytes(writer.buffer);
+           })
       .def_readonly("_id", &vroom::Job::id)
       .def_readwrite("_location", &vroom::Job::location)
       .def_readonly("_type", &vroom::Job::type)
@@ -0,0 +1,21 @@
+#ifndef VROOM_BIND_PRIVATE_MEMBER_H
+#define VROOM_BIND_PRIVATE_MEMBER_H
+
+#include "structures/vroom/input/input.h"
+
+// libvroom keeps a few members private that the bindings need to reach.
+// Explicit template instantiations may name private members, so that
+// `object.*private_member(Tag())` reads them without patching libvroom.
+template <typename Tag, typename Tag::type Member> struct _PrivateMember {
+  friend typename Tag::type private_member(Tag) { return Member; }
+};
+
+// Declare `Tag` as the key to the private `member` of `vroom::Input`.
+#define _INPUT_MEMBER(Tag, Type, member)                                       \
+  struct Tag {                                                                 \
+    using type = Type vroom::Input::*;                                         \
+    friend type private_member(Tag);                                           \
+  };                                                                           \
+  template struct _PrivateMember<Tag, &vroom::Input::member>;
+
+#endif
@@ -0,0 +1,569 @@
+#include <cstring>
+#include <string>
+
+#include <pybind11/pybind11.h>
+
+#include "structures/vroom/break.h"
+#include "structures/vroom/job.h"
+#include "structures/vroom/solution/solution.h"
+#include "structures/vroom/vehicle.h"
+
+#include "bind/private_member.h"
+
+namespace py = pybind11;
+
+struct _DurationFactor {
+  using type = const vroom::Duration vroom::CostWrapper::*;
+  friend type private_member(_DurationFactor);
+};
+template struct _PrivateMember<_DurationFactor,
+                               &vroom::CostWrapper::discrete_duration_factor>;
+
+// Speed factor of a vehicle, as far as the solver still knows it.
+double speed_factor(const vroom::Vehicle &vehicle) {
+  return static_cast<double>(vroom::DURATION_FACTOR) /
+         (vehicle.cost_wrapper.*private_member(_DurationFactor()));
+}
+
+// Maximum travel time and distance of a vehicle, or -1 if unbounded.
+int64_t max_travel_time(const vroom::Vehicle &vehicle) {
+  if (vehicle.max_travel_time == vroom::DEFAULT_MAX_TRAVEL_TIME)
+    return -1;
+  return vroom::utils::scale_to_user_duration(vehicle.max_travel_time);
+}
+
+int64_t max_distance(const vroom::Vehicle &vehicle) {
+  if (vehicle.max_distance == vroom::DEFAULT_MAX_DISTANCE)
+    return -1;
+  return vehicle.max_distance;
+}
+
+// Compact binary state of the native structures, used for pickling.
+// Durations are stored in user units, so that the constructors scale them
+// back exactly as when the structures were first built.
+class _StateWriter {
+public:
+  std::string buffer;
+
+  template <typename T> void pod(const T &value) {
+    buffer.append(reinterpret_cast<const char *>(&value), sizeof(T));
+  }
+
+  void string(const std::string &value) {
+    pod<uint64_t>(value.size());
+    buffer.append(value);
+  }
+
+  void amount(const vroom::Amount &amount) {
+    pod<uint64_t>(amount.size());
+    for (std::size_t i = 0; i < amount.size(); i++)
+      pod<vroom::Capacity>(amount[i]);
+  }
+
+  void location(const vroom::Location &location) {
+    pod<vroom::Index>(location.index());
+    pod<bool>(location.user_index());
+    pod<bool>(location.has_coordinates());
+    if (location.has_coordinates()) {
+      pod<vroom::Coordinate>(location.lon());
+      pod<vroom::Coordinate>(location.lat());
+    }
+  }
+
+  void optional_location(const std::optional<vroom::Location> &location_) {
+    pod<bool>(location_.has_value());
+    if (location_.has_value())
+      location(location_.value());
+  }
+
+  void skills(const vroom::Skills &skills) {
+    pod<uint64_t>(skills.size());
+    for (const auto &skill : skills)
+      pod<vroom::Skill>(skill);
+  }
+
+  void optional_duration(const std::optional<vroom::Duration> &duration) {
+    pod<bool>(duration.has_value());
+    if (duration.has_value())
+      pod<vroom::UserDuration>(
+          vroom::utils::scale_to_user_duration(duration.value()));
+  }
+
+  void time_windows(const std::vector<vroom::TimeWindow> &tws) {
+    pod<uint64_t>(tws.size());
+    for (const auto &tw : tws) {
+      pod<bool>(tw.is_default());
+      pod<vroom::UserDuration>(vroom::utils::scale_to_user_duration(tw.start));
+      pod<vroom::UserDuration>(vroom::utils::scale_to_user_duration(tw.end));
+    }
+  }
+
+  void durations(const vroom::TypeToDurationMap &durations) {
+    pod<uint64_t>(durations.size());
+    for (const auto &[type, duration] : durations) {
+      string(type);
+      pod<vroom::UserDuration>(vroom::utils::scale_to_user_duration(duration));
+    }
+  }
+
+  void violations(const vroom::Violations &violations) {
+    pod<vroom::UserDuration>(violations.lead_time);
+    pod<vroom::UserDuration>(violations.delay);
+    pod<uint64_t>(violations.types.size());
+    for (const auto &type : violations.types)
+      pod<vroom::VIOLATION>(type);
+  }
+
+  // Fields of a job that do not fit in fixed-width columns.
+  void job_extras(const vroom::Job &job) {
+    skills(job.skills);
+    time_windows(job.tws);
+    string(job.description);
+    durations(job.setup_per_type);
+    durations(job.service_per_type);
+  }
+
+  void job(const vroom::Job &job) {
+    pod<vroom::Id>(job.id);
+    pod<vroom::JOB_TYPE>(job.type);
+    location(job.location);
+    pod<vroom::UserDuration>(
+        vroom::utils::scale_to_user_duration(job.default_setup));
+    pod<vroom::UserDuration>(
+        vroom::utils::scale_to_user_duration(job.default_service));
+    amount(job.delivery);
+    amount(job.pickup);
+    pod<vroom::Priority>(job.priority);
+    job_extras(job);
+  }
+
+  void break_(const vroom::Break &break_) {
+    pod<vroom::Id>(break_.id);
+    time_windows(break_.tws);
+    pod<vroom::UserDuration>(
+        vroom::utils::scale_to_user_duration(break_.service));
+    string(break_.description);
+    pod<bool>(break_.max_load.has_value());
+    if (break_.max_load.has_value())
+      amount(break_.max_load.value());
+  }
+
+  void vehicle_step(const vroom::VehicleStep &step) {
+    pod<vroom::Id>(step.id);
+    pod<vroom::STEP_TYPE>(step.type);
+    pod<bool>(step.job_type.has_value());
+    if (step.job_type.has_value())
+      pod<vroom::JOB_TYPE>(step.job_type.value());
+    optional_duration(step.forced_service.at);
+    optional_duration(step.forced_service.after);
+    optional_duration(step.forced_service.before);
+  }
+
+  // Fields of a vehicle that do not fit in fixed-width columns.
+  void vehicle_extras(const vroom::Vehicle &vehicle) {
+    string(vehicle.profile);
+    skills(vehicle.skills);
+    time_windows({vehicle.tw});
+    pod<uint64_t>(vehicle.breaks.size());
+    for (const auto &b : vehicle.breaks)
+      break_(b);
+    string(vehicle.description);
+    pod<uint64_t>(vehicle.steps.size());
+    for (const auto &step : vehicle.steps)
+      vehicle_step(step);
+    string(vehicle.type_str);
+  }
+
+  void vehicle(const vroom::Vehicle &vehicle) {
+    pod<vroom::Id>(vehicle.id);
+    optional_location(vehicle.start);
+    optional_location(vehicle.end);
+    amount(vehicle.capacity);
+    pod<vroom::UserCost>(vroom::utils::scale_to_user_cost(vehicle.costs.fixed));
+    pod<vroom::UserCost>(vehicle.costs.per_hour);
+    pod<vroom::UserCost>(vehicle.costs.per_km);
+    pod<vroom::UserCost>(vehicle.costs.per_task_hour);
+    pod<double>(speed_factor(vehicle));
+    pod<uint64_t>(vehicle.max_tasks);
+    pod<int64_t>(max_travel_time(vehicle));
+    pod<int64_t>(max_distance(vehicle));
+    vehicle_extras(vehicle);
+  }
+
+  void step(const vroom::Step &step) {
+    pod<vroom::STEP_TYPE>(step.step_type);
+    pod<bool>(step.job_type.has_value());
+    if (step.job_type.has_value())
+      pod<vroom::JOB_TYPE>(step.job_type.value());
+    pod<bool>(step.location.has_value());
+    if (step.location.has_value())
+      location(step.location.value());
+    pod<vroom::Id>(step.id);
+    pod<vroom::UserDuration>(step.setup);
+    pod<vroom::UserDuration>(step.service);
+    amount(step.load);
+    string(step.description);
+    pod<vroom::UserDuration>(step.arrival);
+    pod<vroom::UserDuration>(step.duration);
+    pod<vroom::UserDuration>(step.waiting_time);
+    pod<vroom::UserDistance>(step.distance);
+    violations(step.violations);
+  }
+
+  void route(const vroom::Route &route) {
+    pod<vroom::Id>(route.vehicle);
+    pod<uint64_t>(route.steps.size());
+    for (const auto &step_ : route.steps)
+      step(step_);
+    pod<vroom::UserCost>(route.cost);
+    pod<vroom::UserDuration>(route.duration);
+    pod<vroom::UserDistance>(route.distance);
+    pod<vroom::UserDuration>(route.setup);
+    pod<vroom::UserDuration>(route.service);
+    pod<vroom::UserDuration>(route.waiting_time);
+    pod<vroom::Priority>(route.priority);
+    amount(route.delivery);
+    amount(route.pickup);
+    string(route.profile);
+    string(route.description);
+    violations(route.violations);
+    string(route.geometry);
+  }
+
+  void solution(const vroom::Solution &solution) {
+    const auto &summary = solution.summary;
+    pod<uint64_t>(solution.routes.size());
+    for (const auto &route_ : solution.routes)
+      route(route_);
+    pod<uint64_t>(solution.unassigned.size());
+    for (const auto &job_ : solution.unassigned)
+      job(job_);
+    pod<vroom::UserCost>(summary.cost);
+    amount(summary.delivery);
+    amount(summary.pickup);
+    pod<vroom::UserDuration>(summary.setup);
+    pod<vroom::UserDuration>(summary.service);
+    pod<vroom::Priority>(summary.priority);
+    pod<vroom::UserDuration>(summary.duration);
+    pod<vroom::UserDuration>(summary.waiting_time);
+    pod<vroom::UserDistance>(summary.distance);
+    pod<vroom::UserDuration>(summary.computing_times.loading);
+    pod<vroom::UserDuration>(summary.computing_times.solving);
+    pod<vroom::UserDuration>(summary.computing_times.routing);
+    violations(summary.violations);
+  }
+};
+
+class _StateReader {
+public:
+  explicit _StateReader(std::string_view buffer) : buffer(buffer) {}
+
+  template <typename T> T pod() {
+    if (offset + sizeof(T) > buffer.size())
+      throw std::runtime_error("Truncated vroom state.");
+    T value;
+    std::memcpy(&value, buffer.data() + offset, sizeof(T));
+    offset += sizeof(T);
+    return value;
+  }
+
+  std::string string() {
+    const auto size = pod<uint64_t>();
+    if (offset + size > buffer.size())
+      throw std::runtime_error("Truncated vroom state.");
+    std::string value(buffer.substr(offset, size));
+    offset += size;
+    return value;
+  }
+
+  vroom::Amount amount() {
+    vroom::Amount amount(pod<uint64_t>());
+    for (std::size_t i = 0; i < amount.size(); i++)
+      amount[i] = pod<vroom::Capacity>();
+    return amount;
+  }
+
+  vroom::Location location() {
+    const auto index = pod<vroom::Index>();
+    const auto user_index = pod<bool>();
+    if (!pod<bool>())
+      return vroom::Location(index);
+    const auto lon = pod<vroom::Coordinate>();
+    const auto lat = pod<vroom::Coordinate>();
+    if (user_index)
+      return vroom::Location(index, vroom::Coordinates({lon, lat}));
+    vroom::Location location(vroom::Coordinates({lon, lat}));
+    location.set_index(index);
+    return location;
+  }
+
+  std::optional<vroom::Location> optional_location() {
+    if (!pod<bool>())
+      return std::nullopt;
+    return location();
+  }
+
+  vroom::Skills skills() {
+    vroom::Skills skills;
+    const auto size = pod<uint64_t>();
+    for (uint64_t i = 0; i < size; i++)
+      skills.insert(pod<vroom::Skill>());
+    return skills;
+  }
+
+  std::optional<vroom::UserDuration> optional_duration() {
+    if (!pod<bool>())
+      return std::nullopt;
+    return pod<vroom::UserDuration>();
+  }
+
+  std::vector<vroom::TimeWindow> time_windows() {
+    std::vector<vroom::TimeWindow> tws;
+    const auto size = pod<uint64_t>();
+    for (uint64_t i = 0; i < size; i++) {
+      const auto is_default = pod<bool>();
+      const auto start = pod<vroom::UserDuration>();
+      const auto end = pod<vroom::UserDuration>();
+      tws.push_back(is_default ? vroom::TimeWindow()
+                               : vroom::TimeWindow(start, end));
+    }
+    return tws;
+  }
+
+  vroom::TypeToUserDurationMap durations() {
+    vroom::TypeToUserDurationMap durations;
+    const auto size = pod<uint64_t>();
+    for (uint64_t i = 0; i < size; i++) {
+      auto type = string();
+      durations[type] = pod<vroom::UserDuration>();
+    }
+    return durations;
+  }
+
+  vroom::Violations violations() {
+    const auto lead_time = pod<vroom::UserDuration>();
+    const auto delay = pod<vroom::UserDuration>();
+    std::unordered_set<vroom::VIOLATION> types;
+    const auto size = pod<uint64_t>();
+    for (uint64_t i = 0; i < size; i++)
+      types.insert(pod<vroom::VIOLATION>());
+    return vroom::Violations(lead_time, delay, std::move(types));
+  }
+
+  // Job from its fixed-width fields and the extras that follow.
+  vroom::Job job(vroom::Id id, vroom::JOB_TYPE type,
+                 const vroom::Location &location_, vroom::UserDuration setup,
+                 vroom::UserDuration service, const vroom::Amount &delivery,
+                 const vroom::Amount &pickup, vroom::Priority priority) {
+    auto skills_ = skills();
+    const auto tws = time_windows();
+    auto description = string();
+    const auto setup_per_type = durations();
+    const auto service_per_type = durations();
+    if (type == vroom::JOB_TYPE::SINGLE)
+      return vroom::Job(id, location_, setup, service, delivery, pickup,
+                        std::move(skills_), priority, tws,
+                        std::move(description), setup_per_type,
+                        service_per_type);
+    return vroom::Job(
+        id, type, location_, setup, service,
+        type == vroom::JOB_TYPE::PICKUP ? pickup : delivery,
+        std::move(skills_), priority, tws, std::move(description),
+        setup_per_type, service_per_type);
+  }
+
+  vroom::Job job() {
+    const auto id = pod<vroom::Id>();
+    const auto type = pod<vroom::JOB_TYPE>();
+    const auto location_ = location();
+    const auto setup = pod<vroom::UserDuration>();
+    const auto service = pod<vroom::UserDuration>();
+    const auto delivery = amount();
+    const auto pickup = amount();
+    const auto priority = pod<vroom::Priority>();
+    return job(id, type, location_, setup, service, delivery, pickup,
+               priority);
+  }
+
+  vroom::Break break_() {
+    const auto id = pod<vroom::Id>();
+    const auto tws = time_windows();
+    const auto service = pod<vroom::UserDuration>();
+    auto description = string();
+    std::optional<vroom::Amount> max_load;
+    if (pod<bool>())
+      max_load = amount();
+    return vroom::Break(id, tws, service, std::move(description),
+                        std::move(max_load));
+  }
+
+  vroom::VehicleStep vehicle_step() {
+    const auto id = pod<vroom::Id>();
+    const auto type = pod<vroom::STEP_TYPE>();
+    std::optional<vroom::JOB_TYPE> job_type;
+    if (pod<bool>())
+      job_type = pod<vroom::JOB_TYPE>();
+    const auto at = optional_duration();
+    const auto after = optional_duration();
+    const auto before = optional_duration();
+    vroom::ForcedService forced_service(at, after, before);
+    if (type == vroom::STEP_TYPE::JOB)
+      return vroom::VehicleStep(job_type.value(), id, std::move(forced_service));
+    if (type == vroom::STEP_TYPE::BREAK)
+      return vroom::VehicleStep(type, id, std::move(forced_service));
+    return vroom::VehicleStep(type, std::move(forced_service));
+  }
+
+  // Vehicle from its fixed-width fields and the extras that follow.
+  vroom::Vehicle vehicle(vroom::Id id,
+                         const std::optional<vroom::Location> &start,
+                         const std::optional<vroom::Location> &end,
+                         const vroom::Amount &capacity,
+                         const vroom::VehicleCosts &costs, double speed_factor,
+                         uint64_t max_tasks, int64_t max_travel_time,
+                         int64_t max_distance) {
+    auto profile = string();
+    auto skills_ = skills();
+    const auto tw = time_windows().front();
+    std::vector<vroom::Break> breaks;
+    const auto nb_breaks = pod<uint64_t>();
+    for (uint64_t i = 0; i < nb_breaks; i++)
+      breaks.push_back(break_());
+    auto description = string();
+    std::vector<vroom::VehicleStep> steps;
+    const auto nb_steps = pod<uint64_t>();
+    for (uint64_t i = 0; i < nb_steps; i++)
+      steps.push_back(vehicle_step());
+    auto type_str = string();
+    return vroom::Vehicle(
+        id, start, end, std::move(profile), capacity, std::move(skills_), tw,
+        breaks, std::move(description), costs, speed_factor, max_tasks,
+        max_travel_time < 0
+            ? std::nullopt
+            : std::optional<vroom::UserDuration>(max_travel_time),
+        max_distance < 0 ? std::nullopt
+                         : std::optional<vroom::UserDistance>(max_distance),
+        steps, std::move(type_str));
+  }
+
+  vroom::Vehicle vehicle() {
+    const auto id = pod<vroom::Id>();
+    const auto start = optional_location();
+    const auto end = optional_location();
+    const auto capacity = amount();
+    const auto fixed = pod<vroom::UserCost>();
+    const auto per_hour = pod<vroom::UserCost>();
+    const auto per_km = pod<vroom::UserCost>();
+    const auto per_task_hour = pod<vroom::UserCost>();
+    const vroom::VehicleCosts costs(fixed, per_hour, per_km, per_task_hour);
+    const auto speed_factor = pod<double>();
+    const auto max_tasks = pod<uint64_t>();
+    const auto max_travel_time = pod<int64_t>();
+    const auto max_distance = pod<int64_t>();
+    return vehicle(id, start, end, capacity, costs, speed_factor, max_tasks,
+                   max_travel_time, max_distance);
+  }
+
+  vroom::Step step() {
+    const auto step_type = pod<vroom::STEP_TYPE>();
+    std::optional<vroom::JOB_TYPE> job_type;
+    if (pod<bool>())
+      job_type = pod<vroom::JOB_TYPE>();
+    std::optional<vroom::Location> location_;
+    if (pod<bool>())
+      location_ = location();
+    const auto id = pod<vroom::Id>();
+    const auto setup = pod<vroom::UserDuration>();
+    const auto service = pod<vroom::UserDuration>();
+    auto load = amount();
+    auto description = string();
+
+    auto step_ = [&]() {
+      if (step_type == vroom::STEP_TYPE::JOB) {
+        // Steps only keep the identity of their job.
+        const auto job =
+            job_type.value() == vroom::JOB_TYPE::SINGLE
+                ? vroom::Job(id, location_.value(), 0, 0, vroom::Amount(0),
+                             vroom::Amount(0), vroom::Skills(), 0,
+                             {vroom::TimeWindow()}, description)
+                : vroom::Job(id, job_type.value(), location_.value(), 0, 0,
+                             vroom::Amount(0), vroom::Skills(), 0,
+                             {vroom::TimeWindow()}, description);
+        return vroom::Step(job, setup, service, std::move(load));
+      }
+      if (step_type == vroom::STEP_TYPE::BREAK) {
+        const vroom::Break break_(id, {vroom::TimeWindow()}, service,
+                                  description);
+        return vroom::Step(break_, std::move(load));
+      }
+      return vroom::Step(step_type, location_.value(), std::move(load));
+    }();
+    step_.arrival = pod<vroom::UserDuration>();
+    step_.duration = pod<vroom::UserDuration>();
+    step_.waiting_time = pod<vroom::UserDuration>();
+    step_.distance = pod<vroom::UserDistance>();
+    step_.violations = violations();
+    return step_;
+  }
+
+  vroom::Route route() {
+    const auto vehicle = pod<vroom::Id>();
+    std::vector<vroom::Step> steps;
+    const auto nb_steps = pod<uint64_t>();
+    for (uint64_t i = 0; i < nb_steps; i++)
+      steps.push_back(step());
+    const auto cost = pod<vroom::UserCost>();
+    const auto duration = pod<vroom::UserDuration>();
+    const auto distance = pod<vroom::UserDistance>();
+    const auto setup = pod<vroom::UserDuration>();
+    const auto service = pod<vroom::UserDuration>();
+    const auto waiting_time = pod<vroom::UserDuration>();
+    const auto priority = pod<vroom::Priority>();
+    auto delivery = amount();
+    auto pickup = amount();
+    auto profile = string();
+    auto description = string();
+    vroom::Route route_(vehicle, std::move(steps), cost, duration, distance,
+                        setup, service, waiting_time, priority,
+                        std::move(delivery), std::move(pickup),
+                        std::move(profile), std::move(description),
+                        violations());
+    route_.geometry = string();
+    return route_;
+  }
+
+  vroom::Solution solution() {
+    std::vector<vroom::Route> routes;
+    const auto nb_routes = pod<uint64_t>();
+    for (uint64_t i = 0; i < nb_routes; i++)
+      routes.push_back(route());
+    std::vector<vroom::Job> unassigned;
+    const auto nb_unassigned = pod<uint64_t>();
+    for (uint64_t i = 0; i < nb_unassigned; i++)
+      unassigned.push_back(job());
+
+    const auto cost = pod<vroom::UserCost>();
+    auto delivery = amount();
+    vroom::Solution solution_(vroom::Amount(delivery.size()),
+                              std::move(routes), std::move(unassigned));
+    auto &summary = solution_.summary;
+    summary.cost = cost;
+    summary.delivery = std::move(delivery);
+    summary.pickup = amount();
+    summary.setup = pod<vroom::UserDuration>();
+    summary.service = pod<vroom::UserDuration>();
+    summary.priority = pod<vroom::Priority>();
+    summary.duration = pod<vroom::UserDuration>();
+    summary.waiting_time = pod<vroom::UserDuration>();
+    summary.distance = pod<vroom::UserDistance>();
+    summary.computing_times.loading = pod<vroom::UserDuration>();
+    summary.computing_times.solving = pod<vroom::UserDuration>();
+    summary.computing_times.routing = pod<vroom::UserDuration>();
+    summary.violations = violations();
+    return solution_;
+  }
+
+private:
+  std::string_view buffer;
+  std::size_t offset = 0;
+};
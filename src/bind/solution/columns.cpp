@@ -0,0 +1,213 @@
+#include <string>
+#include <vector>
+
+#include <pybind11/numpy.h>
+#include <pybind11/pybind11.h>
+
+#include "structures/vroom/solution/solution.h"
+
+namespace py = pybind11;
+
+// Solutions as contiguous columns, for zero-copy export to Arrow. Strings
+// and amounts are given as offsets into a flat values buffer, and optional
+// values along with a validity column.
+
+template <typename T> py::array_t<T> vector_array(std::vector<T> &&values) {
+  auto *owned = new std::vector<T>(std::move(values));
+  py::capsule owner(owned, [](void *pointer) {
+    delete static_cast<std::vector<T> *>(pointer);
+  });
+  return py::array_t<T>(owned->size(), owned->data(), owner);
+}
+
+struct _StringColumn {
+  std::vector<int64_t> offsets{0};
+  std::vector<uint8_t> data;
+
+  void push(const std::string &value) {
+    data.insert(data.end(), value.begin(), value.end());
+    offsets.push_back(data.size());
+  }
+
+  py::dict columns() {
+    py::dict state;
+    state["offsets"] = vector_array(std::move(offsets));
+    state["data"] = vector_array(std::move(data));
+    return state;
+  }
+};
+
+struct _AmountColumn {
+  std::vector<int64_t> offsets{0};
+  std::vector<int64_t> data;
+
+  void push(const vroom::Amount &value) {
+    for (std::size_t i = 0; i < value.size(); i++)
+      data.push_back(value[i]);
+    offsets.push_back(data.size());
+  }
+
+  py::dict columns() {
+    py::dict state;
+    state["offsets"] = vector_array(std::move(offsets));
+    state["data"] = vector_array(std::move(data));
+    return state;
+  }
+};
+
+struct _LocationColumns {
+  std::vector<int64_t> index;
+  std::vector<bool> has_index;
+  std::vector<double> lon;
+  std::vector<double> lat;
+  std::vector<bool> has_coordinates;
+
+  void push(const std::optional<vroom::Location> &location) {
+    index.push_back(location.has_value() ? location->index() : 0);
+    has_index.push_back(location.has_value());
+    const bool coordinates =
+        location.has_value() && location->has_coordinates();
+    lon.push_back(coordinates ? location->lon() : 0);
+    lat.push_back(coordinates ? location->lat() : 0);
+    has_coordinates.push_back(coordinates);
+  }
+
+  void add_to(py::dict &state) {
+    state["location_index"] = vector_array(std::move(index));
+    state["longitude"] = vector_array(std::move(lon));
+    state["latitude"] = vector_array(std::move(lat));
+    state["_has_location_index"] = mask_array(has_index);
+    state["_has_coordinates"] = mask_array(has_coordinates);
+  }
+
+  static py::array_t<bool> mask_array(const std::vector<bool> &mask) {
+    py::array_t<bool> array(mask.size());
+    std::copy(mask.begin(), mask.end(), array.mutable_data());
+    return array;
+  }
+};
+
+uint8_t step_category(const vroom::Step &step) {
+  // Same order as `vroom.solution.solution.STEP_CATEGORIES`.
+  switch (step.step_type) {
+  case vroom::STEP_TYPE::START:
+    return 0;
+  case vroom::STEP_TYPE::END:
+    return 1;
+  case vroom::STEP_TYPE::BREAK:
+    return 2;
+  default:
+    break;
+  }
+  switch (step.job_type.value()) {
+  case vroom::JOB_TYPE::SINGLE:
+    return 3;
+  case vroom::JOB_TYPE::DELIVERY:
+    return 4;
+  default:
+    return 5;
+  }
+}
+
+py::dict steps_columns(const vroom::Solution &solution) {
+  std::vector<int64_t> vehicle_id, arrival, duration, setup, service,
+      waiting_time, distance, id;
+  std::vector<uint8_t> type;
+  std::vector<bool> has_id;
+  _LocationColumns locations;
+  _StringColumn description;
+  _AmountColumn load;
+  {
+    py::gil_scoped_release release;
+    for (const auto &route : solution.routes) {
+      for (const auto &step : route.steps) {
+        vehicle_id.push_back(route.vehicle);
+        type.push_back(step_category(step));
+        arrival.push_back(step.arrival);
+        duration.push_back(step.duration);
+        setup.push_back(step.setup);
+        service.push_back(step.service);
+        waiting_time.push_back(step.waiting_time);
+        distance.push_back(step.distance);
+        const bool task = step.step_type == vroom::STEP_TYPE::JOB ||
+                          step.step_type == vroom::STEP_TYPE::BREAK;
+        id.push_back(task ? step.id : 0);
+        has_id.push_back(task);
+        locations.push(step.location);
+        description.push(step.description);
+        load.push(step.load);
+      }
+    }
+  }
+  py::dict state;
+  state["vehicle_id"] = vector_array(std::move(vehicle_id));
+  state["type"] = vector_array(std::move(type));
+  state["arrival"] = vector_array(std::move(arrival));
+  state["duration"] = vector_array(std::move(duration));
+  state["setup"] = vector_array(std::move(setup));
+  state["service"] = vector_array(std::move(service));
+  state["waiting_time"] = vector_array(std::move(waiting_time));
+  locations.add_to(state);
+  state["id"] = vector_array(std::move(id));
+  state["_has_id"] = _LocationColumns::mask_array(has_id);
+  state["description"] = description.columns();
+  state["load"] = load.columns();
+  state["distance"] = vector_array(std::move(distance));
+  return state;
+}
+
+py::dict routes_columns(const vroom::Solution &solution) {
+  std::vector<int64_t> vehicle_id, cost, setup, service, duration,
+      waiting_time, priority, distance;
+  _AmountColumn delivery, pickup;
+  _StringColumn description, geometry;
+  for (const auto &route : solution.routes) {
+    vehicle_id.push_back(route.vehicle);
+    cost.push_back(route.cost);
+    setup.push_back(route.setup);
+    service.push_back(route.service);
+    duration.push_back(route.duration);
+    waiting_time.push_back(route.waiting_time);
+    priority.push_back(route.priority);
+    distance.push_back(route.distance);
+    delivery.push(route.delivery);
+    pickup.push(route.pickup);
+    description.push(route.description);
+    geometry.push(route.geometry);
+  }
+  py::dict state;
+  state["vehicle_id"] = vector_array(std::move(vehicle_id));
+  state["cost"] = vector_array(std::move(cost));
+  state["setup"] = vector_array(std::move(setup));
+  state["service"] = vector_array(std::move(service));
+  state["duration"] = vector_array(std::move(duration));
+  state["waiting_time"] = vector_array(std::move(waiting_time));
+  state["priority"] = vector_array(std::move(priority));
+  state["delivery"] = delivery.columns();
+  state["pickup"] = pickup.columns();
+  state["description"] = description.columns();
+  state["geometry"] = geometry.columns();
+  state["distance"] = vector_array(std::move(distance));
+  return state;
+}
+
+py::dict unassigned_columns(const vroom::Solution &solution) {
+  std::vector<int64_t> id;
+  std::vector<uint8_t> type;
+  _LocationColumns locations;
+  _StringColumn description;
+  for (const auto &job : solution.unassigned) {
+    id.push_back(job.id);
+    type.push_back(job.type == vroom::JOB_TYPE::SINGLE     ? 3
+                   : job.type == vroom::JOB_TYPE::DELIVERY ? 4
+                                                           : 5);
+    locations.push(job.location);
+    description.push(job.description);
+  }
+  py::dict state;
+  state["id"] = vector_array(std::move(id));
+  state["type"] = vector_array(std::move(type));
+  locations.add_to(state);
+  state["description"] = description.columns();
+  return state;
+}
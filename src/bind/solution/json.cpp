@@ -0,0 +1,135 @@
+#include <cstdio>
+#include <string>
+
+#include <pybind11/pybind11.h>
+
+#include "rapidjson/include/rapidjson/filewritestream.h"
+#include "rapidjson/include/rapidjson/prettywriter.h"
+#include "rapidjson/include/rapidjson/stringbuffer.h"
+#include "rapidjson/include/rapidjson/writer.h"
+
+#include "structures/vroom/solution/solution.h"
+#include "utils/output_json.h"
+
+namespace py = pybind11;
+
+// Solutions in the VROOM JSON layout, built with the upstream serializer
+// and handed out as Python objects or written natively.
+
+rapidjson::Document solution_document(const vroom::Solution &solution,
+                                      bool report_distances, bool geometry) {
+  py::gil_scoped_release release;
+  auto document = vroom::io::to_json(solution, report_distances);
+  if (!geometry) {
+    for (auto &route : document["routes"].GetArray())
+      route.RemoveMember("geometry");
+  }
+  return document;
+}
+
+py::object to_python(const rapidjson::Value &value) {
+  switch (value.GetType()) {
+  case rapidjson::kNullType:
+    return py::none();
+  case rapidjson::kFalseType:
+    return py::bool_(false);
+  case rapidjson::kTrueType:
+    return py::bool_(true);
+  case rapidjson::kNumberType:
+    if (value.IsUint64())
+      return py::int_(value.GetUint64());
+    if (value.IsInt64())
+      return py::int_(value.GetInt64());
+    return py::float_(value.GetDouble());
+  case rapidjson::kStringType:
+    return py::str(value.GetString(), value.GetStringLength());
+  case rapidjson::kArrayType: {
+    py::list list(value.Size());
+    std::size_t idx = 0;
+    for (const auto &item : value.GetArray())
+      list[idx++] = to_python(item);
+    return list;
+  }
+  case rapidjson::kObjectType: {
+    py::dict dict;
+    for (const auto &member : value.GetObject())
+      dict[py::str(member.name.GetString(), member.name.GetStringLength())] =
+          to_python(member.value);
+    return dict;
+  }
+  }
+  return py::none();
+}
+
+py::dict solution_dict(const vroom::Solution &solution, bool report_distances,
+                       bool geometry) {
+  return to_python(solution_document(solution, report_distances, geometry));
+}
+
+template <typename Stream>
+void write_document(Stream &stream, const rapidjson::Document &document,
+                    bool compact, bool ndjson) {
+  if (ndjson) {
+    // Everything but the routes on the first line, then a route per line.
+    rapidjson::Writer<Stream> writer(stream);
+    writer.StartObject();
+    for (const auto &member : document.GetObject()) {
+      if (member.name == "routes")
+        continue;
+      writer.Key(member.name.GetString(), member.name.GetStringLength());
+      member.value.Accept(writer);
+    }
+    writer.EndObject();
+    stream.Put('\n');
+    for (const auto &route : document["routes"].GetArray()) {
+      writer.Reset(stream);
+      route.Accept(writer);
+      stream.Put('\n');
+    }
+  } else if (compact) {
+    rapidjson::Writer<Stream> writer(stream);
+    document.Accept(writer);
+  } else {
+    rapidjson::PrettyWriter<Stream> writer(stream);
+    writer.SetIndent(' ', 2);
+    document.Accept(writer);
+    stream.Put('\n');
+  }
+  stream.Flush();
+}
+
+void write_solution_json(const vroom::Solution &solution,
+                         const py::object &path, bool report_distances,
+                         bool geometry, bool compact, bool ndjson) {
+  const auto document = solution_document(solution, report_distances, geometry);
+  const std::string name = py::str(path);
+  std::FILE *file = std::fopen(name.c_str(), "wb");
+  if (file == nullptr) {
+    PyErr_SetFromErrnoWithFilenameObject(PyExc_OSError, path.ptr());
+    throw py::error_already_set();
+  }
+  bool failed;
+  {
+    py::gil_scoped_release release;
+    char buffer[1 << 16];
+    rapidjson::FileWriteStream stream(file, buffer, sizeof(buffer));
+    write_document(stream, document, compact, ndjson);
+    failed = std::ferror(file);
+    failed |= std::fclose(file) != 0;
+  }
+  if (failed) {
+    PyErr_SetFromErrnoWithFilenameObject(PyExc_OSError, path.ptr());
+    throw py::error_already_set();
+  }
+}
+
+py::bytes solution_json(const vroom::Solution &solution, bool report_distances,
+                        bool geometry, bool compact, bool ndjson) {
+  const auto document = solution_document(solution, report_distances, geometry);
+  rapidjson::StringBuffer buffer;
+  {
+    py::gil_scoped_release release;
+    write_document(buffer, document, compact, ndjson);
+  }
+  return py::bytes(buffer.GetString(), buffer.GetSize());
+}
@@ -23,7 +23,12 @@ void init_route(py::module_ &m) {
           }))
 
       .def_readwrite("vehicle", &vroom::Route::vehicle)
-      .def_readonly("steps", &vroom::Route::steps)
+      .def_property_readonly("steps",
+                             [](py::object self) {
+                               return reference_list(
+                                   self.cast<const vroom::Route &>().steps,
+                                   self);
+                             })
       .def_readwrite("cost", &vroom::Route::cost)
       .def_readwrite("setup", &vroom::Route::setup)
       .def_readwrite("service", &vroom::Route::service)
@@ -1,11 +1,14 @@
-#include <pybind11/iostream.h>
 #include <pybind11/numpy.h>
 #include <pybind11/pybind11.h>
+#include <cstring>
 #include <string>
 
 #include "structures/vroom/solution/solution.cpp"
 #include "utils/output_json.cpp"
 
+#include "bind/solution/columns.cpp"
+#include "bind/solution/json.cpp"
+
 namespace py = pybind11;
 
 struct _Step {
@@ -32,15 +35,29 @@ void init_solution(py::module_ &m) {
                        longitude, latitude, id, description);
 
   py::class_<vroom::Solution>(m, "Solution")
-      .def(py::init([](vroom::Solution s) { return s; }))
+      .def(py::init([](const vroom::Solution &solution) { return solution; }),
+           py::arg("solution"))
+      .def(py::init([](const py::capsule &native) {
+             // Solutions fresh from the solver are moved rather than copied.
+             if (native.name() == nullptr ||
+                 std::strcmp(native.name(), _NATIVE_SOLUTION) != 0)
+               throw py::type_error("Not a native solution, or one taken already.");
+             auto &solution = *native.get_pointer<vroom::Solution>();
+             PyCapsule_SetName(native.ptr(), "vroom._TakenSolution");
+             return std::move(solution);
+           }),
+           py::arg("native"))
       .def(py::init([](const vroom::Amount &zero_amount,
                        std::vector<vroom::Route> &routes,
                        std::vector<vroom::Job> &unassigned) {
         return new vroom::Solution(zero_amount, std::move(routes),
                                    std::move(unassigned));
       }))
+      .def(py::init([](const py::bytes &state) {
+        return _StateReader(std::string_view(state)).solution();
+      }))
       .def("_routes_numpy",
-           [](vroom::Solution solution) {
+           [](const vroom::Solution &solution) {
              const unsigned int NA_SUBSTITUTE = 4293967297;
              size_t idx = 0;
              std::string type;
@@ -49,72 +66,88 @@ void init_solution(py::module_ &m) {
              for (auto &route : solution.routes)
                number_of_steps += route.steps.size();
              auto arr = py::array_t<_Step>(number_of_steps);
-             auto ptr = static_cast<_Step *>(arr.request().ptr);
-             for (auto &route : solution.routes) {
-               for (auto &step : route.steps) {
+             auto ptr = arr.mutable_data();
+             {
+               py::gil_scoped_release release;
+               for (auto &route : solution.routes) {
+                 for (auto &step : route.steps) {
 
-                 ptr[idx].vehicle_id = route.vehicle;
+                   ptr[idx].vehicle_id = route.vehicle;
 
-                 if (step.step_type == vroom::STEP_TYPE::START)
-                   type = "start";
-                 else if (step.step_type == vroom::STEP_TYPE::END)
-                   type = "end";
-                 else if (step.step_type == vroom::STEP_TYPE::BREAK)
-                   type = "break";
-                 else if (step.job_type == vroom::JOB_TYPE::SINGLE)
-                   type = "job";
-                 else if (step.job_type == vroom::JOB_TYPE::PICKUP)
-                   type = "pickup";
-                 else if (step.job_type == vroom::JOB_TYPE::DELIVERY)
-                   type = "delivery";
+                   if (step.step_type == vroom::STEP_TYPE::START)
+                     type = "start";
+                   else if (step.step_type == vroom::STEP_TYPE::END)
+                     type = "end";
+                   else if (step.step_type == vroom::STEP_TYPE::BREAK)
+                     type = "break";
+                   else if (step.job_type == vroom::JOB_TYPE::SINGLE)
+                     type = "job";
+                   else if (step.job_type == vroom::JOB_TYPE::PICKUP)
+                     type = "pickup";
+                   else if (step.job_type == vroom::JOB_TYPE::DELIVERY)
+                     type = "delivery";
 
-                 strncpy(ptr[idx].type, type.c_str(), 9);
-                 strncpy(ptr[idx].description, step.description.c_str(), 40);
+                   strncpy(ptr[idx].type, type.c_str(), 9);
+                   strncpy(ptr[idx].description, step.description.c_str(), 40);
 
-                 ptr[idx].longitude =
-                     step.location.has_value() &&
-                             step.location.value().has_coordinates()
-                         ? step.location.value().coordinates().lon
-                         : NA_SUBSTITUTE;
-                 ptr[idx].latitude =
-                     step.location.has_value() &&
-                             step.location.value().has_coordinates()
-                         ? step.location.value().coordinates().lat
-                         : NA_SUBSTITUTE;
-                 ptr[idx].location_index = step.location.has_value()
-                                               ? step.location.value().index()
-                                               : NA_SUBSTITUTE;
+                   ptr[idx].longitude =
+                       step.location.has_value() &&
+                               step.location.value().has_coordinates()
+                           ? step.location.value().coordinates().lon
+                           : NA_SUBSTITUTE;
+                   ptr[idx].latitude =
+                       step.location.has_value() &&
+                               step.location.value().has_coordinates()
+                           ? step.location.value().coordinates().lat
+                           : NA_SUBSTITUTE;
+                   ptr[idx].location_index = step.location.has_value()
+                                                 ? step.location.value().index()
+                                                 : NA_SUBSTITUTE;
 
-                 ptr[idx].id = (step.step_type == vroom::STEP_TYPE::JOB or
-                                step.step_type == vroom::STEP_TYPE::BREAK)
-                                   ? step.id
-                                   : NA_SUBSTITUTE;
+                   ptr[idx].id = (step.step_type == vroom::STEP_TYPE::JOB or
+                                  step.step_type == vroom::STEP_TYPE::BREAK)
+                                     ? step.id
+                                     : NA_SUBSTITUTE;
 
-                 ptr[idx].setup = step.setup;
-                 ptr[idx].service = step.service;
-                 ptr[idx].waiting_time = step.waiting_time;
-                 ptr[idx].distance = step.distance;
-                 ptr[idx].arrival = step.arrival;
-                 ptr[idx].duration = step.duration;
+                   ptr[idx].setup = step.setup;
+                   ptr[idx].service = step.service;
+                   ptr[idx].waiting_time = step.waiting_time;
+                   ptr[idx].distance = step.distance;
+                   ptr[idx].arrival = step.arrival;
+                   ptr[idx].duration = step.duration;
 
-                 idx++;
+                   idx++;
+                 }
                }
              }
              return arr;
            })
-      .def("_solution_json",
-           [](vroom::Solution solution) {
-             py::scoped_ostream_redirect stream(
-                 std::cout, py::module_::import("sys").attr("stdout"));
-             vroom::io::write_to_json(solution, "", false);
-           })
-      .def("_geometry_solution_json",
-           [](vroom::Solution solution) {
-             py::scoped_ostream_redirect stream(
-                 std::cout, py::module_::import("sys").attr("stdout"));
-             vroom::io::write_to_json(solution, "", true);
+      .def("_steps_columns", &steps_columns)
+      .def("_routes_columns", &routes_columns)
+      .def("_unassigned_columns", &unassigned_columns)
+      .def("_to_dict", &solution_dict, py::arg("report_distances"),
+           py::arg("geometry") = true)
+      .def("_write_json", &write_solution_json, py::arg("path"),
+           py::arg("report_distances"), py::arg("geometry"),
+           py::arg("compact"), py::arg("ndjson"))
+      .def("_json", &solution_json, py::arg("report_distances"),
+           py::arg("geometry"), py::arg("compact"), py::arg("ndjson"))
+      .def("_state",
+           [](const vroom::Solution &solution) {
+             _StateWriter writer;
+             writer.solution(solution);
+             return py::bytes(writer.buffer);
            })
       .def_readonly("summary", &vroom::Solution::summary)
-      .def_readonly("_routes", &vroom::Solution::routes)
-      .def_readonly("unassigned", &vroom::Solution::unassigned);
+      .def_property_readonly("_routes",
+                             [](py::object self) {
+                               return reference_list(
+                                   self.cast<const vroom::Solution &>().routes,
+                                   self);
+                             })
+      .def_property_readonly(
+          "unassigned", [](py::object self) {
+            return reference_list(
+                self.cast<const vroom::Solution &>().unassigned, self);
+          });
 }
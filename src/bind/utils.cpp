@@ -2,6 +2,17 @@
 
 #include "structures/typedefs.h"
 
+// List of references to the items of a vector owned by `parent`, to hand out
+// nested structures without copying them on every attribute access.
+template <typename T>
+py::list reference_list(const std::vector<T> &items, py::handle parent) {
+  py::list list(items.size());
+  for (std::size_t i = 0; i < items.size(); i++)
+    list[i] = py::cast(&items[i], py::return_value_policy::reference_internal,
+                       parent);
+  return list;
+}
+
 void init_utils(py::module_ &m) {
 
   m.def("scale_from_user_duration", [](vroom::UserDuration d) {
@@ -16,4 +27,9 @@ void init_utils(py::module_ &m) {
         py::arg("user_cost"));
   m.def("scale_to_user_cost", &vroom::utils::scale_to_user_cost,
         py::arg("cost"));
+  m.attr("MAX_EXPLORATION_LEVEL") = vroom::MAX_EXPLORATION_LEVEL;
+  m.attr("DEFAULT_EXPLORATION_LEVEL") = vroom::DEFAULT_EXPLORATION_LEVEL;
+  m.def("get_depth", &vroom::utils::get_depth, py::arg("exploration_level"));
+  m.def("get_nb_searches", &vroom::utils::get_nb_searches,
+        py::arg("exploration_level"));
 }
@@ -41,6 +41,15 @@ void init_vehicle(py::module_ &m) {
       // .def("has_end", &vroom::Vehicle::has_end)
       .def("_has_same_locations", &vroom::Vehicle::has_same_locations)
       .def("_has_same_profile", &vroom::Vehicle::has_same_profile)
+      .def(py::init([](const py::bytes &state) {
+        return _StateReader(std::string_view(state)).vehicle();
+      }))
+      .def("_state",
+           [](const vroom::Vehicle &vehicle) {
+             _StateWriter writer;
+             writer.vehicle(vehicle);
+             return py::bytes(writer.buffer);
+           })
       .def_readonly("_id", &vroom::Vehicle::id)
       .def_readwrite("_start", &vroom::Vehicle::start)
       .def_readwrite("_end", &vroom::Vehicle::end)
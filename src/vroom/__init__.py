@@ -2,7 +2,7 @@
 
 import sys
 from typing import Optional, Sequence
-from ._vroom import _main, JOB_TYPE, STEP_TYPE  # type: ignore
+from ._vroom import _main, get_depth, get_nb_searches, JOB_TYPE, STEP_TYPE  # type: ignore
 
 from .amount import Amount
 from .break_ import Break
@@ -13,6 +13,11 @@ from .vehicle import Vehicle, VehicleCosts
 
 from .input.forced_service import ForcedService
 from .input.input import Input
+from .input.matrix_pool import MatrixPool
+from .input.routing_cache import RoutingCache
+from .input.routing_proxy import RoutingProxy
+from .batch import solve_many
+from .tuning import tune
 from .input.vehicle_step import (
     VehicleStep,
     VehicleStepStart,
@@ -1,7 +1,7 @@
 """An array of integers describing multidimensional quantities."""
 
 from __future__ import annotations
-from typing import Sequence, Union
+from typing import Any, Sequence, Tuple, Union
 
 import numpy
 
@@ -91,6 +91,9 @@ class Amount(_vroom.Amount):
     def __repr__(self) -> str:
         return f"vroom.{self.__class__.__name__}" f"({numpy.asarray(self).tolist()})"
 
+    def __reduce__(self) -> Tuple[Any, ...]:
+        return self.__class__, (numpy.asarray(self),)
+
     def __lshift__(self, other: Amount) -> bool:
         other = Amount(other)
         if len(self) != len(other):
@@ -0,0 +1,130 @@
+"""Solving many independent problems in parallel."""
+
+from __future__ import annotations
+from typing import Any, Dict, Iterable, Iterator, Optional, Tuple, Union
+from pathlib import Path
+from datetime import timedelta
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from multiprocessing.context import BaseContext
+import os
+
+from .input.input import Input
+from .solution.solution import Solution
+
+
+def _solve_one(
+    task: Union[Input, str, Path],
+    exploration_level: int,
+    nb_threads: int,
+    timeout: Optional[timedelta],
+    kwargs: Dict[str, Any],
+) -> Solution:
+    """Solve one problem of a batch inside a worker process."""
+    if not isinstance(task, Input):
+        task = Input.from_json(task, **kwargs)
+    return task.solve(
+        exploration_level=exploration_level,
+        nb_threads=nb_threads,
+        timeout=timeout,
+    )
+
+
+def _size(problem_instance: Union[Input, str, Path]) -> int:
+    """Rough measure of how long a problem takes to solve."""
+    if isinstance(problem_instance, Input):
+        return len(problem_instance.jobs)
+    return os.path.getsize(problem_instance)
+
+
+def solve_many(
+    inputs: Iterable[Union[Input, str, Path]],
+    exploration_level: int,
+    max_workers: Optional[int] = None,
+    threads_per_solve: Optional[int] = None,
+    timeout: Optional[timedelta] = None,
+    mp_context: Optional[BaseContext] = None,
+    **kwargs: Any,
+) -> Iterator[Tuple[int, Solution]]:
+    """Solve independent problems in a pool of worker processes.
+
+    The problems are handed out largest first, measured by number of jobs
+    or by file size, so that the slowest ones do not end up alone at the
+    end of the batch. The number of workers times the number of solver
+    threads per worker never exceeds the number of cores.
+
+    Problems given as `vroom.Input` are pickled to the workers, with their
+    matrices as raw buffers. Problems given as paths are only read by the
+    workers.
+
+    Example:
+        >>> problem_instance = vroom.Input()
+        >>> problem_instance.set_durations_matrix(
+        ...     profile="car",
+        ...     matrix_input=[[0, 2104, 197, 1299],
+        ...                   [2103, 0, 2255, 3152],
+        ...                   [197, 2256, 0, 1102],
+        ...                   [1299, 3153, 1102, 0]],
+        ... )
+        >>> problem_instance.add_vehicle([vroom.Vehicle(47, start=0, end=0)])
+        >>> problem_instance.add_job([vroom.Job(1414, location=1),
+        ...                           vroom.Job(1515, location=2)])
+        >>> for position, solution in vroom.solve_many(
+        ...     [problem_instance], exploration_level=5, max_workers=1,
+        ... ):
+        ...     print(position, solution.summary.cost)
+        0 4556
+
+    Args:
+        inputs:
+            Problem instances, or paths to VROOM JSON files.
+        exploration_level:
+            The exploration level to use. Number between 1 and 5.
+        max_workers:
+            The number of worker processes. Defaults to as many as there
+            are cores left over by `threads_per_solve`.
+        threads_per_solve:
+            The number of solver threads per worker. Defaults to an even
+            share of the cores among the workers.
+        timeout:
+            Stop each solving process after a given amount of time.
+        mp_context:
+            Multiprocessing context to start the workers with. Defaults to
+            the start method of the platform.
+        kwargs:
+            Passed on to `Input.from_json` for the problems given as paths.
+
+    Yields:
+        The position of each problem in `inputs` along with its solution,
+        in order of completion.
+    """
+    inputs = list(inputs)
+    if not inputs:
+        return
+    cores = os.cpu_count() or 1
+    if max_workers is None:
+        max_workers = cores // (threads_per_solve or 1)
+    max_workers = max(1, min(int(max_workers), len(inputs), cores))
+    threads_per_solve = max(1, min(threads_per_solve or cores, cores // max_workers))
+
+    order = sorted(range(len(inputs)), key=lambda idx: _size(inputs[idx]), reverse=True)
+    executor = ProcessPoolExecutor(max_workers, mp_context=mp_context)
+
+    def submit(position: int) -> Future:
+        return executor.submit(
+            _solve_one, inputs[position], int(exploration_level), threads_per_solve, timeout, kwargs
+        )
+
+    try:
+        # Keep a couple of problems queued per worker, and the rest in order.
+        pending = {submit(position): position for position in order[: 2 * max_workers]}
+        queued = iter(order[2 * max_workers :])
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                position = pending.pop(future)
+                next_position = next(queued, None)
+                if next_position is not None:
+                    pending[submit(next_position)] = next_position
+                yield position, future.result()
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
@@ -1,20 +1,401 @@
 """VROOM input definition."""
 
 from __future__ import annotations
-from typing import Dict, Optional, Sequence, Set, Union
+from typing import (
+    Any,
+    BinaryIO,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    TextIO,
+    Tuple,
+    Union,
+)
 from pathlib import Path
 from datetime import timedelta
+from concurrent.futures import ThreadPoolExecutor
+import asyncio
+import functools
+import os
+import re
+import threading
+import weakref
 
 from numpy.typing import ArrayLike
 import numpy
+import pandas
 
 from .. import _vroom
 
+from . import problem_file
+from .routing_cache import RoutingCache, acquire_cache, release_cache
+from .routing_proxy import release_proxy, routing_proxy
 from ..amount import Amount
 from ..solution.solution import Solution
 from ..job import Job, Shipment, ShipmentStep
 from ..vehicle import Vehicle
 
+# Errors raised by the solver for vehicle steps it cannot follow, which
+# reject an initial solution rather than the problem itself.
+_SEED_ERRORS = re.compile(
+    r"(Route over (capacity|max_travel_time|max_distance)|Too many tasks"
+    r"|Invalid shipment in route|Infeasible route"
+    r"|Missing skill or step out of reach) for vehicle "
+)
+
+
+def _release_routing(
+    cache: Optional[RoutingCache],
+    proxies: Sequence[_vroom.Server],
+) -> None:
+    """Give back the routing proxies and cache of a collected input."""
+    for proxy in proxies:
+        release_proxy(proxy)
+    if cache is not None:
+        release_cache(cache)
+
+
+def _as_amounts(array: Optional[ArrayLike], name: str) -> Optional[numpy.ndarray]:
+    """Interpret one-dimensional amounts as one value per row."""
+    array = _as_integral(array, name, numpy.int64)
+    if array is None:
+        return None
+    return array[:, numpy.newaxis] if array.ndim == 1 else array
+
+
+def _as_integral(
+    array: Optional[ArrayLike],
+    name: str,
+    dtype: Optional[type] = None,
+) -> Optional[numpy.ndarray]:
+    """Check that values meant as integers have no fractional part.
+
+    With `dtype`, also check that the values fit the native integer type,
+    so that they are not silently wrapped or truncated when converted.
+    """
+    if array is None:
+        return None
+    array = numpy.asarray(array)
+    if array.dtype.kind == "f" and not numpy.all(numpy.mod(array, 1) == 0):
+        raise _vroom.VroomInputException(f"Non-integral values in {name}.")
+    if dtype is not None and array.size and array.dtype.kind in "iuf":
+        limits = numpy.iinfo(dtype)
+        if int(array.min()) < limits.min or int(array.max()) > limits.max:
+            raise _vroom.VroomInputException(f"Out of range values in {name}.")
+    return array
+
+
+def _as_limits(
+    array: Optional[ArrayLike],
+    name: str,
+) -> Tuple[Optional[numpy.ndarray], Optional[numpy.ndarray]]:
+    """Split optional limits into values and a mask of the rows that have one.
+
+    Rows are unbounded where a masked array is masked, where a nullable array
+    holds NA, and where a float array holds NaN.
+    """
+    if array is None:
+        return None, None
+    if isinstance(array, numpy.ma.MaskedArray):
+        valid = ~numpy.ma.getmaskarray(array)
+        array = array.filled(0)
+    else:
+        array = pandas.array(numpy.atleast_1d(array) if numpy.isscalar(array) else array)
+        valid = ~numpy.asarray(array.isna())
+        array = array.to_numpy(na_value=0)
+    return _as_integral(array, name), None if valid.all() else valid
+
+
+def _as_locations(
+    array: Optional[ArrayLike],
+) -> Tuple[Optional[numpy.ndarray], Optional[numpy.ndarray]]:
+    """Split locations into location indices and coordinates."""
+    if array is None:
+        return None, None
+    array = numpy.asarray(array)
+    return (array, None) if array.ndim == 1 else (None, array)
+
+
+def _as_skills(array: Optional[ArrayLike]) -> Dict[str, Optional[numpy.ndarray]]:
+    """Pass skills on as bitmasks, or flat if given as one collection per row.
+
+    Bitmasks only hold the skills below 64, while collections hold any. Flat
+    skills come with `skill_offsets` marking where the skills of each row
+    start.
+    """
+    skills = {"skills": None, "skill_values": None, "skill_offsets": None}
+    if array is None:
+        return skills
+    if getattr(array, "dtype", object) == object:
+        rows = list(array)
+        collections = [pandas.api.types.is_list_like(row) for row in rows]
+        if any(collections):
+            if not all(collections):
+                raise _vroom.VroomInputException("Skills given both as bitmasks and as lists.")
+            values = [skill for row in rows for skill in row]
+            skills["skill_values"] = _as_integral(values, "skills", numpy.uint32)
+            skills["skill_offsets"] = numpy.cumsum([0] + [len(row) for row in rows])
+            return skills
+    skills["skills"] = _as_integral(array, "skills", numpy.uint64)
+    return skills
+
+
+# Row-level frame columns that become plural keyword arguments.
+_PLURALS = ("id", "location", "profile", "description", "tw_start", "tw_end")
+
+# Values standing in for missing entries in nullable frame columns.
+_NA_DEFAULTS = {
+    "tw_start": 0,
+    "tw_end": 2**32 - 1,
+}
+
+# Nullable frame columns passed on as is, where missing means unbounded.
+_LIMITS = ("max_tasks", "max_travel_time", "max_distance")
+
+
+def _numbered_columns(columns: Sequence[str], name: str) -> Sequence[str]:
+    """Find `name` itself, or else the columns `{name}_0`, `{name}_1`, etc."""
+    if name in columns:
+        return [name]
+    return sorted(
+        (
+            column
+            for column in columns
+            if column.startswith(f"{name}_") and column[len(name) + 1 :].isdigit()
+        ),
+        key=lambda column: int(column[len(name) + 1 :]),
+    )
+
+
+def _from_frame(
+    frame: pandas.DataFrame,
+    amounts: Sequence[str] = (),
+    locations: Sequence[str] = (),
+    time_windows: Sequence[str] = (),
+) -> Dict[str, Any]:
+    """Convert frame columns into keyword arguments for the array ingestion.
+
+    Amounts are read either from a single column, or from the columns
+    `{name}_0`, `{name}_1`, etc. Locations are read either from an index
+    column, where missing values are allowed, or from the columns
+    `{name}_lon` and `{name}_lat`. Multiple time windows per row are read from
+    `{prefix}tw_start_0`, `{prefix}tw_end_0`, etc., where missing values pad
+    rows with fewer windows. Row-level columns like `id` are renamed to the
+    plural argument names.
+    """
+    kwargs: Dict[str, Any] = {}
+    columns = list(frame.columns)
+    for name in amounts:
+        names = _numbered_columns(columns, name)
+        if names:
+            kwargs[name] = frame[names].to_numpy(dtype="int64")
+            columns = [column for column in columns if column not in names]
+    for name in locations:
+        key = f"{name}s" if name.endswith("location") else name
+        if name in columns:
+            kwargs[key] = frame[name].astype("Int64").fillna(-1).to_numpy(dtype="int64")
+            columns.remove(name)
+        elif f"{name}_lon" in columns and f"{name}_lat" in columns:
+            kwargs[key] = frame[[f"{name}_lon", f"{name}_lat"]].to_numpy(dtype="float64")
+            columns = [c for c in columns if c not in (f"{name}_lon", f"{name}_lat")]
+    for prefix in time_windows:
+        starts = _numbered_columns(columns, f"{prefix}tw_start")
+        ends = _numbered_columns(columns, f"{prefix}tw_end")
+        if not starts:
+            continue
+        start = frame[starts].to_numpy(dtype="float64", na_value=numpy.nan)
+        end = frame[ends].to_numpy(dtype="float64", na_value=numpy.nan)
+        valid = ~numpy.isnan(start)
+        kwargs[f"{prefix}tw_starts"] = start[valid].astype("uint32")
+        kwargs[f"{prefix}tw_ends"] = end[valid].astype("uint32")
+        kwargs[f"{prefix}tw_offsets"] = numpy.concatenate([[0], numpy.cumsum(valid.sum(axis=1))])
+        columns = [column for column in columns if column not in starts + ends]
+    for name in columns:
+        values = frame[name]
+        if any(name == p or name.endswith(f"_{p}") for p in _PLURALS):
+            key = f"{name}s"
+        else:
+            key = name
+        if name.endswith(("description", "profile")):
+            kwargs[key] = values.astype(str).tolist()
+        elif name in _LIMITS:
+            kwargs[key] = values.array
+        elif values.hasnans:
+            default = _NA_DEFAULTS.get(name, 0)
+            array = values.fillna(0).to_numpy(dtype="uint64")
+            kwargs[key] = numpy.where(values.isna().to_numpy(), default, array)
+        else:
+            kwargs[key] = values.to_numpy()
+    return kwargs
+
+
+def _job_runs(
+    jobs: Optional[pandas.DataFrame],
+    shipments: Optional[pandas.DataFrame],
+) -> List[Tuple[str, pandas.DataFrame]]:
+    """Split job and shipment frames into runs to add one after the other.
+
+    If both frames are indexed by `rank`, the rows are interleaved in rank
+    order. Otherwise, all jobs come before all shipments.
+    """
+    frames = {
+        kind: frame
+        for kind, frame in (("jobs", jobs), ("shipments", shipments))
+        if frame is not None and len(frame)
+    }
+    if len(frames) < 2 or any(frame.index.name != "rank" for frame in frames.values()):
+        return list(frames.items())
+    ranks = numpy.concatenate([frame.index.to_numpy() for frame in frames.values()])
+    kinds = numpy.repeat(list(frames), [len(frame) for frame in frames.values()])
+    rows = numpy.concatenate([numpy.arange(len(frame)) for frame in frames.values()])
+    order = numpy.argsort(ranks, kind="stable")
+    kinds, rows = kinds[order], rows[order]
+    starts = numpy.flatnonzero(numpy.r_[True, kinds[1:] != kinds[:-1]])
+    stops = numpy.r_[starts[1:], len(kinds)]
+    return [
+        (kinds[start], frames[kinds[start]].iloc[rows[start:stop]]) for start, stop in zip(starts, stops)
+    ]
+
+
+def _as_matrix(
+    matrix_input: Union[ArrayLike, str, Path],
+    dtype: Optional[str] = None,
+    scale: int = 1,
+) -> Union[numpy.ndarray, _vroom.Matrix]:
+    """Prepare a matrix, memory-mapping it if given as a file path."""
+    if isinstance(matrix_input, _vroom.Matrix):
+        if scale == 1:
+            return matrix_input
+        matrix_input = numpy.asarray(matrix_input)
+    elif not isinstance(matrix_input, (str, Path)):
+        matrix_input = numpy.asarray(matrix_input, dtype=dtype)
+    elif Path(matrix_input).suffix == ".npy":
+        matrix_input = numpy.load(matrix_input, mmap_mode="r")
+    else:
+        path = Path(matrix_input)
+        itemsize = numpy.dtype(dtype or "uint32").itemsize
+        size = int(numpy.sqrt(path.stat().st_size // itemsize))
+        if size * size * itemsize != path.stat().st_size:
+            raise _vroom.VroomInputException(
+                f"{path} does not hold a square matrix of {dtype or 'uint32'} values."
+            )
+        matrix_input = numpy.memmap(path, dtype=dtype or "uint32", mode="r", shape=(size, size))
+    if scale != 1:
+        return _vroom.Matrix(matrix_input, scale=int(scale))
+    return matrix_input
+
+
+def _to_nullable(values: numpy.ndarray) -> pandas.arrays.IntegerArray:
+    """Convert an array with negative sentinels into a nullable column."""
+    values = numpy.asarray(values, dtype="int64")
+    return pandas.arrays.IntegerArray(values, values < 0)
+
+
+def _amount_columns(name: str, values: numpy.ndarray) -> Dict[str, numpy.ndarray]:
+    """Split amounts of shape `(n, k)` into one column per dimension."""
+    if values.shape[1] == 1:
+        return {name: values[:, 0]}
+    return {f"{name}_{idx}": values[:, idx] for idx in range(values.shape[1])}
+
+
+def _time_window_columns(
+    starts: numpy.ndarray,
+    ends: numpy.ndarray,
+    offsets: numpy.ndarray,
+) -> Dict[str, pandas.arrays.IntegerArray]:
+    """Spread flat time windows into nullable `tw_start_i`/`tw_end_i` columns."""
+    counts = numpy.diff(offsets)
+    height, width = len(counts), int(counts.max(initial=0))
+    rows = numpy.repeat(numpy.arange(height), counts)
+    ranks = numpy.arange(len(starts)) - numpy.repeat(offsets[:-1], counts)
+    columns = {}
+    for name, values in (("tw_start", starts), ("tw_end", ends)):
+        data = numpy.zeros((height, width), dtype="int64")
+        data[rows, ranks] = values
+        mask = numpy.ones((height, width), dtype=bool)
+        mask[rows, ranks] = False
+        for rank in range(width):
+            key = name if width == 1 else f"{name}_{rank}"
+            columns[key] = pandas.arrays.IntegerArray(data[:, rank], mask[:, rank])
+    return columns
+
+
+def _skills_column(skills: numpy.ndarray, offsets: numpy.ndarray) -> numpy.ndarray:
+    """Gather flat skills into bitmasks, or into sets if a skill is 64 or more."""
+    counts = numpy.diff(offsets)
+    if skills.max(initial=0) >= 64:
+        column = numpy.empty(len(counts), dtype=object)
+        column[:] = [set(skills[start:stop].tolist()) for start, stop in zip(offsets, offsets[1:])]
+        return column
+    bitmasks = numpy.zeros(len(counts), dtype="uint64")
+    rows = numpy.repeat(numpy.arange(len(counts)), counts)
+    numpy.bitwise_or.at(bitmasks, rows, numpy.left_shift(numpy.uint64(1), skills.astype("uint64")))
+    return bitmasks
+
+
+def _location_columns(columns: Dict[str, Any], name: str) -> Dict[str, Any]:
+    """Gather location columns, using `name` for the nullable index."""
+    return {
+        name: _to_nullable(columns[f"{name}_index"]),
+        f"{name}_lon": columns[f"{name}_lon"],
+        f"{name}_lat": columns[f"{name}_lat"],
+    }
+
+
+def _select_rows(frame: pandas.DataFrame, rows: numpy.ndarray) -> pandas.DataFrame:
+    """Select rows by rank and drop the columns left without any values."""
+    frame = frame[rows].dropna(axis=1, how="all")
+    frame.index = pandas.Index(numpy.flatnonzero(rows), name="rank")
+    return frame
+
+
+class _CoreBudget:
+    """Bound the total number of solver threads running at once."""
+
+    def __init__(self, cores: int) -> None:
+        self.cores = cores
+        self.used = 0
+        self._condition = threading.Condition()
+
+    def acquire(self, threads: int) -> int:
+        """Wait until `threads` cores are available and reserve them."""
+        threads = max(1, min(threads, self.cores))
+        with self._condition:
+            self._condition.wait_for(lambda: self.used + threads <= self.cores)
+            self.used += threads
+        return threads
+
+    def release(self, threads: int) -> None:
+        """Hand back reserved cores."""
+        with self._condition:
+            self.used -= threads
+            self._condition.notify_all()
+
+
+_ASYNC_CORES = _CoreBudget(os.cpu_count() or 1)
+_ASYNC_EXECUTOR = ThreadPoolExecutor(thread_name_prefix="vroom")
+
+
+def _exclusive(method: Callable[..., Any]) -> Callable[..., Any]:
+    """Refuse to run while another thread uses the same input."""
+
+    @functools.wraps(method)
+    def wrapper(self: Input, *args: Any, **kwargs: Any) -> Any:
+        if not self._busy.acquire(blocking=False):
+            raise RuntimeError(
+                f"{method.__name__} called while the input is in use by another "
+                "thread; fork it to solve or change it concurrently."
+            )
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            self._busy.release()
+
+    return wrapper
+
 
 class Input(_vroom.Input):
     """VROOM input definition.
@@ -23,6 +404,14 @@ class Input(_vroom.Input):
     matrice defining a routing problem. Duration matrices is if not provided
     can also be retrieved from a map server.
 
+    `solve` and `check` release the GIL while the native solver runs, so
+    other Python threads keep running in the meantime, and separate
+    instances can be solved from several threads at once. While an
+    instance is being solved or checked, including by a cancelled
+    `solve_async` that still runs in the background, solving, checking,
+    changing, forking or pickling it from another thread raises
+    `RuntimeError`. Use `fork` to work on copies concurrently.
+
     Attributes:
         jobs:
             Jobs that needs to be completed in the routing problem.
@@ -40,6 +429,9 @@ class Input(_vroom.Input):
         router: _vroom.ROUTER = _vroom.ROUTER.OSRM,
         apply_TSPFix: bool = False,
         geometry: bool = False,
+        cache: Optional[Union[RoutingCache, str, Path]] = None,
+        tile_size: Optional[int] = None,
+        max_connections: int = 8,
     ) -> None:
         """Class initializer.
 
@@ -56,7 +448,21 @@ class Input(_vroom.Input):
                 Experimental local search operator.
             geometry:
                 Add detailed route geometry and distance.
+            cache:
+                Keep the responses of the routing servers in a
+                `vroom.RoutingCache`, or in a SQLite file at the given path,
+                to skip the network round trip for repeated locations.
+                Inputs given the same path share one cache, which is closed
+                once the last of them is garbage collected.
+            tile_size:
+                Split matrix queries to the routing servers into tiles of at
+                most this many sources and targets, fetched concurrently.
+            max_connections:
+                Maximum number of concurrent connections per routing server
+                when fetching tiles.
         """
+        # Reentrant, as solving and adding rows call other guarded methods.
+        self._busy = threading.RLock()
         if servers is None:
             servers = {}
         for key, server in servers.items():
@@ -64,6 +470,26 @@ class Input(_vroom.Input):
                 servers[key] = _vroom.Server(*server.split(":"))
         self._servers = servers
         self._router = router
+        self._tile_size = tile_size
+        self._max_connections = max_connections
+        if cache is not None:
+            cache = acquire_cache(cache)
+        self._cache = cache
+        proxies = []
+        if cache is not None or tile_size is not None:
+            servers = {
+                key: routing_proxy(
+                    server,
+                    router,
+                    cache=cache,
+                    tile_size=tile_size,
+                    max_connections=max_connections,
+                )
+                for key, server in servers.items()
+            }
+            proxies = list(servers.values())
+        if cache is not None or proxies:
+            weakref.finalize(self, _release_routing, cache, proxies)
         _vroom.Input.__init__(
             self,
             servers=servers,
@@ -73,6 +499,120 @@ class Input(_vroom.Input):
         if geometry:
             self.set_geometry()
 
+    @_exclusive
+    def __getstate__(self) -> Dict[str, Any]:
+        """State for pickling.
+
+        Jobs and vehicles are stored as columnar arrays, and matrices as
+        views on the solver storage. With pickle protocol 5, all of them
+        can travel as out-of-band buffers.
+        """
+        cache = self._cache
+        if cache is not None and str(cache.path) == ":memory:":
+            cache = None
+        return {
+            "servers": {
+                profile: (server.host, server.port, server.path)
+                for profile, server in self._servers.items()
+            },
+            "router": self._router,
+            "apply_TSPFix": self.apply_TSPFix(),
+            "cache": None if cache is None else cache.path,
+            "tile_size": self._tile_size,
+            "max_connections": self._max_connections,
+            "distances": self._distances,
+            "native": self._state(),
+        }
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        """Restore from pickled state."""
+        self.__init__(
+            servers={profile: _vroom.Server(*server) for profile, server in state["servers"].items()},
+            router=state["router"],
+            apply_TSPFix=state["apply_TSPFix"],
+            cache=state["cache"],
+            tile_size=state["tile_size"],
+            max_connections=state["max_connections"],
+        )
+        self._geometry = state["native"]["geometry"]
+        self._distances = state["distances"]
+        self._load_state(state["native"])
+
+    def save(self, path: Union[str, Path]) -> None:
+        """Save problem to a binary file.
+
+        Unlike JSON, the matrices are written as raw sections, and jobs and
+        vehicles as columns, so that `load` is bounded by disk bandwidth
+        rather than by parsing. The routing configuration is saved along,
+        but not the routing cache itself.
+
+        Args:
+            path:
+                File to write to, overwritten if it exists.
+        """
+        state = self.__getstate__()
+        state["router"] = int(state["router"])
+        if state["cache"] is not None:
+            state["cache"] = str(state["cache"])
+        problem_file.write(path, state)
+
+    @classmethod
+    def load(cls, path: Union[str, Path], mmap: bool = True) -> Input:
+        """Load problem from a binary file written by `save`.
+
+        Args:
+            path:
+                File to read from.
+            mmap:
+                Map the file into memory instead of reading it, so that the
+                matrices are copied straight from the page cache into the
+                solver storage.
+
+        Returns:
+            Input instance as it was saved.
+        """
+        state = problem_file.read(path, mmap=mmap)
+        state["router"] = _vroom.ROUTER(state["router"])
+        instance = cls.__new__(cls)
+        instance.__setstate__(state)
+        return instance
+
+    @_exclusive
+    def fork(self) -> Input:
+        """Copy of the problem, to be changed and solved on its own.
+
+        Meant for what-if scenarios: the jobs, vehicles and matrices are
+        copied natively with the GIL released, without going through the
+        checks and location lookups of `add_job` and `add_vehicle`, and the
+        routing configuration and cache are shared with the original.
+        Since `solve` releases the GIL, forks can be solved concurrently
+        from several threads.
+
+        Returns:
+            Input instance independent of this one.
+
+        Example:
+            >>> problem_instance = vroom.Input()
+            >>> problem_instance.add_job([vroom.Job(1, location=1), vroom.Job(2, location=2)])
+            >>> scenario = problem_instance.fork()
+            >>> scenario.remove_job(2)
+            >>> len(scenario.jobs), len(problem_instance.jobs)
+            (1, 2)
+        """
+        instance = type(self).__new__(type(self))
+        instance.__init__(
+            servers=dict(self._servers),
+            router=self._router,
+            apply_TSPFix=self.apply_TSPFix(),
+            cache=self._cache,
+            tile_size=self._tile_size,
+            max_connections=self._max_connections,
+        )
+        instance._geometry = self._geometry
+        instance._distances = self._distances
+        instance._fork_from(self)
+        return instance
+
     def __repr__(self) -> str:
         """String representation."""
         args = []
@@ -85,16 +625,23 @@ class Input(_vroom.Input):
     @classmethod
     def from_json(
         cls,
-        filepath: Path,
+        filepath: Union[str, Path, bytes, BinaryIO, TextIO],
         servers: Optional[Dict[str, Union[str, _vroom.Server]]] = None,
         router: _vroom.ROUTER = _vroom.ROUTER.OSRM,
         geometry: Optional[bool] = None,
+        cache: Optional[Union[RoutingCache, str, Path]] = None,
     ) -> Input:
         """Load model from JSON file.
 
+        The JSON is handed to the native parser as raw bytes, without
+        decoding it into a Python string first, and the GIL is released
+        while parsing.
+
         Args:
             filepath:
-                Path to JSON file with problem definition.
+                Path to JSON file with problem definition, the JSON document
+                itself as `bytes`, or a file-like object to read it from in
+                chunks.
             servers:
                 Assuming no custom duration matrix is provided (from
                 `set_durations_matrix`), use coordinates and a map server to
@@ -107,25 +654,262 @@ class Input(_vroom.Input):
             geometry:
                 Use coordinates from server instead of from distance matrix.
                 If omitted, defaults to `servers is not None`.
+            cache:
+                Keep the routing server responses in a `vroom.RoutingCache`.
 
         Returns:
             Input instance with all jobs, shipments, etc. added from JSON.
 
+        Example:
+            >>> problem_instance = vroom.Input.from_json(
+            ...     b'{"vehicles": [{"id": 7, "start_index": 0}],'
+            ...     b' "jobs": [{"id": 1, "location_index": 1}],'
+            ...     b' "matrices": {"car": {"durations": [[0, 5], [5, 0]]}}}'
+            ... )
+            >>> problem_instance.solve(exploration_level=5, nb_threads=1).summary.cost
+            5
+        """
+        if geometry is None:
+            geometry = servers is not None
+        if geometry:
+            cls._set_geometry(True)
+        instance = Input(servers=servers, router=router, cache=cache)
+        if isinstance(filepath, (bytes, bytearray, memoryview)):
+            instance._from_json(filepath, geometry)
+        elif hasattr(filepath, "read"):
+            instance._from_json_stream(filepath, geometry)
+        else:
+            instance._from_json_file(os.fspath(filepath), geometry)
+        return instance
+
+    @classmethod
+    def from_dict(
+        cls,
+        problem: Dict[str, Any],
+        servers: Optional[Dict[str, Union[str, _vroom.Server]]] = None,
+        router: _vroom.ROUTER = _vroom.ROUTER.OSRM,
+        geometry: Optional[bool] = None,
+        cache: Optional[Union[RoutingCache, str, Path]] = None,
+    ) -> Input:
+        """Load model from a dictionary in the VROOM JSON layout.
+
+        The dictionary is written natively into the buffer read by the
+        parser, so that there is no need for `json.dumps`, and values may be
+        numpy arrays and scalars. Matrices skip JSON altogether and are set
+        with `set_durations_matrix` and friends.
+
+        Args:
+            problem:
+                Problem definition, as it would be read from JSON.
+            servers:
+                Assuming no custom duration matrix is provided, use
+                coordinates and a map server to calculate durations matrix.
+                See `from_json`.
+            router:
+                If servers is used, define what kind of server is provided.
+                See `vroom.ROUTER` enum for options.
+            geometry:
+                Use coordinates from server instead of from distance matrix.
+                If omitted, defaults to `servers is not None`.
+            cache:
+                Keep the routing server responses in a `vroom.RoutingCache`.
+
+        Returns:
+            Input instance with all jobs, shipments, etc. added.
+
+        Example:
+            >>> problem_instance = vroom.Input.from_dict({
+            ...     "vehicles": [{"id": 7, "start_index": 0}],
+            ...     "jobs": [{"id": 1, "location_index": 1}],
+            ...     "matrices": {"car": {"durations": numpy.array([[0, 5], [5, 0]])}},
+            ... })
+            >>> problem_instance.solve(exploration_level=5, nb_threads=1).summary.cost
+            5
         """
         if geometry is None:
             geometry = servers is not None
         if geometry:
             cls._set_geometry(True)
-        instance = Input(servers=servers, router=router)
-        with open(filepath) as handle:
-            instance._from_json(handle.read(), geometry)
+        instance = Input(servers=servers, router=router, cache=cache)
+        problem = dict(problem)
+        matrices = problem.pop("matrices", None)
+        matrix = problem.pop("matrix", None)
+        if matrices is None and matrix is not None:
+            # Deprecated key, read as the durations of the default profile.
+            matrices = {"car": {"durations": matrix}}
+        instance._from_dict(problem, geometry)
+        if matrices is not None:
+            if not isinstance(matrices, dict):
+                raise _vroom.VroomInputException("Unexpected matrices value.")
+            for profile, matrix in matrices.items():
+                if not isinstance(matrix, dict):
+                    continue
+                if "durations" in matrix:
+                    instance.set_durations_matrix(profile, matrix["durations"])
+                if "distances" in matrix:
+                    instance.set_distances_matrix(profile, matrix["distances"])
+                if "costs" in matrix:
+                    instance.set_costs_matrix(profile, matrix["costs"])
         return instance
 
+    @classmethod
+    def from_dataframe(
+        cls,
+        jobs: Optional[pandas.DataFrame] = None,
+        shipments: Optional[pandas.DataFrame] = None,
+        vehicles: Optional[pandas.DataFrame] = None,
+        **kwargs: Any,
+    ) -> Input:
+        """Create problem instance from data frames.
+
+        The frames have one row per job, shipment and vehicle respectively,
+        and the columns are the arguments of `add_jobs_from_arrays`,
+        `add_shipments_from_arrays` and `add_vehicles_from_arrays` in
+        singular form (`id`, `location`, `pickup_id`, `description`, etc.).
+        Amounts may be split across numbered columns like `capacity_0`,
+        `capacity_1`, coordinates given as `location_lon` and `location_lat`
+        pairs, and multiple time windows as `tw_start_0`, `tw_end_0`, etc.
+        Missing values fall back to the defaults of the corresponding
+        `vroom.Job` or `vroom.Vehicle` argument, and leave vehicle limits
+        like `max_travel_time` unbounded. If both the jobs and shipments
+        are indexed by `rank`, as exported by `to_dataframe`, they are added
+        in rank order, otherwise shipments come after jobs.
+
+        Args:
+            jobs:
+                Frame with the single jobs.
+            shipments:
+                Frame with the shipments, with the pickup and delivery
+                columns prefixed with `pickup_` and `delivery_`.
+            vehicles:
+                Frame with the vehicles.
+            kwargs:
+                Passed on to the `vroom.Input` initializer.
+
+        Returns:
+            Input instance with all rows added.
+
+        Example:
+            >>> problem_instance = vroom.Input.from_dataframe(
+            ...     jobs=pandas.DataFrame({"id": [1, 2], "location": [1, 2]}),
+            ...     vehicles=pandas.DataFrame({"id": [7], "start": [0]}),
+            ... )
+            >>> frames = problem_instance.to_dataframe()
+            >>> frames["jobs"][["id", "location"]].to_numpy().tolist()
+            [[1, 1], [2, 2]]
+        """
+        instance = cls(**kwargs)
+        if vehicles is not None and len(vehicles):
+            instance.add_vehicles_from_frame(vehicles)
+        for kind, frame in _job_runs(jobs, shipments):
+            if kind == "jobs":
+                instance.add_jobs_from_arrays(
+                    **_from_frame(
+                        frame,
+                        amounts=["delivery", "pickup"],
+                        locations=["location"],
+                        time_windows=[""],
+                    )
+                )
+            else:
+                instance.add_shipments_from_arrays(
+                    **_from_frame(
+                        frame,
+                        amounts=["amount"],
+                        locations=["pickup_location", "delivery_location"],
+                        time_windows=["pickup_", "delivery_"],
+                    )
+                )
+        return instance
+
+    @_exclusive
+    def to_dataframe(self) -> Dict[str, pandas.DataFrame]:
+        """Export jobs, shipments and vehicles as data frames.
+
+        The frames follow the layout read by `from_dataframe`, so that
+        `vroom.Input.from_dataframe(**problem_instance.to_dataframe())`
+        recreates the problem. Jobs and shipments are indexed by `rank`, the
+        position of the job or pickup in `jobs`, so that the order of the
+        jobs survives the round trip. Columns without any values, like
+        coordinates that are not set or time windows that are all defaults,
+        are left out. Skills are exported as bitmasks, or as one set of skills
+        per row if any skill is 64 or more.
+        Vehicle speed factors, costs per task hour, breaks and steps, as well
+        as setup and service durations per vehicle type, are not exported.
+
+        Returns:
+            Mapping with the frames `"jobs"`, `"shipments"` and `"vehicles"`.
+        """
+        columns = self._jobs_columns()
+        types = columns["type"]
+        frame = pandas.DataFrame(
+            {
+                "id": columns["id"],
+                **_location_columns(columns, "location"),
+                "default_setup": columns["default_setup"],
+                "default_service": columns["default_service"],
+                **_amount_columns("delivery", columns["delivery"]),
+                **_amount_columns("pickup", columns["pickup"]),
+                "skills": _skills_column(columns["skills"], columns["skill_offsets"]),
+                "priority": columns["priority"],
+                **_time_window_columns(columns["tw_starts"], columns["tw_ends"], columns["tw_offsets"]),
+                "description": columns["description"],
+            }
+        )
+        jobs = _select_rows(frame, types == int(_vroom.JOB_TYPE.SINGLE))
+
+        pickups = _select_rows(frame, types == int(_vroom.JOB_TYPE.PICKUP))
+        # Deliveries directly follow their pickup, and share its rank here.
+        deliveries = _select_rows(frame, types == int(_vroom.JOB_TYPE.DELIVERY))
+        deliveries.index = pickups.index
+        shared = [
+            column
+            for column in pickups.columns
+            if column.startswith(("delivery", "pickup")) or column in ("skills", "priority")
+        ]
+        shipments = pandas.concat(
+            [
+                pickups.drop(columns=shared).add_prefix("pickup_"),
+                deliveries.drop(
+                    columns=[column for column in shared if column in deliveries]
+                ).add_prefix("delivery_"),
+                pickups[[column for column in shared if column.startswith("pickup")]].rename(
+                    columns=lambda column: "amount" + column[len("pickup") :]
+                ),
+                pickups[[column for column in ("skills", "priority") if column in pickups]],
+            ],
+            axis=1,
+        )
+
+        columns = self._vehicles_columns()
+        vehicles = pandas.DataFrame(
+            {
+                "id": columns["id"],
+                **_location_columns(columns, "start"),
+                **_location_columns(columns, "end"),
+                "profile": columns["profile"],
+                **_amount_columns("capacity", columns["capacity"]),
+                "skills": _skills_column(columns["skills"], columns["skill_offsets"]),
+                "tw_start": _to_nullable(columns["tw_start"]),
+                "tw_end": _to_nullable(columns["tw_end"]),
+                "cost_fixed": columns["cost_fixed"],
+                "cost_per_hour": columns["cost_per_hour"],
+                "cost_per_km": columns["cost_per_km"],
+                "max_tasks": _to_nullable(columns["max_tasks"]),
+                "max_travel_time": _to_nullable(columns["max_travel_time"]),
+                "max_distance": _to_nullable(columns["max_distance"]),
+                "description": columns["description"],
+            }
+        ).dropna(axis=1, how="all")
+        return {"jobs": jobs, "shipments": shipments, "vehicles": vehicles}
+
+    @_exclusive
     def set_geometry(self):
         """Add detailed route geometry and distance."""
         self._geometry = True
         return self._set_geometry(True)
 
+    @_exclusive
     def add_job(
         self,
         job: Union[Job, Shipment, Sequence[Job], Sequence[Shipment]],
@@ -190,10 +974,9 @@ class Input(_vroom.Input):
                 )
 
             else:
-                raise _vroom.VroomInputException(
-                    f"Wrong type for {job_}; vroom.JobSingle expected."
-                )
+                raise _vroom.VroomInputException(f"Wrong type for {job_}; vroom.JobSingle expected.")
 
+    @_exclusive
     def add_shipment(
         self,
         pickup: ShipmentStep,
@@ -253,6 +1036,198 @@ class Input(_vroom.Input):
             ),
         )
 
+    @_exclusive
+    def add_jobs_from_arrays(
+        self,
+        ids: ArrayLike,
+        locations: ArrayLike,
+        default_setup: Optional[ArrayLike] = None,
+        default_service: Optional[ArrayLike] = None,
+        delivery: Optional[ArrayLike] = None,
+        pickup: Optional[ArrayLike] = None,
+        skills: Optional[ArrayLike] = None,
+        priority: Optional[ArrayLike] = None,
+        tw_starts: Optional[ArrayLike] = None,
+        tw_ends: Optional[ArrayLike] = None,
+        tw_offsets: Optional[ArrayLike] = None,
+        descriptions: Optional[Sequence[str]] = None,
+    ) -> None:
+        """Add many jobs at once from columnar arrays.
+
+        Equivalent to calling `add_job` with one `vroom.Job` per row, but the
+        jobs are built natively without creating intermediate Python objects.
+        All arrays are indexed by job, except the time windows which are
+        stored flat with `tw_offsets` marking where each job's windows start.
+
+        Args:
+            ids:
+                Job identifier numbers, shape `(n,)`.
+            locations:
+                Either location indices with shape `(n,)`, or longitude and
+                latitude coordinates with shape `(n, 2)`.
+            default_setup:
+                Setup durations, shape `(n,)`. Defaults to zero.
+            default_service:
+                Service durations, shape `(n,)`. Defaults to zero.
+            delivery:
+                Amounts carried to customers, shape `(n, k)`.
+            pickup:
+                Amounts carried back from customers, shape `(n, k)`.
+            skills:
+                Required skills as bitmasks, shape `(n,)`, where bit `i` set
+                means skill `i` is required, or one collection of skills per
+                job, which also holds skills of 64 and more.
+            priority:
+                Job priority levels, shape `(n,)`. Defaults to zero.
+            tw_starts:
+                Start of all time windows, flattened.
+            tw_ends:
+                End of all time windows, flattened.
+            tw_offsets:
+                Offsets into `tw_starts` and `tw_ends`, shape `(n+1,)`. Job
+                `i` has the windows `tw_offsets[i]:tw_offsets[i+1]`, and no
+                constraints if the slice is empty. If omitted, each job has
+                exactly one time window.
+            descriptions:
+                Optional strings describing the jobs.
+
+        Example:
+            >>> problem_instance = vroom.Input()
+            >>> problem_instance.add_jobs_from_arrays(
+            ...     ids=[1, 2, 3],
+            ...     locations=[1, 2, 3],
+            ...     delivery=[[1], [2], [3]],
+            ...     tw_starts=[0, 100, 0],
+            ...     tw_ends=[50, 200, 300],
+            ...     tw_offsets=[0, 2, 2, 3],
+            ... )
+            >>> len(problem_instance.jobs)
+            3
+            >>> vroom.TimeWindow(problem_instance.jobs[0]._time_windows[1])
+            vroom.TimeWindow(100, 200)
+        """
+        location_indices, coordinates = _as_locations(locations)
+        self._add_jobs_from_arrays(
+            ids=_as_integral(numpy.atleast_1d(ids), "ids", numpy.uint64),
+            location_indices=location_indices,
+            coordinates=coordinates,
+            default_setup=_as_integral(default_setup, "default_setup", numpy.uint32),
+            default_service=_as_integral(default_service, "default_service", numpy.uint32),
+            delivery=_as_amounts(delivery, "delivery"),
+            pickup=_as_amounts(pickup, "pickup"),
+            **_as_skills(skills),
+            priority=_as_integral(priority, "priority", numpy.uint32),
+            tw_starts=_as_integral(tw_starts, "tw_starts", numpy.uint32),
+            tw_ends=_as_integral(tw_ends, "tw_ends", numpy.uint32),
+            tw_offsets=tw_offsets,
+            descriptions=None if descriptions is None else list(descriptions),
+        )
+
+    @_exclusive
+    def add_shipments_from_arrays(
+        self,
+        pickup_ids: ArrayLike,
+        pickup_locations: ArrayLike,
+        delivery_ids: ArrayLike,
+        delivery_locations: ArrayLike,
+        amount: Optional[ArrayLike] = None,
+        skills: Optional[ArrayLike] = None,
+        priority: Optional[ArrayLike] = None,
+        pickup_default_setup: Optional[ArrayLike] = None,
+        pickup_default_service: Optional[ArrayLike] = None,
+        pickup_tw_starts: Optional[ArrayLike] = None,
+        pickup_tw_ends: Optional[ArrayLike] = None,
+        pickup_tw_offsets: Optional[ArrayLike] = None,
+        pickup_descriptions: Optional[Sequence[str]] = None,
+        delivery_default_setup: Optional[ArrayLike] = None,
+        delivery_default_service: Optional[ArrayLike] = None,
+        delivery_tw_starts: Optional[ArrayLike] = None,
+        delivery_tw_ends: Optional[ArrayLike] = None,
+        delivery_tw_offsets: Optional[ArrayLike] = None,
+        delivery_descriptions: Optional[Sequence[str]] = None,
+    ) -> None:
+        """Add many shipments at once from columnar arrays.
+
+        Equivalent to calling `add_shipment` once per row. The `pickup_*`
+        and `delivery_*` arguments describe the two steps of each shipment
+        the same way as the arguments of `add_jobs_from_arrays`.
+
+        Args:
+            pickup_ids:
+                Pickup identifier numbers, shape `(n,)`.
+            pickup_locations:
+                Either location indices with shape `(n,)`, or longitude and
+                latitude coordinates with shape `(n, 2)`.
+            delivery_ids:
+                Delivery identifier numbers, shape `(n,)`.
+            delivery_locations:
+                Same as `pickup_locations`, but for the deliveries.
+            amount:
+                Amounts being carried, shape `(n, k)`.
+            skills:
+                Required skills as for `add_jobs_from_arrays`.
+            priority:
+                Shipment priority levels, shape `(n,)`. Defaults to zero.
+            pickup_default_setup, delivery_default_setup:
+                Setup durations, shape `(n,)`. Defaults to zero.
+            pickup_default_service, delivery_default_service:
+                Service durations, shape `(n,)`. Defaults to zero.
+            pickup_tw_starts, pickup_tw_ends, pickup_tw_offsets:
+                Flat time windows of the pickups, see `add_jobs_from_arrays`.
+            delivery_tw_starts, delivery_tw_ends, delivery_tw_offsets:
+                Flat time windows of the deliveries.
+            pickup_descriptions, delivery_descriptions:
+                Optional strings describing the steps.
+
+        Example:
+            >>> problem_instance = vroom.Input()
+            >>> problem_instance.add_shipments_from_arrays(
+            ...     pickup_ids=[1, 2],
+            ...     pickup_locations=[0, 0],
+            ...     delivery_ids=[3, 4],
+            ...     delivery_locations=[1, 2],
+            ...     amount=[5, 6],
+            ... )
+            >>> [job._id for job in problem_instance.jobs]
+            [1, 3, 2, 4]
+        """
+        pickup_indices, pickup_coordinates = _as_locations(pickup_locations)
+        delivery_indices, delivery_coordinates = _as_locations(delivery_locations)
+        self._add_shipments_from_arrays(
+            pickup_ids=_as_integral(numpy.atleast_1d(pickup_ids), "pickup_ids", numpy.uint64),
+            pickup_location_indices=pickup_indices,
+            pickup_coordinates=pickup_coordinates,
+            pickup_default_setup=_as_integral(
+                pickup_default_setup, "pickup_default_setup", numpy.uint32
+            ),
+            pickup_default_service=_as_integral(
+                pickup_default_service, "pickup_default_service", numpy.uint32
+            ),
+            pickup_tw_starts=_as_integral(pickup_tw_starts, "pickup_tw_starts", numpy.uint32),
+            pickup_tw_ends=_as_integral(pickup_tw_ends, "pickup_tw_ends", numpy.uint32),
+            pickup_tw_offsets=pickup_tw_offsets,
+            pickup_descriptions=(None if pickup_descriptions is None else list(pickup_descriptions)),
+            delivery_ids=_as_integral(numpy.atleast_1d(delivery_ids), "delivery_ids", numpy.uint64),
+            delivery_location_indices=delivery_indices,
+            delivery_coordinates=delivery_coordinates,
+            delivery_default_setup=_as_integral(
+                delivery_default_setup, "delivery_default_setup", numpy.uint32
+            ),
+            delivery_default_service=_as_integral(
+                delivery_default_service, "delivery_default_service", numpy.uint32
+            ),
+            delivery_tw_starts=_as_integral(delivery_tw_starts, "delivery_tw_starts", numpy.uint32),
+            delivery_tw_ends=_as_integral(delivery_tw_ends, "delivery_tw_ends", numpy.uint32),
+            delivery_tw_offsets=delivery_tw_offsets,
+            delivery_descriptions=(
+                None if delivery_descriptions is None else list(delivery_descriptions)
+            ),
+            amount=_as_amounts(amount, "amount"),
+            **_as_skills(skills),
+            priority=_as_integral(priority, "priority", numpy.uint32),
+        )
+
+    @_exclusive
     def add_vehicle(
         self,
         vehicle: Union[Vehicle, Sequence[Vehicle]],
@@ -271,10 +1246,232 @@ class Input(_vroom.Input):
         for vehicle_ in vehicles:
             self._add_vehicle(vehicle_)
 
+    @_exclusive
+    def add_vehicles_from_arrays(
+        self,
+        ids: ArrayLike,
+        start: Optional[ArrayLike] = None,
+        end: Optional[ArrayLike] = None,
+        profiles: Union[str, Sequence[str]] = "car",
+        capacity: Optional[ArrayLike] = None,
+        skills: Optional[ArrayLike] = None,
+        tw_starts: Optional[ArrayLike] = None,
+        tw_ends: Optional[ArrayLike] = None,
+        cost_fixed: Optional[ArrayLike] = None,
+        cost_per_hour: Optional[ArrayLike] = None,
+        cost_per_km: Optional[ArrayLike] = None,
+        speed_factor: Optional[ArrayLike] = None,
+        max_tasks: Optional[ArrayLike] = None,
+        max_travel_time: Optional[ArrayLike] = None,
+        max_distance: Optional[ArrayLike] = None,
+        descriptions: Optional[Sequence[str]] = None,
+    ) -> None:
+        """Add a fleet of vehicles at once from columnar arrays.
+
+        Equivalent to calling `add_vehicle` with one `vroom.Vehicle` per row,
+        but the vehicles are built natively without creating intermediate
+        Python objects. Vehicles with breaks or predefined steps have to be
+        added through `add_vehicle`.
+
+        Args:
+            ids:
+                Vehicle identifier numbers, shape `(n,)`.
+            start:
+                Either location indices with shape `(n,)`, where negative
+                values means no start, or longitude and latitude coordinates
+                with shape `(n, 2)`, where NaN means no start.
+            end:
+                Same as `start`, but for where the vehicles end up.
+            profiles:
+                The profile of each vehicle, or a single profile for all.
+            capacity:
+                Capacities of the vehicles, shape `(n, k)`.
+            skills:
+                Provided skills as bitmasks, shape `(n,)`, where bit `i` set
+                means skill `i` is provided, or one collection of skills per
+                vehicle, which also holds skills of 64 and more.
+            tw_starts:
+                Start of the vehicle time windows, shape `(n,)`.
+            tw_ends:
+                End of the vehicle time windows, shape `(n,)`.
+            cost_fixed:
+                Fixed price for using each vehicle, shape `(n,)`.
+            cost_per_hour:
+                Price per hour for each vehicle, shape `(n,)`.
+            cost_per_km:
+                Price per kilometer for each vehicle, shape `(n,)`.
+            speed_factor:
+                Speed factor of each vehicle, shape `(n,)`.
+            max_tasks:
+                Maximum number of tasks of each vehicle, shape `(n,)`.
+                Vehicles are left unbounded where the array is masked, NA
+                or NaN.
+            max_travel_time:
+                Maximum travel time of each vehicle, shape `(n,)`, with
+                missing values as for `max_tasks`.
+            max_distance:
+                Maximum distance of each vehicle, shape `(n,)`, with missing
+                values as for `max_tasks`.
+            descriptions:
+                Optional strings describing the vehicles.
+
+        Example:
+            >>> problem_instance = vroom.Input()
+            >>> problem_instance.add_vehicles_from_arrays(
+            ...     ids=[47, 48],
+            ...     start=[0, 2],
+            ...     end=[0, -1],
+            ...     capacity=[[4, 10], [8, 20]],
+            ... )
+            >>> [vehicle._end is None for vehicle in problem_instance.vehicles]
+            [False, True]
+        """
+        ids = _as_integral(numpy.atleast_1d(ids), "ids", numpy.uint64)
+        if isinstance(profiles, str):
+            profiles = [profiles] * len(ids)
+        start_indices, start_coordinates = _as_locations(start)
+        end_indices, end_coordinates = _as_locations(end)
+        max_tasks, max_tasks_valid = _as_limits(max_tasks, "max_tasks")
+        max_travel_time, max_travel_time_valid = _as_limits(max_travel_time, "max_travel_time")
+        max_distance, max_distance_valid = _as_limits(max_distance, "max_distance")
+        self._add_vehicles_from_arrays(
+            ids=ids,
+            start_indices=start_indices,
+            start_coordinates=start_coordinates,
+            end_indices=end_indices,
+            end_coordinates=end_coordinates,
+            profiles=list(profiles),
+            capacity=_as_amounts(capacity, "capacity"),
+            **_as_skills(skills),
+            tw_starts=_as_integral(tw_starts, "tw_starts", numpy.uint32),
+            tw_ends=_as_integral(tw_ends, "tw_ends", numpy.uint32),
+            cost_fixed=_as_integral(cost_fixed, "cost_fixed", numpy.uint32),
+            cost_per_hour=_as_integral(cost_per_hour, "cost_per_hour", numpy.uint32),
+            cost_per_km=_as_integral(cost_per_km, "cost_per_km", numpy.uint32),
+            speed_factor=speed_factor,
+            max_tasks=max_tasks,
+            max_tasks_valid=max_tasks_valid,
+            max_travel_time=max_travel_time,
+            max_travel_time_valid=max_travel_time_valid,
+            max_distance=max_distance,
+            max_distance_valid=max_distance_valid,
+            descriptions=None if descriptions is None else list(descriptions),
+        )
+
+    def add_vehicles_from_frame(self, frame: pandas.DataFrame) -> None:
+        """Add a fleet of vehicles at once from a data frame.
+
+        The columns are the arguments of `add_vehicles_from_arrays`, except
+        that `id`, `profile`, `tw_start`, `tw_end` and `description` are
+        singular. The capacity can also be split across the columns
+        `capacity_0`, `capacity_1`, etc., and coordinates be given as
+        `start_lon`, `start_lat`, `end_lon` and `end_lat`. Missing values in
+        nullable columns fall back to the `vroom.Vehicle` defaults.
+
+        Args:
+            frame:
+                One row per vehicle.
+
+        Example:
+            >>> fleet = pandas.DataFrame({
+            ...     "id": [47, 48],
+            ...     "start": pandas.array([0, None], dtype="Int64"),
+            ...     "end": [0, 2],
+            ...     "capacity_0": [4, 8],
+            ...     "capacity_1": [10, 20],
+            ...     "cost_fixed": [100, 0],
+            ... })
+            >>> problem_instance = vroom.Input()
+            >>> problem_instance.add_vehicles_from_frame(fleet)
+            >>> numpy.asarray(problem_instance.vehicles[1]._capacity).tolist()
+            [8, 20]
+        """
+        self.add_vehicles_from_arrays(
+            **_from_frame(frame, amounts=["capacity"], locations=["start", "end"])
+        )
+
+    @_exclusive
+    def remove_job(self, id: int) -> None:
+        """Remove a (single) job.
+
+        The job and vehicle lookups are kept up to date without rebuilding
+        the problem, and the matrices are left as they are.
+
+        Args:
+            id:
+                Identifier of the job to remove.
+
+        Example:
+            >>> problem_instance = vroom.Input()
+            >>> problem_instance.add_job([vroom.Job(1, location=1), vroom.Job(2, location=2)])
+            >>> problem_instance.remove_job(1)
+            >>> [job._id for job in problem_instance.jobs]
+            [2]
+        """
+        self._remove_job(id)
+
+    @_exclusive
+    def remove_shipment(self, pickup_id: int) -> None:
+        """Remove a shipment, both its pickup and its delivery.
+
+        Args:
+            pickup_id:
+                Identifier of the pickup of the shipment to remove.
+        """
+        self._remove_shipment(pickup_id)
+
+    @_exclusive
+    def update_job(self, id: int, job: Job) -> None:
+        """Replace a (single) job, keeping its place among the jobs.
+
+        Args:
+            id:
+                Identifier of the job to replace.
+            job:
+                The new job, which may have another identifier as long as it
+                is not taken.
+
+        Example:
+            >>> problem_instance = vroom.Input()
+            >>> problem_instance.add_job(vroom.Job(1, location=1))
+            >>> problem_instance.update_job(1, vroom.Job(1, location=2))
+            >>> problem_instance.jobs[0]._location._index()
+            2
+        """
+        if not isinstance(job, Job):
+            raise _vroom.VroomInputException(f"Wrong type for {job}; vroom.Job expected.")
+        self._update_job(id, job)
+
+    @_exclusive
+    def remove_vehicle(self, id: int) -> None:
+        """Remove a vehicle.
+
+        Args:
+            id:
+                Identifier of the vehicle to remove.
+        """
+        self._remove_vehicle(id)
+
+    @_exclusive
+    def update_vehicle(self, id: int, vehicle: Vehicle) -> None:
+        """Replace a vehicle, keeping its place among the vehicles.
+
+        Args:
+            id:
+                Identifier of the vehicle to replace.
+            vehicle:
+                The new vehicle, under the same constraints as in
+                `add_vehicle`.
+        """
+        self._update_vehicle(id, vehicle)
+
+    @_exclusive
     def set_durations_matrix(
         self,
         profile: str,
-        matrix_input: ArrayLike,
+        matrix_input: Union[ArrayLike, str, Path],
+        dtype: Optional[str] = None,
+        scale: int = 1,
     ) -> None:
         """Set durations matrix.
 
@@ -285,16 +1482,32 @@ class Input(_vroom.Input):
             matrix_input:
                 A square matrix consisting of duration between each location of
                 interest. Diagonal is canonically set to 0.
+                Arrays of any integer type and memory layout are cast
+                directly into the solver storage in a single pass, and a
+                `_vroom.Matrix` is moved into the problem without copying and
+                must not be reused afterwards. A path to a `.npy` file or a
+                raw file of native `dtype` values is memory-mapped and read
+                from the page cache.
+            dtype:
+                Element type the matrix is stored in, typically "uint32" or
+                the compact "uint16". Used to read raw files and to convert
+                sequences; arrays that already are `uint16` are widened
+                natively while filling the solver matrix.
+            scale:
+                Factor the stored values are multiplied with, e.g. 10 for a
+                `uint16` matrix in units of 10 seconds.
         """
         assert isinstance(profile, str)
-        if not isinstance(matrix_input, _vroom.Matrix):
-            matrix_input = _vroom.Matrix(numpy.asarray(matrix_input, dtype="uint32"))
+        matrix_input = _as_matrix(matrix_input, dtype=dtype, scale=scale)
         self._set_durations_matrix(profile, matrix_input)
 
+    @_exclusive
     def set_distances_matrix(
         self,
         profile: str,
-        matrix_input: ArrayLike,
+        matrix_input: Union[ArrayLike, str, Path],
+        dtype: Optional[str] = None,
+        scale: int = 1,
     ) -> None:
         """Set distances matrix.
 
@@ -305,17 +1518,33 @@ class Input(_vroom.Input):
             matrix_input:
                 A square matrix consisting of distances between each location of
                 interest. Diagonal is canonically set to 0.
+                Arrays of any integer type and memory layout are cast
+                directly into the solver storage in a single pass, and a
+                `_vroom.Matrix` is moved into the problem without copying and
+                must not be reused afterwards. A path to a `.npy` file or a
+                raw file of native `dtype` values is memory-mapped and read
+                from the page cache.
+            dtype:
+                Element type the matrix is stored in, typically "uint32" or
+                the compact "uint16". Used to read raw files and to convert
+                sequences; arrays that already are `uint16` are widened
+                natively while filling the solver matrix.
+            scale:
+                Factor the stored values are multiplied with, e.g. 10 for a
+                `uint16` matrix in units of 10 seconds.
         """
         assert isinstance(profile, str)
-        if not isinstance(matrix_input, _vroom.Matrix):
-            matrix_input = _vroom.Matrix(numpy.asarray(matrix_input, dtype="uint32"))
+        matrix_input = _as_matrix(matrix_input, dtype=dtype, scale=scale)
         self._set_distances_matrix(profile, matrix_input)
         self._distances = True
 
+    @_exclusive
     def set_costs_matrix(
         self,
         profile: str,
-        matrix_input: ArrayLike,
+        matrix_input: Union[ArrayLike, str, Path],
+        dtype: Optional[str] = None,
+        scale: int = 1,
     ) -> None:
         """Set costs matrix.
 
@@ -326,12 +1555,26 @@ class Input(_vroom.Input):
             matrix_input:
                 A square matrix consisting of duration between each location of
                 interest. Diagonal is canonically set to 0.
+                Arrays of any integer type and memory layout are cast
+                directly into the solver storage in a single pass, and a
+                `_vroom.Matrix` is moved into the problem without copying and
+                must not be reused afterwards. A path to a `.npy` file or a
+                raw file of native `dtype` values is memory-mapped and read
+                from the page cache.
+            dtype:
+                Element type the matrix is stored in, typically "uint32" or
+                the compact "uint16". Used to read raw files and to convert
+                sequences; arrays that already are `uint16` are widened
+                natively while filling the solver matrix.
+            scale:
+                Factor the stored values are multiplied with, e.g. 10 for a
+                `uint16` matrix in units of 10 seconds.
         """
         assert isinstance(profile, str)
-        if not isinstance(matrix_input, _vroom.Matrix):
-            matrix_input = _vroom.Matrix(numpy.asarray(matrix_input, dtype="uint32"))
+        matrix_input = _as_matrix(matrix_input, dtype=dtype, scale=scale)
         self._set_costs_matrix(profile, matrix_input)
 
+    @_exclusive
     def check(
         self,
         nb_threads: int = 1,
@@ -344,7 +1587,8 @@ class Input(_vroom.Input):
         any violations.
 
         Vehicles must have predefined steps (``VehicleStep``)
-        assigned before calling this method.
+        assigned before calling this method. The GIL is released
+        while checking; see the class notes on thread safety.
 
         Args:
             nb_threads:
@@ -354,20 +1598,118 @@ class Input(_vroom.Input):
             A Solution containing per-step ETAs and any
             violations.
         """
-        solution = Solution(self._check(nb_thread=int(nb_threads)))
+        solution = Solution._from_native(self._check(nb_thread=int(nb_threads)))
         solution._geometry = self._geometry
         solution._distances = self._distances
         return solution
 
+    async def check_async(self, nb_threads: int = 1) -> Solution:
+        """Check predefined vehicle routes without blocking the event loop.
+
+        Same as `check`, but run on a shared thread pool; see `solve_async`
+        for how concurrency and cancellation are handled.
+
+        Args:
+            nb_threads:
+                The number of threads to use.
+
+        Returns:
+            A Solution containing per-step ETAs and any violations.
+        """
+        return await self._run_async(self.check, nb_threads, nb_threads=nb_threads)
+
+    async def solve_async(
+        self,
+        exploration_level: int,
+        nb_threads: int = 4,
+        timeout: Optional[timedelta] = None,
+        depth: Optional[int] = None,
+        initial_solution: Optional[Solution] = None,
+        nb_searches: Optional[int] = None,
+    ) -> Solution:
+        """Solve routing problem without blocking the event loop.
+
+        Same as `solve`, but run on a shared thread pool with the GIL
+        released. Solves wait for their turn so that the `nb_threads` of all
+        running solves never exceed the number of CPU cores.
+
+        Cancelling the awaiting task returns immediately. A solve still
+        waiting for its turn is dropped, but one already running cannot be
+        interrupted and finishes in the background, or at `timeout`, while
+        keeping its cores reserved.
+
+        Args:
+            exploration_level:
+                The exploration level to use. Number between 1 and 5.
+            nb_threads:
+                The number of available threads.
+            timeout:
+                Stop the solving process after a given amount of time.
+            depth:
+                Local search depth, see `solve`.
+            initial_solution:
+                Warm start from a previous solution, see `solve`.
+            nb_searches:
+                Number of searches, see `solve`.
+
+        Example:
+            >>> problem_instance = vroom.Input()
+            >>> problem_instance.set_durations_matrix("car", [[0, 3], [2, 0]])
+            >>> problem_instance.add_vehicle(vroom.Vehicle(7, start=0, end=0))
+            >>> problem_instance.add_job(vroom.Job(1, location=1))
+            >>> solution = asyncio.run(problem_instance.solve_async(exploration_level=5))
+            >>> solution.summary.cost
+            5
+        """
+        return await self._run_async(
+            self.solve,
+            nb_threads,
+            exploration_level=exploration_level,
+            nb_threads=nb_threads,
+            timeout=timeout,
+            depth=depth,
+            initial_solution=initial_solution,
+            nb_searches=nb_searches,
+        )
+
+    async def _run_async(
+        self,
+        method: Callable[..., Solution],
+        cores: int,
+        **kwargs: Any,
+    ) -> Solution:
+        """Run a native solve or check on the shared thread pool."""
+        cancelled = threading.Event()
+
+        def run() -> Optional[Solution]:
+            reserved = _ASYNC_CORES.acquire(int(cores))
+            try:
+                return None if cancelled.is_set() else method(**kwargs)
+            finally:
+                _ASYNC_CORES.release(reserved)
+
+        loop = asyncio.get_running_loop()
+        try:
+            return await loop.run_in_executor(_ASYNC_EXECUTOR, run)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    @_exclusive
     def solve(
         self,
         exploration_level: int,
         nb_threads: int = 4,
         timeout: Optional[timedelta] = None,
         depth: Optional[int] = None,
+        initial_solution: Optional[Solution] = None,
+        nb_searches: Optional[int] = None,
     ) -> Solution:
         """Solve routing problem.
 
+        The GIL is released while solving; see the class notes on thread
+        safety.
+
         Args:
             exploration_level:
                 The exploration level to use. Number between 1 and 5.
@@ -375,18 +1717,79 @@ class Input(_vroom.Input):
                 The number of available threads.
             timeout:
                 Stop the solving process after a given amount of time.
+            depth:
+                Depth of the local search run from each initial solution.
+                Defaults to the one of `exploration_level`, which is the
+                exploration level itself.
+            initial_solution:
+                Warm start from a previous solution, typically of the same
+                problem before a few jobs were added or cancelled. Its routes
+                are given to the solver as vehicle steps, replacing any steps
+                set on the vehicles for this solve. Jobs and vehicles that no
+                longer exist are left out, and so are shipments missing
+                their pickup or delivery. If the solver rejects the routes
+                as no longer feasible, the problem is solved from scratch
+                instead; other input errors are raised straight away.
+            nb_searches:
+                Number of initial solutions built by different heuristics,
+                each improved by a local search, the best of which is kept.
+                Defaults to the one of `exploration_level`, see
+                `vroom.get_nb_searches`. Searches beyond the number of
+                available heuristics are ignored.
+
+        Example:
+            >>> problem_instance = vroom.Input()
+            >>> problem_instance.set_durations_matrix(
+            ...     profile="car",
+            ...     matrix_input=[[0, 2104, 197, 1299],
+            ...                   [2103, 0, 2255, 3152],
+            ...                   [197, 2256, 0, 1102],
+            ...                   [1299, 3153, 1102, 0]],
+            ... )
+            >>> problem_instance.add_vehicle([vroom.Vehicle(47, start=0, end=0)])
+            >>> problem_instance.add_job([vroom.Job(1414, location=1),
+            ...                           vroom.Job(1515, location=2)])
+            >>> previous = problem_instance.solve(exploration_level=5, nb_threads=1)
+            >>> problem_instance.add_job(vroom.Job(1616, location=3))
+            >>> solution = problem_instance.solve(
+            ...     exploration_level=1, nb_threads=1, initial_solution=previous)
+            >>> solution.summary.cost
+            6555
         """
-        assert timeout is None or isinstance(timeout, (None, timedelta)), (
-            f"unknown timeout type: {timeout}"
-        )
-        solution = Solution(
-            self._solve(
+        assert timeout is None or isinstance(timeout, timedelta), f"unknown timeout type: {timeout}"
+        if initial_solution is not None:
+            steps = self._vehicle_steps()
+            self._set_vehicle_steps(self._initial_routes(initial_solution))
+            kwargs = dict(depth=depth, nb_searches=nb_searches)
+            try:
+                return self.solve(exploration_level, nb_threads, timeout, **kwargs)
+            except _vroom.VroomInputException as error:
+                if not _SEED_ERRORS.match(str(error)):
+                    raise
+                self._set_vehicle_steps(steps)
+                return self.solve(exploration_level, nb_threads, timeout, **kwargs)
+            finally:
+                self._set_vehicle_steps(steps)
+        if depth is None and nb_searches is None:
+            native = self._solve(
                 exploration_level=int(exploration_level),
                 nb_threads=int(nb_threads),
                 timeout=timeout,
-                # depth?
             )
-        )
+        else:
+            if nb_searches is None:
+                nb_searches = _vroom.get_nb_searches(int(exploration_level))
+            if depth is None:
+                depth = _vroom.get_depth(int(exploration_level))
+            if nb_searches < 1:
+                raise _vroom.VroomInputException(f"nb_searches must be positive, got {nb_searches}.")
+            native = self._solve(
+                nb_searches=int(nb_searches),
+                depth=int(depth),
+                nb_threads=int(nb_threads),
+                timeout=timeout,
+            )
+        solution = Solution._from_native(native)
         solution._geometry = self._geometry
         solution._distances = self._distances
         return solution
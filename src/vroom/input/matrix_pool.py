@@ -0,0 +1,164 @@
+"""Matrices shared by problems drawn from a fixed pool of locations."""
+
+from __future__ import annotations
+from typing import Any, Dict, Optional, Union
+from pathlib import Path
+
+from numpy.typing import ArrayLike
+import numpy
+import pandas
+
+from .. import _vroom
+
+from .input import Input, _as_matrix
+
+# Location index columns of the frames read by `Input.from_dataframe`.
+_LOCATION_COLUMNS = {
+    "jobs": ("location",),
+    "shipments": ("pickup_location", "delivery_location"),
+    "vehicles": ("start", "end"),
+}
+
+
+class MatrixPool:
+    """Full routing matrices over a fixed pool of locations.
+
+    Holds the matrices once, possibly memory-mapped from disk, for problems
+    that all draw their locations from the same pool of depots and customer
+    sites. Problems refer to locations by their index in the pool, and only
+    the sub-matrices of the locations actually used are handed to the solver.
+
+    Example:
+        >>> pool = vroom.MatrixPool(durations={
+        ...     "car": [[0, 5, 2, 9], [5, 0, 4, 9], [2, 4, 0, 9], [9, 9, 9, 0]],
+        ... })
+        >>> problem_instance = pool.from_dataframe(
+        ...     jobs=pandas.DataFrame({"id": [1, 2], "location": [1, 2]}),
+        ...     vehicles=pandas.DataFrame({"id": [7], "start": [0], "end": [0]}),
+        ... )
+        >>> problem_instance.solve(exploration_level=5, nb_threads=4).summary.cost
+        11
+    """
+
+    def __init__(
+        self,
+        durations: Optional[Dict[str, Union[ArrayLike, str, Path]]] = None,
+        distances: Optional[Dict[str, Union[ArrayLike, str, Path]]] = None,
+        costs: Optional[Dict[str, Union[ArrayLike, str, Path]]] = None,
+    ) -> None:
+        """Class initializer.
+
+        Args:
+            durations:
+                Full durations matrix per routing profile. Anything accepted
+                by `Input.set_durations_matrix` works, including paths to
+                memory-mapped files. Matrices that are not C-contiguous
+                uint32 already are converted once, into memory.
+            distances:
+                Full distances matrix per routing profile.
+            costs:
+                Full costs matrix per routing profile.
+        """
+        self._matrices: Dict[str, Dict[str, numpy.ndarray]] = {}
+        sizes = set()
+        for kind, matrices in (
+            ("durations", durations),
+            ("distances", distances),
+            ("costs", costs),
+        ):
+            # The solver reads uint32 rows, and any other layout would be
+            # converted again for every sub-matrix.
+            self._matrices[kind] = {
+                profile: numpy.ascontiguousarray(_as_matrix(matrix), dtype="uint32")
+                for profile, matrix in (matrices or {}).items()
+            }
+            sizes.update(len(matrix) for matrix in self._matrices[kind].values())
+        if len(sizes) > 1:
+            raise _vroom.VroomInputException(f"Matrices in pool have different sizes: {sorted(sizes)}.")
+        self._size = sizes.pop() if sizes else 0
+
+    def __repr__(self) -> str:
+        """String representation."""
+        profiles = sorted({profile for matrices in self._matrices.values() for profile in matrices})
+        return f"{self.__class__.__name__}(size={self._size}, profiles={profiles})"
+
+    def __len__(self) -> int:
+        """Number of locations in the pool."""
+        return self._size
+
+    def set_matrices(
+        self,
+        problem_instance: Input,
+        locations: ArrayLike,
+        nb_threads: int = 4,
+    ) -> None:
+        """Hand the sub-matrices of some pool locations to a problem.
+
+        Args:
+            problem_instance:
+                Problem whose location index `i` refers to the pool location
+                `locations[i]`.
+            locations:
+                Pool indices of the problem locations, shape `(k,)`.
+            nb_threads:
+                The number of threads used to extract the sub-matrices.
+        """
+        locations = numpy.asarray(locations, dtype="int64")
+        for kind, matrices in self._matrices.items():
+            setter = getattr(problem_instance, f"set_{kind}_matrix")
+            for profile, matrix in matrices.items():
+                setter(profile, _vroom._sub_matrix(matrix, locations, nb_threads=int(nb_threads)))
+
+    def from_dataframe(
+        self,
+        jobs: Optional[pandas.DataFrame] = None,
+        shipments: Optional[pandas.DataFrame] = None,
+        vehicles: Optional[pandas.DataFrame] = None,
+        nb_threads: int = 4,
+        **kwargs: Any,
+    ) -> Input:
+        """Create problem instance from frames referring to pool locations.
+
+        Same as `Input.from_dataframe`, except that the location columns
+        (`location`, `pickup_location`, `delivery_location`, `start` and
+        `end`) hold pool indices. These are remapped to local indices before
+        the problem is built, and the matching sub-matrices are set.
+
+        Args:
+            jobs:
+                Frame with the single jobs.
+            shipments:
+                Frame with the shipments.
+            vehicles:
+                Frame with the vehicles.
+            nb_threads:
+                The number of threads used to extract the sub-matrices.
+            kwargs:
+                Passed on to the `vroom.Input` initializer.
+
+        Returns:
+            Input instance with local locations and matrices.
+        """
+        frames = {"jobs": jobs, "shipments": shipments, "vehicles": vehicles}
+        columns = {
+            (kind, name): frame[name].astype("Int64")
+            for kind, frame in frames.items()
+            if frame is not None
+            for name in _LOCATION_COLUMNS[kind]
+            if name in frame
+        }
+        locations = numpy.unique(
+            numpy.concatenate(
+                [column.dropna().to_numpy(dtype="int64") for column in columns.values()]
+                + [numpy.empty(0, dtype="int64")]
+            )
+        )
+        for kind in {kind for kind, _ in columns}:
+            frames[kind] = frames[kind].copy(deep=False)
+        for (kind, name), column in columns.items():
+            local = numpy.searchsorted(locations, column.fillna(0).to_numpy(dtype="int64"))
+            frames[kind][name] = pandas.arrays.IntegerArray(local, column.isna().to_numpy())
+
+        problem_instance = Input.from_dataframe(**frames, **kwargs)
+        self.set_matrices(problem_instance, locations, nb_threads=nb_threads)
+        return problem_instance
@@ -0,0 +1,133 @@
+"""Binary problem files written by `Input.save`.
+
+The file starts with a fixed header, followed by a JSON document describing
+the problem and the raw array sections it refers to::
+
+    magic     8 bytes   b"VROOMBIN"
+    version   uint32    little endian
+    reserved  uint32
+    length    uint64    size of the JSON document in bytes
+    document  JSON      UTF-8, padded with spaces
+    sections  raw       each aligned on 64 bytes
+
+In the document, arrays are replaced by `{"__array__": index}` pointing
+into its `"sections"` list, where each entry holds the dtype, including
+byte order, the shape and the offset from the start of the file. Matrices
+are stored as raw `uint32` sections, so reading them is a plain copy, or a
+memory map.
+"""
+
+from __future__ import annotations
+from typing import Any, BinaryIO, List, Union
+from pathlib import Path
+import json
+import struct
+
+import numpy
+
+MAGIC = b"VROOMBIN"
+VERSION = 1
+
+_HEADER = struct.Struct("<8sIIQ")
+_ALIGNMENT = 64
+
+
+def _padding(offset: int) -> int:
+    return -offset % _ALIGNMENT
+
+
+def _encode(value: Any, arrays: List[numpy.ndarray]) -> Any:
+    """Replace arrays by references to the sections."""
+    if isinstance(value, numpy.ndarray):
+        arrays.append(numpy.ascontiguousarray(value))
+        return {"__array__": len(arrays) - 1}
+    if isinstance(value, dict):
+        return {key: _encode(item, arrays) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_encode(item, arrays) for item in value]
+    return value
+
+
+def _decode(value: Any, arrays: List[numpy.ndarray]) -> Any:
+    """Replace references to the sections by arrays."""
+    if isinstance(value, dict):
+        if "__array__" in value:
+            return arrays[value["__array__"]]
+        return {key: _decode(item, arrays) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_decode(item, arrays) for item in value]
+    return value
+
+
+def write(path: Union[str, Path], state: Any) -> None:
+    """Write a problem state with its arrays to file."""
+    arrays: List[numpy.ndarray] = []
+    document = _encode(state, arrays)
+
+    def dump(offset: int) -> bytes:
+        sections = []
+        for array in arrays:
+            offset += _padding(offset)
+            sections.append(
+                {
+                    "dtype": array.dtype.str,
+                    "shape": list(array.shape),
+                    "offset": offset,
+                }
+            )
+            offset += array.nbytes
+        return json.dumps({"state": document, "sections": sections}).encode()
+
+    # The offsets depend on the size of the document they are written in,
+    # so lay it out until it fits in front of its own sections.
+    start = _HEADER.size
+    encoded = dump(start)
+    while True:
+        start = _HEADER.size + len(encoded) + _padding(_HEADER.size + len(encoded))
+        encoded = dump(start)
+        if _HEADER.size + len(encoded) <= start:
+            break
+    encoded += b" " * (start - _HEADER.size - len(encoded))
+
+    with open(path, "wb") as handle:
+        handle.write(_HEADER.pack(MAGIC, VERSION, 0, len(encoded)))
+        handle.write(encoded)
+        for array in arrays:
+            handle.write(b"\0" * _padding(handle.tell()))
+            handle.write(memoryview(array.reshape(-1)).cast("B"))
+
+
+def _read_array(handle: BinaryIO, section: Any) -> numpy.ndarray:
+    handle.seek(section["offset"])
+    array = numpy.empty(section["shape"], dtype=section["dtype"])
+    if array.nbytes and handle.readinto(memoryview(array.reshape(-1)).cast("B")) != array.nbytes:
+        raise ValueError("Truncated VROOM problem file.")
+    return array
+
+
+def read(path: Union[str, Path], mmap: bool = True) -> Any:
+    """Read a problem state written by `write`.
+
+    With `mmap`, the arrays are read-only views on the mapped file.
+    """
+    with open(path, "rb") as handle:
+        header = handle.read(_HEADER.size)
+        if len(header) < _HEADER.size or not header.startswith(MAGIC):
+            raise ValueError(f"Not a VROOM problem file: {path}")
+        _, version, _, length = _HEADER.unpack(header)
+        if version != VERSION:
+            raise ValueError(f"Unsupported VROOM problem file version {version}.")
+        document = json.loads(handle.read(length))
+        if not mmap:
+            arrays = [_read_array(handle, section) for section in document["sections"]]
+
+    if mmap:
+        arrays = []
+        mapped = numpy.memmap(path, mode="r") if document["sections"] else None
+        for section in document["sections"]:
+            dtype = numpy.dtype(section["dtype"])
+            size = int(numpy.prod(section["shape"], dtype=numpy.int64))
+            start = section["offset"]
+            array = mapped[start : start + size * dtype.itemsize].view(dtype)
+            arrays.append(array.reshape(section["shape"]))
+    return _decode(document["state"], arrays)
@@ -0,0 +1,179 @@
+"""Persistent cache for routing server responses."""
+
+from __future__ import annotations
+from typing import Dict, Optional, Union
+from pathlib import Path
+import hashlib
+import sqlite3
+import threading
+import time
+
+from .. import _vroom
+
+from .routing_proxy import close_proxies, routing_proxy
+
+_SHARED: Dict[Path, RoutingCache] = {}
+_USERS: Dict[RoutingCache, int] = {}
+_SHARED_LOCK = threading.Lock()
+
+
+class RoutingCache:
+    """Content-addressed on-disk cache of routing server responses.
+
+    Responses are stored in a SQLite file, keyed on the router, the routing
+    profile and the full query, which holds the coordinate set. When the
+    total size of the stored responses exceeds `max_size`, the least
+    recently used ones are evicted.
+
+    The routing itself happens natively, so the cache sits in between as a
+    local HTTP proxy per routing server, see `vroom.RoutingProxy`. Pass the
+    cache to `vroom.Input` to route all its queries through it.
+
+    Example:
+        >>> cache = vroom.RoutingCache(":memory:")
+        >>> problem_instance = vroom.Input(
+        ...     servers={"car": "router.project-osrm.org:80"},
+        ...     cache=cache,
+        ... )
+        >>> len(cache)
+        0
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        max_size: int = 2**30,
+        timeout: float = 60,
+    ) -> None:
+        """Class initializer.
+
+        Args:
+            path:
+                SQLite file to store the responses in. Created if missing,
+                and kept in memory only if ":memory:".
+            max_size:
+                Maximum total size of the stored responses in bytes.
+            timeout:
+                Seconds to wait for the routing server on cache misses.
+        """
+        self.path = Path(path)
+        self.max_size = int(max_size)
+        self.timeout = timeout
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(self.path, check_same_thread=False)
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "key TEXT PRIMARY KEY, body BLOB, size INTEGER, accessed REAL)"
+        )
+        self._connection.execute("CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed)")
+        self._connection.commit()
+
+    def __repr__(self) -> str:
+        """String representation."""
+        return f"{self.__class__.__name__}({str(self.path)!r}, max_size={self.max_size})"
+
+    def __len__(self) -> int:
+        """Number of stored responses."""
+        with self._lock:
+            return self._connection.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+
+    @staticmethod
+    def key(router: _vroom.ROUTER, method: str, query: str, body: bytes = b"") -> str:
+        """Content address of a routing query."""
+        digest = hashlib.sha256(f"{router.name}\n{method}\n{query}\n".encode())
+        digest.update(body)
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Look up a stored response, marking it as recently used."""
+        with self._lock:
+            row = self._connection.execute("SELECT body FROM responses WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+            self._connection.execute(
+                "UPDATE responses SET accessed = ? WHERE key = ?", (time.time(), key)
+            )
+            self._connection.commit()
+            return row[0]
+
+    def put(self, key: str, body: bytes) -> None:
+        """Store a response, evicting the least recently used ones if full."""
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?)",
+                (key, body, len(body), time.time()),
+            )
+            total = self._connection.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[
+                0
+            ]
+            for key_, size in self._connection.execute(
+                "SELECT key, size FROM responses ORDER BY accessed"
+            ).fetchall():
+                if total <= self.max_size:
+                    break
+                self._connection.execute("DELETE FROM responses WHERE key = ?", (key_,))
+                total -= size
+            self._connection.commit()
+
+    def clear(self) -> None:
+        """Remove all stored responses."""
+        with self._lock:
+            self._connection.execute("DELETE FROM responses")
+            self._connection.commit()
+
+    def close(self) -> None:
+        """Shut down the proxies and close the SQLite file."""
+        close_proxies(self)
+        with self._lock:
+            self._connection.close()
+
+    def proxy(self, server: _vroom.Server, router: _vroom.ROUTER) -> _vroom.Server:
+        """Local server answering from the cache on behalf of `server`.
+
+        Args:
+            server:
+                The routing server to forward cache misses to.
+            router:
+                The kind of routing server, part of the cache key.
+
+        Returns:
+            Server to hand to `vroom.Input` instead of `server`.
+        """
+        return routing_proxy(server, router, cache=self)
+
+
+def acquire_cache(cache: Union[RoutingCache, str, Path]) -> RoutingCache:
+    """Cache for an input, shared with the other inputs using the same file.
+
+    Caches opened from a path are counted per user and closed once the last
+    one releases them with `release_cache`. Caches passed in as objects stay
+    with their owner, unless they were opened from a path in the first place.
+    """
+    with _SHARED_LOCK:
+        if not isinstance(cache, RoutingCache):
+            key = None if str(cache) == ":memory:" else Path(cache).resolve()
+            if key in _SHARED:
+                cache = _SHARED[key]
+            else:
+                cache = RoutingCache(cache)
+                if key is not None:
+                    _SHARED[key] = cache
+            _USERS.setdefault(cache, 0)
+        if cache in _USERS:
+            _USERS[cache] += 1
+        return cache
+
+
+def release_cache(cache: RoutingCache) -> None:
+    """Drop a use of a cache from `acquire_cache`, closing it after the last."""
+    with _SHARED_LOCK:
+        if cache not in _USERS:
+            return
+        _USERS[cache] -= 1
+        if _USERS[cache]:
+            return
+        del _USERS[cache]
+        for key, shared in list(_SHARED.items()):
+            if shared is cache:
+                del _SHARED[key]
+    cache.close()
@@ -0,0 +1,339 @@
+"""Local stand-in for routing servers, with caching and tiled matrices."""
+
+from __future__ import annotations
+from typing import Any, Dict, List, Optional, Sequence, Tuple, TYPE_CHECKING
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import abc
+import http.client
+import json
+import queue
+import re
+import threading
+import urllib.parse
+
+from .. import _vroom
+
+if TYPE_CHECKING:
+    from .routing_cache import RoutingCache
+
+_PROXIES: Dict[Tuple[Any, ...], RoutingProxy] = {}
+_PROXIES_LOCK = threading.Lock()
+
+_OSRM_TABLE = re.compile(r"^(?P<prefix>/.*?table/v1/[^/]+/)(?P<coordinates>[^?]+)\?(?P<args>.*)$")
+_OSRM_SNAPPING = re.compile(r"(Could not find a matching segment for coordinate )(\d+)")
+
+
+class _Table(abc.ABC):
+    """Matrix query of a routing server, split into source/target tiles."""
+
+    keys: Sequence[str] = ("durations", "distances")
+
+    def __init__(self, size: int) -> None:
+        self.size = size
+
+    @abc.abstractmethod
+    def tile(self, sources: range, targets: range) -> Tuple[str, str, bytes]:
+        """Method, path and body of the query for one tile."""
+
+    def fix_error(self, response: bytes, sources: range, targets: range) -> bytes:
+        """Make an error response of a tile refer to the full query."""
+        return response
+
+
+class _OsrmTable(_Table):
+
+    def __init__(self, match: re.Match) -> None:
+        self.prefix = match["prefix"]
+        self.coordinates = match["coordinates"].split(";")
+        self.args = [arg for arg in match["args"].split("&") if not arg.startswith("radiuses=")]
+        radiuses = [arg for arg in match["args"].split("&") if arg.startswith("radiuses=")]
+        self.radius = radiuses[0][len("radiuses=") :].split(";")[0] if radiuses else None
+        super().__init__(len(self.coordinates))
+
+    def _indices(self, sources: range, targets: range) -> List[int]:
+        return list(sources) if sources == targets else list(sources) + list(targets)
+
+    def tile(self, sources: range, targets: range) -> Tuple[str, str, bytes]:
+        indices = self._indices(sources, targets)
+        offset = 0 if sources == targets else len(sources)
+        args = self.args + [
+            "sources=" + ";".join(str(idx) for idx in range(len(sources))),
+            "destinations=" + ";".join(str(offset + idx) for idx in range(len(targets))),
+        ]
+        if self.radius is not None:
+            args.append("radiuses=" + ";".join([self.radius] * len(indices)))
+        coordinates = ";".join(self.coordinates[idx] for idx in indices)
+        return "GET", f"{self.prefix}{coordinates}?{'&'.join(args)}", b""
+
+    def fix_error(self, response: bytes, sources: range, targets: range) -> bytes:
+        indices = self._indices(sources, targets)
+        return _OSRM_SNAPPING.sub(
+            lambda match: match[1] + str(indices[int(match[2])]),
+            response.decode(),
+        ).encode()
+
+
+class _OrsTable(_Table):
+
+    def __init__(self, path: str, body: Dict[str, Any]) -> None:
+        self.path = path
+        self.body = body
+        super().__init__(len(body["locations"]))
+
+    def tile(self, sources: range, targets: range) -> Tuple[str, str, bytes]:
+        body = dict(self.body, sources=list(sources), destinations=list(targets))
+        return "POST", self.path, json.dumps(body).encode()
+
+
+class _ValhallaTable(_Table):
+
+    keys = ("sources_to_targets",)
+
+    def __init__(self, prefix: str, query: Dict[str, Any]) -> None:
+        self.prefix = prefix
+        self.query = query
+        super().__init__(len(query["sources"]))
+
+    def tile(self, sources: range, targets: range) -> Tuple[str, str, bytes]:
+        query = dict(
+            self.query,
+            sources=self.query["sources"][sources.start : sources.stop],
+            targets=self.query["targets"][targets.start : targets.stop],
+        )
+        return "GET", self.prefix + json.dumps(query, separators=(",", ":")), b""
+
+
+def _parse_table(
+    router: _vroom.ROUTER,
+    method: str,
+    path: str,
+    body: bytes,
+) -> Optional[_Table]:
+    """Recognize the matrix queries made by the native routing wrappers."""
+    if router == _vroom.ROUTER.OSRM:
+        match = _OSRM_TABLE.match(path)
+        return _OsrmTable(match) if match and method == "GET" else None
+    if router == _vroom.ROUTER.ORS:
+        if method != "POST" or "/matrix/" not in f"/{path}":
+            return None
+        return _OrsTable(path, json.loads(body))
+    if router == _vroom.ROUTER.VALHALLA:
+        prefix, _, query = path.partition("?json=")
+        if not prefix.endswith("sources_to_targets") or not query:
+            return None
+        query = json.loads(urllib.parse.unquote(query))
+        if query["sources"] != query["targets"]:
+            return None
+        return _ValhallaTable(prefix + "?json=", query)
+    return None
+
+
+class RoutingProxy(ThreadingHTTPServer):
+    """Local HTTP server standing in for a routing server.
+
+    Queries are answered from a `vroom.RoutingCache` when possible. Matrix
+    queries larger than `tile_size` locations are split into source/target
+    tiles, which are fetched concurrently over at most `max_connections`
+    keep-alive connections and assembled into one response, so that the
+    native routing wrappers see a single table.
+    """
+
+    daemon_threads = True
+
+    def __init__(
+        self,
+        server: _vroom.Server,
+        router: _vroom.ROUTER,
+        cache: Optional[RoutingCache] = None,
+        tile_size: Optional[int] = None,
+        max_connections: int = 8,
+        timeout: float = 60,
+    ) -> None:
+        """Class initializer.
+
+        Args:
+            server:
+                The routing server to forward queries to.
+            router:
+                The kind of routing server.
+            cache:
+                Cache to answer repeated queries from.
+            tile_size:
+                Maximum number of sources and targets per matrix query.
+            max_connections:
+                Maximum number of concurrent connections to the server.
+            timeout:
+                Seconds to wait for the routing server.
+        """
+        super().__init__(("127.0.0.1", 0), _ProxyHandler)
+        self.router = router
+        self.cache = cache
+        self.tile_size = tile_size
+        self.timeout = timeout
+        self.upstream = server
+        self.users = 0
+        self._connections: queue.LifoQueue = queue.LifoQueue()
+        self._executor = ThreadPoolExecutor(max_connections)
+        threading.Thread(target=self.serve_forever, daemon=True).start()
+
+    @property
+    def server(self) -> _vroom.Server:
+        """Server to hand to `vroom.Input` instead of the upstream one."""
+        return _vroom.Server("127.0.0.1", str(self.server_address[1]), self.upstream.path)
+
+    def close(self) -> None:
+        """Stop serving and close all connections."""
+        self.shutdown()
+        self.server_close()
+        self._executor.shutdown()
+        while not self._connections.empty():
+            self._connections.get().close()
+
+    def fetch(self, method: str, path: str, body: bytes) -> Tuple[int, bytes]:
+        """Answer a query, from the cache if possible."""
+        key = None
+        if self.cache is not None:
+            key = self.cache.key(self.router, method, path, body)
+            response = self.cache.get(key)
+            if response is not None:
+                return 200, response
+        table = None
+        if self.tile_size is not None:
+            table = _parse_table(self.router, method, path, body)
+        if table is not None and table.size > self.tile_size:
+            status, response = self._fetch_tiles(table)
+        else:
+            status, response = self._executor.submit(self._request, method, path, body).result()
+        if key is not None and status == 200:
+            self.cache.put(key, response)
+        return status, response
+
+    def _fetch_tiles(self, table: _Table) -> Tuple[int, bytes]:
+        """Fetch a matrix tile by tile and assemble the full response."""
+        ranges = [
+            range(start, min(start + self.tile_size, table.size))
+            for start in range(0, table.size, self.tile_size)
+        ]
+        futures = {
+            self._executor.submit(self._request, *table.tile(sources, targets)): (sources, targets)
+            for sources in ranges
+            for targets in ranges
+        }
+        result: Dict[str, Any] = {}
+        for key in table.keys:
+            result[key] = [[None] * table.size for _ in range(table.size)]
+        for future in as_completed(futures):
+            sources, targets = futures[future]
+            status, response = future.result()
+            content = json.loads(response) if status == 200 else {}
+            if not all(key in content for key in table.keys):
+                for other in futures:
+                    other.cancel()
+                return status, table.fix_error(response, sources, targets)
+            for key in table.keys:
+                for row, values in zip(sources, content.pop(key)):
+                    result[key][row][targets.start : targets.stop] = values
+            for key, value in content.items():
+                result.setdefault(key, value)
+        return 200, json.dumps(result).encode()
+
+    def _request(self, method: str, path: str, body: bytes) -> Tuple[int, bytes]:
+        """Send a query upstream over a pooled keep-alive connection."""
+        try:
+            connection = self._connections.get_nowait()
+        except queue.Empty:
+            connection_type = (
+                http.client.HTTPSConnection
+                if self.upstream.port == "443"
+                else http.client.HTTPConnection
+            )
+            connection = connection_type(
+                self.upstream.host, int(self.upstream.port), timeout=self.timeout
+            )
+        headers = {"Content-Type": "application/json"} if body else {}
+        for attempt in range(2):
+            try:
+                connection.request(method, path, body=body or None, headers=headers)
+                reply = connection.getresponse()
+                status, response = reply.status, reply.read()
+                break
+            except (http.client.HTTPException, OSError) as error:
+                connection.close()
+                if attempt:
+                    return 502, str(error).encode()
+        self._connections.put(connection)
+        return status, response
+
+
+class _ProxyHandler(BaseHTTPRequestHandler):
+    """Hand queries of the native routing wrappers to the proxy."""
+
+    server: RoutingProxy
+
+    def do_GET(self) -> None:
+        self._respond(b"")
+
+    def do_POST(self) -> None:
+        self._respond(self.rfile.read(int(self.headers.get("Content-Length", 0))))
+
+    def _respond(self, body: bytes) -> None:
+        status, response = self.server.fetch(self.command, self.path, body)
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(response)))
+        self.end_headers()
+        self.wfile.write(response)
+
+    def log_message(self, format: str, *args) -> None:
+        """Keep the proxy quiet."""
+
+
+def routing_proxy(
+    server: _vroom.Server,
+    router: _vroom.ROUTER,
+    cache: Optional[RoutingCache] = None,
+    tile_size: Optional[int] = None,
+    max_connections: int = 8,
+) -> _vroom.Server:
+    """Local server standing in for `server`, shared between inputs.
+
+    Each call counts as a use of the proxy, to be given back with
+    `release_proxy` so that the proxy is shut down after its last user.
+    """
+    key = (server.host, server.port, server.path, router.name, cache, tile_size, max_connections)
+    with _PROXIES_LOCK:
+        if key not in _PROXIES:
+            timeout = 60 if cache is None else cache.timeout
+            _PROXIES[key] = RoutingProxy(
+                server,
+                router,
+                cache=cache,
+                tile_size=tile_size,
+                max_connections=max_connections,
+                timeout=timeout,
+            )
+        _PROXIES[key].users += 1
+        return _PROXIES[key].server
+
+
+def release_proxy(server: _vroom.Server) -> None:
+    """Drop a use of the proxy serving as `server`, closing it after the last."""
+    with _PROXIES_LOCK:
+        for key, proxy in list(_PROXIES.items()):
+            if str(proxy.server_address[1]) != server.port:
+                continue
+            proxy.users -= 1
+            if proxy.users <= 0:
+                del _PROXIES[key]
+                proxy.close()
+            return
+
+
+def close_proxies(cache: Optional[RoutingCache] = None) -> None:
+    """Shut down the proxies using `cache`, or all of them if omitted."""
+    with _PROXIES_LOCK:
+        for key, proxy in list(_PROXIES.items()):
+            if cache is None or proxy.cache is cache:
+                proxy.close()
+                del _PROXIES[key]
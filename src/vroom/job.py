@@ -1,4 +1,4 @@
-from typing import Any, Dict, List, Optional, Sequence, Set, Union
+from typing import Any, Dict, List, Optional, Sequence, Set, Tuple, Union
 
 import numpy
 
@@ -220,6 +220,14 @@ class Job(_vroom.Job, JobBaseclass):
             attributes["priority"] = self.priority
         return attributes
 
+    def __getstate__(self) -> Tuple[bytes, Dict[str, Any]]:
+        return self._state(), self.__dict__
+
+    def __setstate__(self, state: Tuple[bytes, Dict[str, Any]]) -> None:
+        native, attributes = state
+        _vroom.Job.__init__(self, native)
+        self.__dict__.update(attributes)
+
 
 class ShipmentStep(JobBaseclass):
     """A delivery job that has to be performed.
@@ -1,10 +1,9 @@
 """The computed solutions."""
 
-from typing import Any, Dict, Union
+from typing import Any, BinaryIO, Dict, Optional, Sequence, TextIO, Tuple, Union
 from pathlib import Path
 import io
-import json
-from contextlib import redirect_stdout
+import os
 
 import numpy
 import pandas
@@ -12,6 +11,35 @@ import pandas
 from .. import _vroom
 
 NA_SUBSTITUTE = 4293967297
+STEP_CATEGORIES = ["start", "end", "break", "job", "delivery", "pickup"]
+
+
+def _arrow_columns(columns: Dict[str, Any], names: Sequence[str]) -> Dict[str, Any]:
+    """Wrap native solution columns as Arrow arrays without copying."""
+    import pyarrow
+
+    arrays = {}
+    for name in names:
+        column = columns[name]
+        if name == "type":
+            arrays[name] = pyarrow.DictionaryArray.from_arrays(column.view("int8"), STEP_CATEGORIES)
+        elif name in ("description", "geometry"):
+            arrays[name] = pyarrow.LargeStringArray.from_buffers(
+                len(column["offsets"]) - 1,
+                pyarrow.py_buffer(column["offsets"]),
+                pyarrow.py_buffer(column["data"]),
+            )
+        elif isinstance(column, dict):
+            arrays[name] = pyarrow.LargeListArray.from_arrays(column["offsets"], column["data"])
+        elif name == "location_index":
+            arrays[name] = pyarrow.array(column, mask=~columns["_has_location_index"])
+        elif name in ("longitude", "latitude"):
+            arrays[name] = pyarrow.array(column, mask=~columns["_has_coordinates"])
+        elif name == "id" and "_has_id" in columns:
+            arrays[name] = pyarrow.array(column, mask=~columns["_has_id"])
+        else:
+            arrays[name] = pyarrow.array(column)
+    return arrays
 
 
 class Solution(_vroom.Solution):
@@ -25,12 +53,36 @@ class Solution(_vroom.Solution):
 
     _geometry: bool = False
     _distances: bool = False
+    _routes_frame: Optional[Tuple[bool, pandas.DataFrame]] = None
+
+    @classmethod
+    def _from_native(cls, native: Any) -> "Solution":
+        """Take over a solution handed out by `Input._solve` or `Input._check`.
+
+        The native solution is moved rather than copied, which is only
+        possible once.
+        """
+        return cls(native)
+
+    def __getstate__(self) -> Tuple[bytes, Dict[str, Any]]:
+        """Compact binary state of the native solution, for pickling."""
+        attributes = {key: value for key, value in self.__dict__.items() if key != "_routes_frame"}
+        return self._state(), attributes
+
+    def __setstate__(self, state: Tuple[bytes, Dict[str, Any]]) -> None:
+        """Restore from pickled state."""
+        native, attributes = state
+        _vroom.Solution.__init__(self, native)
+        self.__dict__.update(attributes)
 
     @property
     def routes(self) -> pandas.DataFrame:
         """
         Frame outlining all routes for all vehicles.
 
+        The frame is built once from the native step records and cached,
+        and every access returns a copy of it.
+
         It includes the following columns.
 
         vehicle_id:
@@ -62,50 +114,195 @@ class Solution(_vroom.Solution):
         distance:
             Total route distance.
         """
+        distances = self._geometry or self._distances
+        if self._routes_frame is None or self._routes_frame[0] != distances:
+            self._routes_frame = distances, self._build_routes(distances)
+        return self._routes_frame[1].copy()
+
+    def _build_routes(self, distances: bool) -> pandas.DataFrame:
+        """Build the routes frame from the native step records."""
         array = numpy.asarray(self._routes_numpy())
-        frame = pandas.DataFrame(
-            {
-                "vehicle_id": array["vehicle_id"],
-                "type": pandas.Categorical(
-                    array["type"].astype("U9"),
-                    categories=["start", "end", "break", "job", "delivery", "pickup"],
-                ),
-                "arrival": array["arrival"],
-                "duration": array["duration"],
-                "setup": array["setup"],
-                "service": array["service"],
-                "waiting_time": array["waiting_time"],
-                "location_index": array["location_index"],
-                "longitude": pandas.array(array["longitude"].tolist()),
-                "latitude": pandas.array(array["latitude"].tolist()),
-                "id": pandas.array(array["id"].tolist(), dtype="Int64"),
-                "description": array["description"].astype("U40"),
-            }
-        )
-        for column in ["longitude", "latitude", "id"]:
-            if (frame[column] == NA_SUBSTITUTE).all():
-                del frame[column]
-            else:
-                frame.loc[frame[column] == NA_SUBSTITUTE, column] = pandas.NA
-        if self._geometry or self._distances:
+        codes = numpy.full(len(array), -1, dtype="int8")
+        for code, category in enumerate(STEP_CATEGORIES):
+            codes[array["type"] == category.encode()] = code
+        columns = {
+            "vehicle_id": array["vehicle_id"],
+            "type": pandas.Categorical.from_codes(codes, categories=STEP_CATEGORIES),
+            "arrival": array["arrival"],
+            "duration": array["duration"],
+            "setup": array["setup"],
+            "service": array["service"],
+            "waiting_time": array["waiting_time"],
+            "location_index": array["location_index"],
+        }
+        for column, kind in [
+            ("longitude", pandas.arrays.FloatingArray),
+            ("latitude", pandas.arrays.FloatingArray),
+            ("id", pandas.arrays.IntegerArray),
+        ]:
+            values = array[column]
+            missing = values == NA_SUBSTITUTE
+            if missing.all():
+                continue
+            columns[column] = kind(numpy.where(missing, 0, values), missing)
+        columns["description"] = array["description"].astype("U40")
+        frame = pandas.DataFrame(columns)
+        if distances:
             frame["distance"] = array["distance"]
         return frame
 
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert solution into VROOM compatible dictionary."""
-        stream = io.StringIO()
-        with redirect_stdout(stream):
-            if self._geometry or self._distances:
-                self._geometry_solution_json()
-            else:
-                self._solution_json()
-        return json.loads(stream.getvalue())
-
-    def to_json(self, filepath: Union[str, Path]) -> None:
-        """Store solution into VROOM compatible JSON file."""
-        with open(filepath, "w") as handler:
-            with redirect_stdout(handler):
-                if self._geometry or self._distances:
-                    self._geometry_solution_json()
-                else:
-                    self._solution_json()
+    def to_arrow(self) -> Dict[str, Any]:
+        """Export steps, routes and unassigned jobs as Arrow tables.
+
+        The tables are wrapped around column buffers filled natively from the
+        solution, without going through pandas. Steps have the columns of
+        `routes`, plus the `load` at each step, with missing values as nulls
+        and descriptions as variable-length strings. Routes have the
+        per-vehicle totals, and unassigned jobs their id, type, location and
+        description. Distances and geometries are included when reported by
+        the solver. Requires `pyarrow`.
+
+        Returns:
+            The `pyarrow.Table` of "steps", "routes" and "unassigned".
+
+        Example:
+            >>> problem_instance = vroom.Input.from_dict({
+            ...     "vehicles": [{"id": 7, "start_index": 0}],
+            ...     "jobs": [{"id": 1, "location_index": 1, "description": "a"}],
+            ...     "matrices": {"car": {"durations": [[0, 5], [5, 0]]}},
+            ... })
+            >>> solution = problem_instance.solve(exploration_level=5, nb_threads=1)
+            >>> tables = solution.to_arrow()
+            >>> tables["steps"].column("description").to_pylist()
+            ['', 'a', '']
+            >>> tables["routes"].column("duration").to_pylist()
+            [5]
+        """
+        import pyarrow
+
+        distances = self._geometry or self._distances
+        steps = [
+            "vehicle_id",
+            "type",
+            "arrival",
+            "duration",
+            "setup",
+            "service",
+            "waiting_time",
+            "location_index",
+            "longitude",
+            "latitude",
+            "id",
+            "description",
+            "load",
+        ]
+        routes = [
+            "vehicle_id",
+            "cost",
+            "setup",
+            "service",
+            "duration",
+            "waiting_time",
+            "priority",
+            "delivery",
+            "pickup",
+            "description",
+        ]
+        if distances:
+            steps.append("distance")
+            routes.append("distance")
+        if self._geometry:
+            routes.append("geometry")
+        unassigned = ["id", "type", "location_index", "longitude", "latitude", "description"]
+        return {
+            name: pyarrow.table(_arrow_columns(columns, names))
+            for name, columns, names in [
+                ("steps", self._steps_columns(), steps),
+                ("routes", self._routes_columns(), routes),
+                ("unassigned", self._unassigned_columns(), unassigned),
+            ]
+        }
+
+    def to_parquet(self, path: Union[str, Path]) -> None:
+        """Store the tables of `to_arrow` as Parquet files.
+
+        Args:
+            path:
+                Directory to write `steps.parquet`, `routes.parquet` and
+                `unassigned.parquet` to, created if missing.
+        """
+        import pyarrow.parquet
+
+        path = Path(path)
+        path.mkdir(parents=True, exist_ok=True)
+        for name, table in self.to_arrow().items():
+            pyarrow.parquet.write_table(table, path / f"{name}.parquet")
+
+    def to_dict(self, geometry: bool = True) -> Dict[str, Any]:
+        """Convert solution into VROOM compatible dictionary.
+
+        The dictionary is built natively from the solution, without going
+        through JSON text.
+
+        Args:
+            geometry:
+                Include the encoded route geometries, if any. Leave them out
+                for a lighter dictionary when only the schedule is needed.
+
+        Example:
+            >>> problem_instance = vroom.Input.from_dict({
+            ...     "vehicles": [{"id": 7, "start_index": 0}],
+            ...     "jobs": [{"id": 1, "location_index": 1}],
+            ...     "matrices": {"car": {"durations": [[0, 5], [5, 0]]}},
+            ... })
+            >>> solution = problem_instance.solve(exploration_level=5, nb_threads=1)
+            >>> [step["type"] for step in solution.to_dict()["routes"][0]["steps"]]
+            ['start', 'job', 'end']
+        """
+        return self._to_dict(self._geometry or self._distances, geometry)
+
+    def to_json(
+        self,
+        filepath: Union[str, Path, BinaryIO, TextIO],
+        compact: bool = True,
+        ndjson: bool = False,
+        geometry: bool = True,
+    ) -> None:
+        """Store solution into VROOM compatible JSON file.
+
+        The JSON is written natively through a buffered file, with the GIL
+        released.
+
+        Args:
+            filepath:
+                Path of the file to write, or a file-like object to write to.
+            compact:
+                Write everything on a single line. Otherwise, indent the
+                output for readability.
+            ndjson:
+                Write newline delimited JSON instead: a first line with the
+                code, summary and unassigned jobs, followed by one line per
+                route, so that large solutions can be read incrementally.
+            geometry:
+                Include the encoded route geometries, if any.
+
+        Example:
+            >>> problem_instance = vroom.Input.from_dict({
+            ...     "vehicles": [{"id": 7, "start_index": 0}, {"id": 8, "start_index": 1}],
+            ...     "jobs": [{"id": 1, "location_index": 0}, {"id": 2, "location_index": 1}],
+            ...     "matrices": {"car": {"durations": [[0, 5], [5, 0]]}},
+            ... })
+            >>> solution = problem_instance.solve(exploration_level=5, nb_threads=1)
+            >>> stream = io.BytesIO()
+            >>> solution.to_json(stream, ndjson=True)
+            >>> [line[:12] for line in stream.getvalue().splitlines()]
+            [b'{"code":0,"s', b'{"vehicle":7', b'{"vehicle":8']
+        """
+        report_distances = self._geometry or self._distances
+        if hasattr(filepath, "write"):
+            data = self._json(report_distances, geometry, compact, ndjson)
+            if isinstance(filepath, io.TextIOBase):
+                data = data.decode()
+            filepath.write(data)
+        else:
+            self._write_json(os.fspath(filepath), report_distances, geometry, compact, ndjson)
@@ -0,0 +1,186 @@
+"""Benchmarking solver parameters on sample problems."""
+
+from __future__ import annotations
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+from pathlib import Path
+from datetime import timedelta
+import os
+import random
+import time
+
+import pandas
+
+from . import _vroom
+from .input.input import Input
+
+# Numbers of searches and depths tried along with the exploration levels.
+_NB_SEARCHES = (4, 8, 16, 32)
+_DEPTHS = (1, 3, 5)
+
+
+def _levels() -> Dict[Tuple[int, int], int]:
+    """Exploration levels by their numbers of searches and depths."""
+    return {
+        (_vroom.get_nb_searches(level), _vroom.get_depth(level)): level
+        for level in range(_vroom.MAX_EXPLORATION_LEVEL + 1)
+    }
+
+
+def _default_configurations() -> List[Dict[str, int]]:
+    """Exploration levels and a grid of searches and depths, per thread count."""
+    cores = os.cpu_count() or 1
+    threads = sorted({1, min(4, cores), cores})
+    pairs = sorted(set(_levels()) | {(s, d) for s in _NB_SEARCHES for d in _DEPTHS})
+    return [
+        dict(nb_searches=nb_searches, depth=depth, nb_threads=nb_threads)
+        for nb_searches, depth in pairs
+        for nb_threads in threads
+    ]
+
+
+def _resolve(configuration: Dict[str, int]) -> Dict[str, int]:
+    """Spell out a configuration as searches, depth and threads."""
+    level = configuration.get("exploration_level", _vroom.DEFAULT_EXPLORATION_LEVEL)
+    nb_searches = configuration.get("nb_searches")
+    depth = configuration.get("depth")
+    nb_threads = int(configuration.get("nb_threads", 1))
+    if nb_threads < 1:
+        raise ValueError(f"Configuration {configuration} needs at least one thread.")
+    return dict(
+        nb_searches=int(_vroom.get_nb_searches(level) if nb_searches is None else nb_searches),
+        depth=int(_vroom.get_depth(level) if depth is None else depth),
+        nb_threads=nb_threads,
+    )
+
+
+def _pareto(frame: pandas.DataFrame) -> pandas.Series:
+    """Configurations not beaten by a faster or equally fast one."""
+    front = pandas.Series(False, index=frame.index)
+    best = None
+    ordered = frame.sort_values(["wall_time", "unassigned", "cost"])
+    for idx, row in ordered.iterrows():
+        quality = (row["unassigned"], row["cost"])
+        if best is None or quality < best:
+            front[idx] = True
+            best = quality
+    return front
+
+
+def tune(
+    inputs: Iterable[Union[Input, str, Path]],
+    time_budget: timedelta,
+    configurations: Optional[Iterable[Dict[str, int]]] = None,
+    sample: Optional[int] = None,
+    seed: int = 0,
+    **kwargs: Any,
+) -> pandas.DataFrame:
+    """Benchmark solver parameters against wall time on sample problems.
+
+    Every configuration solves all the sampled problems in turn, and is
+    scored by the total number of unassigned tasks, the total cost, and the
+    total wall time. Configurations are run from the cheapest to the most
+    expensive, estimated as searches times depth per thread, until the time
+    budget is spent; a configuration that is started always runs to the
+    end, so that all of them are scored on the same problems.
+
+    Example:
+        >>> problem_instance = vroom.Input()
+        >>> problem_instance.set_durations_matrix(
+        ...     profile="car",
+        ...     matrix_input=[[0, 2104, 197, 1299],
+        ...                   [2103, 0, 2255, 3152],
+        ...                   [197, 2256, 0, 1102],
+        ...                   [1299, 3153, 1102, 0]],
+        ... )
+        >>> problem_instance.add_vehicle([vroom.Vehicle(47, start=0, end=0)])
+        >>> problem_instance.add_job([vroom.Job(1414, location=1),
+        ...                           vroom.Job(1515, location=2)])
+        >>> results = vroom.tune(
+        ...     [problem_instance],
+        ...     time_budget=timedelta(seconds=10),
+        ...     configurations=[dict(exploration_level=1), dict(nb_searches=4, depth=0)],
+        ... )
+        >>> results = results.sort_values("nb_searches")
+        >>> results[["nb_searches", "depth", "exploration_level", "cost"]].values.tolist()
+        [[4, 0, 0, 4556], [8, 1, 1, 4556]]
+
+    Args:
+        inputs:
+            Problem instances, or paths to VROOM JSON files.
+        time_budget:
+            Stop starting new configurations once this much time is spent.
+        configurations:
+            Keyword arguments of `Input.solve` to try, among
+            `exploration_level`, `nb_searches`, `depth` and `nb_threads`.
+            Missing searches and depth follow the exploration level, and
+            the thread count defaults to 1. Defaults to the exploration
+            levels and a grid of searches and depths, on 1, 4 and all
+            cores.
+        sample:
+            Number of problems drawn from `inputs`. Defaults to all of them.
+        seed:
+            Seed for drawing the sample.
+        kwargs:
+            Passed on to `Input.from_json` for the problems given as paths.
+
+    Returns:
+        One row per configuration that was run, with its `nb_searches`,
+        `depth` and `nb_threads`, the `exploration_level` it matches if
+        any, and its total `unassigned`, `cost` and `wall_time` in
+        seconds. The `pareto` column flags the configurations for which
+        no faster one does at least as well, by unassigned tasks first and
+        cost second. Rows are sorted by wall time.
+    """
+    problems: Sequence[Union[Input, str, Path]] = list(inputs)
+    if sample is not None and sample < len(problems):
+        problems = random.Random(seed).sample(problems, sample)
+    problems = [
+        problem if isinstance(problem, Input) else Input.from_json(problem, **kwargs)
+        for problem in problems
+    ]
+    if configurations is None:
+        configurations = _default_configurations()
+    resolved = sorted(
+        (_resolve(configuration) for configuration in configurations),
+        key=lambda c: c["nb_searches"] * (c["depth"] + 1) / c["nb_threads"],
+    )
+    levels = _levels()
+
+    rows = []
+    deadline = time.perf_counter() + time_budget.total_seconds()
+    for configuration in resolved:
+        if rows and time.perf_counter() >= deadline:
+            break
+        unassigned = cost = 0
+        wall_time = 0.0
+        for problem in problems:
+            start = time.perf_counter()
+            solution = problem.solve(_vroom.DEFAULT_EXPLORATION_LEVEL, timeout=None, **configuration)
+            wall_time += time.perf_counter() - start
+            unassigned += solution.summary.unassigned
+            cost += solution.summary.cost
+        rows.append(
+            dict(
+                configuration,
+                exploration_level=levels.get((configuration["nb_searches"], configuration["depth"])),
+                unassigned=unassigned,
+                cost=cost,
+                wall_time=wall_time,
+            )
+        )
+
+    frame = pandas.DataFrame(
+        rows,
+        columns=[
+            "nb_searches",
+            "depth",
+            "nb_threads",
+            "exploration_level",
+            "unassigned",
+            "cost",
+            "wall_time",
+        ],
+    )
+    frame["exploration_level"] = frame["exploration_level"].astype("Int64")
+    frame["pareto"] = _pareto(frame)
+    return frame.sort_values("wall_time", ignore_index=True)
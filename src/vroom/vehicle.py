@@ -1,5 +1,5 @@
 from __future__ import annotations
-from typing import List, Optional, Sequence, Set, Union
+from typing import Any, Dict, List, Optional, Sequence, Set, Tuple, Union
 
 import numpy
 
@@ -151,6 +151,14 @@ class Vehicle(_vroom.Vehicle):
         )
         assert isinstance(self.capacity, Amount)
 
+    def __getstate__(self) -> Tuple[bytes, Dict[str, Any]]:
+        return self._state(), self.__dict__
+
+    def __setstate__(self, state: Tuple[bytes, Dict[str, Any]]) -> None:
+        native, attributes = state
+        _vroom.Vehicle.__init__(self, native)
+        self.__dict__.update(attributes)
+
     def __repr__(self) -> str:
         args = [f"{self.id}"]
         if self.start is not None:
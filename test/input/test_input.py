@@ -0,0 +1,702 @@
+import asyncio
+from datetime import timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import json
+import pickle
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy
+import pandas
+import pytest
+
+import vroom
+from vroom import _vroom
+from vroom.input import input as input_module
+
+DURATIONS = [[0, 2104, 197, 1299],
+             [2103, 0, 2255, 3152],
+             [197, 2256, 0, 1102],
+             [1299, 3153, 1102, 0]]
+
+
+def test_add_jobs_from_arrays():
+    reference = vroom.Input()
+    reference.add_job([
+        vroom.Job(1414, location=0, default_service=5, delivery=[1], skills={1},
+                  time_windows=[(0, 100), (200, 300)], description="a"),
+        vroom.Job(1515, location=1, delivery=[2], priority=7),
+        vroom.Job(1616, location=2, delivery=[3], skills={0, 3},
+                  time_windows=[(50, 60)], description="c"),
+    ])
+
+    problem_instance = vroom.Input()
+    problem_instance.add_jobs_from_arrays(
+        ids=numpy.array([1414, 1515, 1616]),
+        locations=numpy.array([0, 1, 2]),
+        default_service=[5, 0, 0],
+        delivery=[1, 2, 3],
+        skills=[0b10, 0, 0b1001],
+        priority=[0, 7, 0],
+        tw_starts=[0, 200, 50],
+        tw_ends=[100, 300, 60],
+        tw_offsets=[0, 2, 2, 3],
+        descriptions=["a", "", "c"],
+    )
+
+    assert len(problem_instance.jobs) == len(reference.jobs)
+    for job, expected in zip(problem_instance.jobs, reference.jobs):
+        assert job._id == expected._id
+        assert job._location == expected._location
+        assert job._default_service == expected._default_service
+        assert vroom.Amount(job._delivery) == expected._delivery
+        assert vroom.Amount(job._pickup) == expected._pickup
+        assert job._skills == expected._skills
+        assert job._priority == expected._priority
+        assert ([vroom.TimeWindow(tw) for tw in job._time_windows]
+                == [vroom.TimeWindow(tw) for tw in expected._time_windows])
+        assert job._description == expected._description
+    assert problem_instance.job_id_to_rank == reference.job_id_to_rank
+
+
+def test_add_jobs_from_arrays_solve():
+    problem_instance = vroom.Input()
+    problem_instance.set_durations_matrix("car", DURATIONS)
+    problem_instance.add_vehicle([vroom.Vehicle(7, start=0, end=0),
+                                  vroom.Vehicle(8, start=2, end=2)])
+    problem_instance.add_jobs_from_arrays(ids=[1414, 1515, 1616, 1717],
+                                          locations=[0, 1, 2, 3])
+    solution = problem_instance.solve(exploration_level=5, nb_threads=4)
+    assert solution.summary.cost == 6411
+
+
+def test_add_jobs_from_arrays_coordinates():
+    problem_instance = vroom.Input()
+    problem_instance.add_jobs_from_arrays(ids=[1, 2],
+                                          locations=[[2.44, 48.81], [2.46, 48.7]])
+    assert problem_instance.jobs[1]._location == vroom.Location(index=1, coords=[2.46, 48.7])
+
+
+def test_add_jobs_from_arrays_errors():
+    problem_instance = vroom.Input()
+    with pytest.raises(_vroom.VroomInputException):
+        problem_instance.add_jobs_from_arrays(ids=[1, 2], locations=[0])
+    with pytest.raises(_vroom.VroomInputException):
+        problem_instance.add_jobs_from_arrays(ids=[1, 2], locations=[0, 1],
+                                              tw_starts=[0, 0], tw_ends=[1, 1],
+                                              tw_offsets=[0, 1, 3])
+    with pytest.raises(_vroom.VroomInputException):
+        problem_instance.add_jobs_from_arrays(ids=[1, 1], locations=[0, 1])
+    with pytest.raises(_vroom.VroomInputException, match="ids"):
+        problem_instance.add_jobs_from_arrays(ids=[1.7], locations=[0])
+    with pytest.raises(_vroom.VroomInputException, match="skills"):
+        problem_instance.add_jobs_from_arrays(ids=[1], locations=[0], skills=[1.5])
+    with pytest.raises(_vroom.VroomInputException, match="priority"):
+        problem_instance.add_jobs_from_arrays(ids=[1], locations=[0], priority=[2**32])
+    with pytest.raises(_vroom.VroomInputException, match="tw_starts"):
+        problem_instance.add_jobs_from_arrays(ids=[1], locations=[0],
+                                              tw_starts=[-1], tw_ends=[10])
+    with pytest.raises(_vroom.VroomInputException, match="delivery"):
+        problem_instance.add_jobs_from_arrays(ids=[1], locations=[0], delivery=[0.5])
+    with pytest.raises(_vroom.VroomInputException, match="pickup_ids"):
+        problem_instance.add_shipments_from_arrays(pickup_ids=[-1], pickup_locations=[0],
+                                                   delivery_ids=[2], delivery_locations=[1])
+
+
+def test_add_vehicles_from_arrays():
+    reference = vroom.Input()
+    reference.add_vehicle([
+        vroom.Vehicle(7, start=0, end=0, capacity=[4, 5], skills={2},
+                      time_window=(10, 1000), description="seven", max_distance=None,
+                      costs=vroom.VehicleCosts(fixed=100, per_hour=60, per_km=5)),
+        vroom.Vehicle(8, start=2, profile="bus", capacity=[6, 7], speed_factor=2.0,
+                      max_tasks=3, max_travel_time=500, max_distance=600),
+    ])
+
+    problem_instance = vroom.Input()
+    problem_instance.add_vehicles_from_arrays(
+        ids=[7, 8],
+        start=[0, 2],
+        end=[0, -1],
+        profiles=["car", "bus"],
+        capacity=[[4, 5], [6, 7]],
+        skills=[0b100, 0],
+        tw_starts=[10, 0],
+        tw_ends=[1000, 4294967295],
+        cost_fixed=[100, 0],
+        cost_per_hour=[60, 3600],
+        cost_per_km=[5, 0],
+        speed_factor=[1.0, 2.0],
+        max_tasks=numpy.ma.masked_array([0, 3], mask=[True, False]),
+        max_travel_time=pandas.array([None, 500], dtype="Int64"),
+        max_distance=[numpy.nan, 600],
+        descriptions=["seven", ""],
+    )
+
+    assert len(problem_instance.vehicles) == len(reference.vehicles)
+    for vehicle, expected in zip(problem_instance.vehicles, reference.vehicles):
+        assert vehicle._id == expected._id
+        assert vehicle._start == expected._start
+        assert vehicle._end == expected._end
+        assert vehicle._profile == expected._profile
+        assert vroom.Amount(vehicle._capacity) == expected._capacity
+        assert vehicle._skills == expected._skills
+        assert vroom.TimeWindow(vehicle._time_window) == vroom.TimeWindow(expected._time_window)
+        assert vehicle._description == expected._description
+        assert vehicle._costs._fixed == expected._costs._fixed
+        assert vehicle._costs._per_hour == expected._costs._per_hour
+        assert vehicle._costs._per_km == expected._costs._per_km
+        assert vehicle._max_tasks == expected._max_tasks
+        assert vehicle._max_travel_time == expected._max_travel_time
+        assert vehicle._max_distance == expected._max_distance
+
+    with pytest.raises(_vroom.VroomInputException, match="cost_per_hour"):
+        problem_instance.add_vehicles_from_arrays(ids=[9], start=[0], cost_per_hour=[1.5])
+
+
+def test_add_vehicles_from_frame():
+    frame = pandas.DataFrame({
+        "id": [7, 8],
+        "start_lon": [2.44, numpy.nan],
+        "start_lat": [48.81, numpy.nan],
+        "end_lon": [2.44, 2.46],
+        "end_lat": [48.81, 48.7],
+        "capacity": [4, 6],
+        "profile": ["car", "bus"],
+        "description": ["seven", "eight"],
+    })
+    problem_instance = vroom.Input()
+    problem_instance.add_vehicles_from_frame(frame)
+
+    first, second = problem_instance.vehicles
+    assert first._start == vroom.Location(index=0, coords=[2.44, 48.81])
+    assert second._start is None
+    assert second._end == vroom.Location(index=1, coords=[2.46, 48.7])
+    assert vroom.Amount(second._capacity) == vroom.Amount([6])
+    assert second._profile == "bus"
+    assert first._description == "seven"
+
+
+def test_add_vehicles_from_arrays_solve():
+    problem_instance = vroom.Input()
+    problem_instance.set_durations_matrix("car", DURATIONS)
+    problem_instance.add_vehicles_from_arrays(ids=[7, 8], start=[0, 2], end=[0, 2])
+    problem_instance.add_jobs_from_arrays(ids=[1414, 1515, 1616, 1717],
+                                          locations=[0, 1, 2, 3])
+    solution = problem_instance.solve(exploration_level=5, nb_threads=4)
+    assert solution.summary.cost == 6411
+
+    with pytest.raises(_vroom.VroomInputException):
+        problem_instance.add_vehicles_from_arrays(ids=[9], start=[-1], end=[-1])
+
+
+def test_add_shipments_from_arrays():
+    problem_instance = vroom.Input()
+    problem_instance.add_shipments_from_arrays(
+        pickup_ids=[1, 2],
+        pickup_locations=[0, 0],
+        delivery_ids=[3, 4],
+        delivery_locations=[1, 2],
+        amount=[[5], [6]],
+        skills=[0b1, 0],
+        pickup_tw_starts=[10],
+        pickup_tw_ends=[20],
+        pickup_tw_offsets=[0, 1, 1],
+        delivery_descriptions=["three", "four"],
+    )
+    pickup, delivery, _, last = problem_instance.jobs
+    assert pickup._type == _vroom.JOB_TYPE.PICKUP
+    assert delivery._type == _vroom.JOB_TYPE.DELIVERY
+    assert vroom.Amount(pickup._pickup) == vroom.Amount([5])
+    assert vroom.Amount(delivery._delivery) == vroom.Amount([5])
+    assert pickup._skills == delivery._skills == {0}
+    assert vroom.TimeWindow(pickup._time_windows[0]) == vroom.TimeWindow(10, 20)
+    assert last._location == vroom.Location(2)
+    assert last._description == "four"
+
+
+def test_dataframe_round_trip():
+    problem_instance = vroom.Input()
+    problem_instance.add_job([
+        vroom.Job(1, location=0, delivery=[1, 2], time_windows=[(0, 5), (7, 9)]),
+        vroom.Shipment(
+            vroom.ShipmentStep(2, location=1, time_windows=[(3, 4)], description="p"),
+            vroom.ShipmentStep(3, location=2),
+            amount=[3, 4],
+            skills={1},
+        ),
+        vroom.Job(4, location=3, pickup=[0, 1], priority=5),
+    ])
+    problem_instance.add_vehicle([
+        vroom.Vehicle(7, start=0, capacity=[5, 5]),
+        vroom.Vehicle(8, end=2, capacity=[5, 5], time_window=(1, 100), max_tasks=4),
+    ])
+
+    frames = problem_instance.to_dataframe()
+    assert frames["jobs"]["id"].tolist() == [1, 4]
+    assert frames["jobs"]["tw_end_1"].isna().tolist() == [False, True]
+    assert frames["shipments"][["pickup_id", "delivery_id"]].to_numpy().tolist() == [[2, 3]]
+    assert frames["shipments"]["amount_1"].tolist() == [4]
+    assert frames["vehicles"]["start"].isna().tolist() == [False, True]
+    assert frames["vehicles"]["tw_start"].isna().tolist() == [True, False]
+
+    copy = vroom.Input.from_dataframe(**frames)
+    assert [job._id for job in copy.jobs] == [1, 2, 3, 4]
+    for name, frame in copy.to_dataframe().items():
+        pandas.testing.assert_frame_equal(frame, frames[name])
+
+    # Without ranks, shipments come after jobs.
+    copy = vroom.Input.from_dataframe(
+        jobs=frames["jobs"].reset_index(drop=True), shipments=frames["shipments"])
+    assert [job._id for job in copy.jobs] == [1, 4, 2, 3]
+
+
+def test_dataframe_round_trip_unbounded():
+    problem_instance = vroom.Input()
+    problem_instance.add_vehicle([
+        vroom.Vehicle(7, start=0, max_distance=None),
+        vroom.Vehicle(8, start=0, max_tasks=3, max_travel_time=500, max_distance=600),
+    ])
+
+    frames = problem_instance.to_dataframe()
+    assert frames["vehicles"]["max_travel_time"].isna().tolist() == [True, False]
+    copy = vroom.Input.from_dataframe(**frames)
+    for vehicle, expected in zip(copy.vehicles, problem_instance.vehicles):
+        assert vehicle._max_tasks == expected._max_tasks
+        assert vehicle._max_travel_time == expected._max_travel_time
+        assert vehicle._max_distance == expected._max_distance
+
+
+def test_from_dataframe_solve():
+    problem_instance = vroom.Input.from_dataframe(
+        jobs=pandas.DataFrame({"id": [1414, 1515, 1616, 1717], "location": [0, 1, 2, 3]}),
+        vehicles=pandas.DataFrame({"id": [7, 8], "start": [0, 2], "end": [0, 2]}),
+    )
+    problem_instance.set_durations_matrix("car", DURATIONS)
+    solution = problem_instance.solve(exploration_level=5, nb_threads=4)
+    assert solution.summary.cost == 6411
+
+
+def mixed_problem():
+    problem_instance = vroom.Input(servers={"bike": "localhost:5000"})
+    problem_instance.set_durations_matrix("car", DURATIONS)
+    problem_instance.set_distances_matrix("car", numpy.asarray(DURATIONS) * 2)
+    problem_instance.add_job([
+        vroom.Job(1, location=vroom.Location(1, coords=(1.5, 2.5)), delivery=[1],
+                  time_windows=[(0, 5000), (6000, 9000)], skills={1, 70},
+                  description="a", setup_per_type={"van": 3}),
+        vroom.Shipment(
+            vroom.ShipmentStep(2, location=2, description="p"),
+            vroom.ShipmentStep(3, location=3),
+            amount=[1],
+        ),
+        vroom.Job(4, location=3, pickup=[1], priority=5, default_service=7),
+    ])
+    problem_instance.add_vehicle([
+        vroom.Vehicle(
+            7, start=0, end=0, capacity=[3], skills={1, 70}, speed_factor=1.3,
+            breaks=[vroom.Break(5, [(0, 9000)], service=5, max_load=[3])],
+            time_window=(0, 20000), max_travel_time=9000, description="van",
+            steps=[vroom.VehicleStepStart(), vroom.VehicleStepSingle(1),
+                   vroom.VehicleStepEnd()],
+        ),
+        vroom.Vehicle(8, end=3, capacity=[2], costs=vroom.VehicleCosts(fixed=10)),
+    ])
+    return problem_instance
+
+
+def test_dataframe_round_trip_large_skills():
+    problem_instance = vroom.Input()
+    problem_instance.add_job([
+        vroom.Job(1, location=1, skills={1, 70}),
+        vroom.Shipment(vroom.ShipmentStep(2, location=2), vroom.ShipmentStep(3, location=3),
+                       skills={64}),
+        vroom.Job(4, location=3),
+    ])
+    problem_instance.add_vehicle([
+        vroom.Vehicle(7, start=0, skills={1, 64, 70}),
+        vroom.Vehicle(8, start=0),
+    ])
+
+    frames = problem_instance.to_dataframe()
+    assert frames["jobs"]["skills"].tolist() == [{1, 70}, set()]
+    assert frames["shipments"]["skills"].tolist() == [{64}]
+    assert frames["vehicles"]["skills"].tolist() == [{1, 64, 70}, set()]
+
+    copy = vroom.Input.from_dataframe(**frames)
+    assert [job._skills for job in copy.jobs] == [{1, 70}, {64}, {64}, set()]
+    assert [vehicle._skills for vehicle in copy.vehicles] == [{1, 64, 70}, set()]
+    for name, frame in copy.to_dataframe().items():
+        pandas.testing.assert_frame_equal(frame, frames[name])
+
+    with pytest.raises(_vroom.VroomInputException):
+        copy.add_jobs_from_arrays(ids=[9, 10], locations=[0, 1], skills=[{70}, 1])
+
+
+def test_pickle():
+    problem_instance = mixed_problem()
+    buffers = []
+    data = pickle.dumps(problem_instance, protocol=5, buffer_callback=buffers.append)
+    matrix = numpy.asarray(DURATIONS, dtype="uint32")
+    assert any(bytes(buffer.raw()) == matrix.tobytes() for buffer in buffers)
+    assert len(data) < 2000
+
+    for copy in [pickle.loads(data, buffers=buffers),
+                 pickle.loads(pickle.dumps(problem_instance, protocol=4))]:
+        assert copy._servers["bike"].port == "5000"
+        assert copy._distances
+        assert [job._id for job in copy.jobs] == [1, 2, 3, 4]
+        assert copy.jobs[0]._skills == {1, 70}
+        assert vroom.Location(copy.jobs[0]._location).coords == (1.5, 2.5)
+        assert [len(vehicle._steps) for vehicle in copy.vehicles] == [3, 0]
+        expected = problem_instance.solve(exploration_level=5, nb_threads=1).to_dict()
+        result = copy.solve(exploration_level=5, nb_threads=1).to_dict()
+        del expected["summary"]["computing_times"], result["summary"]["computing_times"]
+        assert result == expected
+
+
+@pytest.mark.parametrize("mmap", [True, False])
+def test_save_load(tmp_path, mmap):
+    problem_instance = mixed_problem()
+    problem_instance.save(tmp_path / "problem.vroom")
+    copy = vroom.Input.load(tmp_path / "problem.vroom", mmap=mmap)
+    assert isinstance(copy, vroom.Input)
+    assert copy._servers["bike"].port == "5000"
+    assert copy._router == vroom._vroom.ROUTER.OSRM
+    assert copy._distances
+    assert [job._id for job in copy.jobs] == [1, 2, 3, 4]
+    assert copy.jobs[0]._skills == {1, 70}
+    assert [len(vehicle._steps) for vehicle in copy.vehicles] == [3, 0]
+    expected = problem_instance.solve(exploration_level=5, nb_threads=1).to_dict()
+    result = copy.solve(exploration_level=5, nb_threads=1).to_dict()
+    del expected["summary"]["computing_times"], result["summary"]["computing_times"]
+    assert result == expected
+
+    with (tmp_path / "problem.vroom").open("rb") as handle:
+        header = handle.read(64)
+    assert header.startswith(b"VROOMBIN")
+    (tmp_path / "problem.json").write_text("{\"jobs\": []}" + " " * 64)
+    with pytest.raises(ValueError):
+        vroom.Input.load(tmp_path / "problem.json")
+
+
+def test_solve_initial_solution():
+    def problem(jobs, skills=None):
+        problem_instance = vroom.Input()
+        problem_instance.set_durations_matrix("car", DURATIONS)
+        problem_instance.add_vehicle([
+            vroom.Vehicle(7, start=0, end=0, skills=skills),
+            vroom.Vehicle(8, start=3, end=3),
+        ])
+        for job in jobs:
+            problem_instance.add_job(job)
+        return problem_instance
+
+    shipment = vroom.Shipment(vroom.ShipmentStep(5, location=1),
+                              vroom.ShipmentStep(6, location=2))
+    previous = problem([vroom.Job(1, location=1), vroom.Job(2, location=2),
+                        vroom.Job(3, location=3), shipment]).solve(
+        exploration_level=5, nb_threads=1)
+
+    # Cancelled jobs and half shipments are left out of the initial routes.
+    problem_instance = problem([
+        vroom.Job(1, location=1), vroom.Job(3, location=3), vroom.Job(4, location=2),
+        vroom.Shipment(vroom.ShipmentStep(5, location=1), vroom.ShipmentStep(9, location=2)),
+    ])
+    routes = problem_instance._initial_routes(previous)
+    planned = {route.vehicle: [step._id for step in route.steps if step._step_type == _vroom.STEP_TYPE.JOB]
+               for route in previous._routes}
+    assert [[step._id for step in steps] for steps in routes] == [
+        [idx for idx in planned.get(vehicle, []) if idx in (1, 3)] for vehicle in (7, 8)]
+
+    solution = problem_instance.solve(exploration_level=5, nb_threads=1, initial_solution=previous)
+    expected = problem_instance.solve(exploration_level=5, nb_threads=1)
+    assert solution.summary.unassigned == expected.summary.unassigned == 0
+    assert [vehicle._steps for vehicle in problem_instance.vehicles] == [[], []]
+
+    # Routes no longer feasible fall back to solving from scratch.
+    problem_instance = problem([vroom.Job(1, location=1, skills={1}), vroom.Job(2, location=2),
+                                vroom.Job(3, location=3)], skills={2})
+    solution = problem_instance.solve(exploration_level=5, nb_threads=1, initial_solution=previous)
+    assert solution.summary.unassigned == 1
+
+
+def test_solve_initial_solution_replan(monkeypatch):
+    problem_instance = vroom.Input()
+    problem_instance.set_durations_matrix("car", DURATIONS)
+    problem_instance.add_vehicle(vroom.Vehicle(7, start=0, end=0, capacity=[10]))
+    problem_instance.add_job([vroom.Job(1, location=1, delivery=[1]),
+                              vroom.Job(2, location=2, delivery=[1])])
+    previous = problem_instance.solve(exploration_level=5, nb_threads=1)
+
+    problem_instance.update_job(2, vroom.Job(2, location=2, delivery=[2]))
+    problem_instance.add_job(vroom.Job(3, location=3, delivery=[1]))
+    solution = problem_instance.solve(exploration_level=5, nb_threads=1,
+                                      initial_solution=previous)
+    assert solution.summary.unassigned == 0
+
+    # Errors in the problem itself are not retried without the routes.
+    calls = []
+    solve = vroom.Input._solve
+    monkeypatch.setattr(vroom.Input, "_solve", lambda self, **kwargs: (
+        calls.append(kwargs) or solve(self, **kwargs)))
+    problem_instance.add_vehicle(vroom.Vehicle(8, start=0, end=0, capacity=[10],
+                                               profile="bike"))
+    with pytest.raises(_vroom.VroomInputException):
+        problem_instance.solve(exploration_level=5, nb_threads=1, initial_solution=previous)
+    assert len(calls) == 1
+
+
+def test_remove_update():
+    def problem(jobs, vehicles):
+        problem_instance = vroom.Input()
+        problem_instance.set_durations_matrix("car", DURATIONS)
+        problem_instance.add_vehicle(vehicles)
+        problem_instance.add_job(jobs)
+        return problem_instance
+
+    problem_instance = problem(
+        [vroom.Job(1, location=1), vroom.Job(2, location=2),
+         vroom.Shipment(vroom.ShipmentStep(5, location=1), vroom.ShipmentStep(6, location=2)),
+         vroom.Job(3, location=3, time_windows=[(0, 10)])],
+        [vroom.Vehicle(7, start=0, end=0), vroom.Vehicle(8, start=3, end=3, skills={1})],
+    )
+    problem_instance.remove_job(2)
+    problem_instance.remove_shipment(5)
+    problem_instance.update_job(3, vroom.Job(4, location=3))
+    problem_instance.remove_vehicle(7)
+    problem_instance.update_vehicle(8, vroom.Vehicle(9, start=1, end=1))
+
+    expected = problem([vroom.Job(1, location=1), vroom.Job(4, location=3)],
+                       [vroom.Vehicle(9, start=1, end=1)])
+    assert problem_instance.job_id_to_rank == expected.job_id_to_rank == {1: 0, 4: 1}
+    assert problem_instance.pickup_id_to_rank == {}
+    assert not problem_instance.has_skills()
+    result = problem_instance.solve(exploration_level=5, nb_threads=1).to_dict()
+    expected = expected.solve(exploration_level=5, nb_threads=1).to_dict()
+    del expected["summary"]["computing_times"], result["summary"]["computing_times"]
+    assert result == expected
+
+    for method, args in [("remove_job", (2,)), ("remove_shipment", (1,)),
+                         ("update_job", (1, vroom.Job(4, location=1))),
+                         ("remove_vehicle", (7,)),
+                         ("update_vehicle", (9, vroom.Vehicle(10, start=0, capacity=[1])))]:
+        with pytest.raises(_vroom.VroomInputException):
+            getattr(problem_instance, method)(*args)
+    assert [vehicle._id for vehicle in problem_instance.vehicles] == [9]
+
+
+def test_remove_update_resolve():
+    problem_instance = vroom.Input()
+    problem_instance.set_durations_matrix("car", DURATIONS)
+    problem_instance.add_vehicle(vroom.Vehicle(7, start=0, end=0, capacity=[10], max_tasks=5))
+    problem_instance.add_job([vroom.Job(1, location=1, delivery=[1]),
+                              vroom.Job(2, location=2, delivery=[1])])
+    assert problem_instance.solve(exploration_level=5, nb_threads=1).summary.unassigned == 0
+    # Solving must not leave the caps derived from the jobs of the time.
+    assert problem_instance.vehicles[0]._max_tasks == 5
+
+    problem_instance.remove_job(2)
+    problem_instance.add_job([vroom.Job(3, location=2, delivery=[1]),
+                              vroom.Job(4, location=3, delivery=[1])])
+    solution = problem_instance.solve(exploration_level=5, nb_threads=1)
+    assert solution.summary.unassigned == 0
+    assert problem_instance.vehicles[0]._max_tasks == 5
+
+
+def test_fork():
+    problem_instance = vroom.Input()
+    problem_instance.set_durations_matrix("car", DURATIONS)
+    problem_instance.add_vehicle([vroom.Vehicle(7, start=0, end=0, capacity=[2]),
+                                  vroom.Vehicle(8, start=3, end=3, capacity=[2])])
+    problem_instance.add_job([vroom.Job(idx, location=idx, delivery=[1]) for idx in (1, 2, 3)])
+    expected = problem_instance.solve(exploration_level=5, nb_threads=1).to_dict()
+
+    scenarios = [problem_instance.fork() for _ in range(3)]
+    scenarios[1].remove_vehicle(8)
+    scenarios[2].update_job(3, vroom.Job(3, location=3, delivery=[3]))
+    assert [len(scenario.vehicles) for scenario in scenarios] == [2, 1, 2]
+    assert len(problem_instance.vehicles) == 2
+
+    with ThreadPoolExecutor(3) as executor:
+        results = list(executor.map(
+            lambda scenario: scenario.solve(exploration_level=5, nb_threads=1).to_dict(),
+            scenarios))
+    for result in [expected] + results:
+        del result["summary"]["computing_times"]
+    assert results[0] == expected
+    assert results[1]["summary"]["unassigned"] == 1
+    assert results[2]["summary"]["unassigned"] == 1
+    assert problem_instance.solve(exploration_level=5, nb_threads=1).summary.unassigned == 0
+
+
+def test_fork_solved():
+    problem_instance = vroom.Input()
+    problem_instance.set_durations_matrix("car", DURATIONS)
+    problem_instance.add_vehicle(vroom.Vehicle(7, start=0, end=0, capacity=[10]))
+    problem_instance.add_job(vroom.Job(1, location=1, delivery=[1]))
+    max_tasks = problem_instance.vehicles[0]._max_tasks
+    assert problem_instance.solve(exploration_level=5, nb_threads=1).summary.unassigned == 0
+
+    # The fork must not inherit caps derived from the jobs of the parent.
+    scenario = problem_instance.fork()
+    assert scenario.vehicles[0]._max_tasks == max_tasks
+    scenario.add_job([vroom.Job(2, location=2, delivery=[1]),
+                      vroom.Job(3, location=3, delivery=[1])])
+    solution = scenario.solve(exploration_level=5, nb_threads=1)
+    assert solution.summary.unassigned == 0
+
+
+def test_solve_nb_searches_depth(monkeypatch):
+    problem_instance = vroom.Input()
+    problem_instance.set_durations_matrix("car", DURATIONS)
+    problem_instance.add_vehicle(vroom.Vehicle(7, start=0, end=0))
+    problem_instance.add_job([vroom.Job(idx, location=idx) for idx in (1, 2, 3)])
+    expected = problem_instance.solve(exploration_level=5, nb_threads=1).summary.cost
+
+    calls = []
+    solve = vroom.Input._solve
+    monkeypatch.setattr(vroom.Input, "_solve", lambda self, **kwargs: (
+        calls.append(kwargs) or solve(self, **kwargs)))
+    assert problem_instance.solve(exploration_level=3, nb_threads=1, depth=1).summary.cost == expected
+    assert problem_instance.solve(exploration_level=3, nb_threads=1, nb_searches=2).summary.cost == expected
+    assert [(call["nb_searches"], call["depth"]) for call in calls] == [(16, 1), (2, 3)]
+    with pytest.raises(_vroom.VroomInputException):
+        problem_instance.solve(exploration_level=3, nb_searches=0)
+
+
+class OsrmStub(BaseHTTPRequestHandler):
+    """Answer OSRM table queries from a Python thread."""
+
+    answered = threading.Event()
+
+    def do_GET(self):
+        size = len(self.path.split("/")[-1].split("?")[0].split(";"))
+        matrix = [[abs(i - j) * 100 for j in range(size)] for i in range(size)]
+        body = json.dumps({"code": "Ok", "durations": matrix, "distances": matrix}).encode()
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+        self.answered.set()
+
+    def log_message(self, format, *args):
+        pass
+
+
+def test_solve_releases_gil():
+    # The native routing waits for the stub while solving, and the stub can
+    # only answer if the solving thread let go of the GIL.
+    OsrmStub.answered.clear()
+    server = ThreadingHTTPServer(("127.0.0.1", 0), OsrmStub)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        problem_instance = vroom.Input(servers={"car": f"127.0.0.1:{server.server_address[1]}"})
+        problem_instance.add_vehicle(vroom.Vehicle(7, start=(2.44, 48.81), end=(2.44, 48.81)))
+        problem_instance.add_job([vroom.Job(1, location=(2.46, 48.7)),
+                                  vroom.Job(2, location=(2.42, 48.6))])
+        solution = problem_instance.solve(exploration_level=5, nb_threads=1)
+    finally:
+        server.shutdown()
+        server.server_close()
+    assert OsrmStub.answered.is_set()
+    assert solution.summary.unassigned == 0
+
+
+def make_problem():
+    problem_instance = vroom.Input()
+    problem_instance.set_durations_matrix("car", DURATIONS)
+    problem_instance.add_vehicles_from_arrays(ids=[7, 8], start=[0, 2], end=[0, 2])
+    problem_instance.add_jobs_from_arrays(ids=[1414, 1515, 1616, 1717],
+                                          locations=[0, 1, 2, 3])
+    return problem_instance
+
+
+def test_solve_async():
+    async def solve_all():
+        return await asyncio.gather(*[
+            make_problem().solve_async(exploration_level=5, nb_threads=2)
+            for _ in range(4)
+        ])
+    solutions = asyncio.run(solve_all())
+    assert [solution.summary.cost for solution in solutions] == [6411] * 4
+
+
+def test_solve_async_timeout():
+    timeout = timedelta(seconds=60)
+    assert make_problem().solve(exploration_level=5, timeout=timeout).summary.cost == 6411
+    solution = asyncio.run(make_problem().solve_async(exploration_level=5, timeout=timeout))
+    assert solution.summary.cost == 6411
+
+
+def test_solve_exclusive(monkeypatch):
+    problem_instance = make_problem()
+    started, release = threading.Event(), threading.Event()
+    solve = vroom.Input._solve
+
+    def blocking_solve(self, **kwargs):
+        started.set()
+        release.wait()
+        return solve(self, **kwargs)
+
+    monkeypatch.setattr(vroom.Input, "_solve", blocking_solve)
+
+    async def cancel_running_solve():
+        task = asyncio.ensure_future(problem_instance.solve_async(exploration_level=5))
+        await asyncio.get_running_loop().run_in_executor(None, started.wait)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    # The cancelled solve keeps running in the background.
+    asyncio.run(cancel_running_solve())
+    for call in (lambda: problem_instance.solve(exploration_level=5),
+                 lambda: problem_instance.check(),
+                 lambda: problem_instance.add_job(vroom.Job(1818, location=1)),
+                 lambda: problem_instance.remove_vehicle(7),
+                 lambda: problem_instance.fork()):
+        with pytest.raises(RuntimeError):
+            call()
+
+    release.set()
+    with problem_instance._busy:
+        pass
+    problem_instance.add_job(vroom.Job(1818, location=1))
+    assert problem_instance.solve(exploration_level=5).summary.unassigned == 0
+
+
+class _ObservedBudget(input_module._CoreBudget):
+    """Core budget signalling when a caller has to wait for cores."""
+
+    def __init__(self, cores):
+        super().__init__(cores)
+        self.waiting = threading.Event()
+
+    def acquire(self, threads):
+        with self._condition:
+            if self.used + threads > self.cores:
+                self.waiting.set()
+        return super().acquire(threads)
+
+
+def test_solve_async_cancel(monkeypatch):
+    budget = _ObservedBudget(2)
+    monkeypatch.setattr(input_module, "_ASYNC_CORES", budget)
+    problem_instance = make_problem()
+    calls = []
+    monkeypatch.setattr(problem_instance, "solve", lambda **kwargs: calls.append(kwargs))
+
+    async def cancel_waiting_solve():
+        task = asyncio.ensure_future(problem_instance.solve_async(exploration_level=5))
+        assert await asyncio.to_thread(budget.waiting.wait, 10)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    # Hold all cores, so that the solve is still waiting when cancelled.
+    budget.acquire(2)
+    asyncio.run(cancel_waiting_solve())
+    budget.release(2)
+    with budget._condition:
+        assert budget._condition.wait_for(lambda: budget.used == 0, timeout=10)
+    assert calls == []
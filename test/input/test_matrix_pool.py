@@ -0,0 +1,70 @@
+import numpy
+import pandas
+import pytest
+
+import vroom
+from vroom import _vroom
+
+DURATIONS = numpy.array([[0, 2104, 197, 1299],
+                         [2103, 0, 2255, 3152],
+                         [197, 2256, 0, 1102],
+                         [1299, 3153, 1102, 0]])
+
+# The four locations above, scattered in a pool of seven.
+POOL_INDICES = [5, 1, 6, 3]
+
+
+def pool_matrix():
+    matrix = numpy.full((7, 7), 99999, dtype="uint32")
+    matrix[numpy.ix_(POOL_INDICES, POOL_INDICES)] = DURATIONS
+    return matrix
+
+
+def test_sub_matrix():
+    full = numpy.arange(100 * 100, dtype="uint32").reshape(100, 100)
+    indices = numpy.random.default_rng(0).choice(100, size=40, replace=False)
+    for nb_threads in [1, 3, 64]:
+        sub = _vroom._sub_matrix(full, indices, nb_threads=nb_threads)
+        numpy.testing.assert_array_equal(numpy.asarray(sub), full[numpy.ix_(indices, indices)])
+    with pytest.raises(_vroom.VroomInputException):
+        _vroom._sub_matrix(full, [0, 100])
+
+
+def test_matrix_pool_from_dataframe(tmp_path):
+    numpy.save(tmp_path / "pool.npy", pool_matrix())
+    pool = vroom.MatrixPool(durations={"car": tmp_path / "pool.npy"})
+    assert len(pool) == 7
+
+    problem_instance = pool.from_dataframe(
+        jobs=pandas.DataFrame({"id": [1414, 1515, 1616, 1717], "location": POOL_INDICES}),
+        vehicles=pandas.DataFrame({
+            "id": [7, 8],
+            "start": [POOL_INDICES[0], POOL_INDICES[2]],
+            "end": pandas.array([POOL_INDICES[0], None], dtype="Int64"),
+        }),
+    )
+    assert problem_instance.vehicles[1]._end is None
+    solution = problem_instance.solve(exploration_level=5, nb_threads=4)
+    assert solution.summary.cost == 4255
+
+
+def test_matrix_pool_set_matrices(tmp_path):
+    numpy.save(tmp_path / "pool.npy", pool_matrix())
+    pool = vroom.MatrixPool(durations={"car": tmp_path / "pool.npy"})
+    # Memory-mapped uint32 matrices are not copied.
+    assert not pool._matrices["durations"]["car"].flags.owndata
+
+    pool = vroom.MatrixPool(durations={"car": numpy.asfortranarray(pool_matrix(), dtype="int64")})
+    matrix = pool._matrices["durations"]["car"]
+    assert matrix.dtype == numpy.uint32 and matrix.flags.c_contiguous
+    problem_instance = vroom.Input()
+    pool.set_matrices(problem_instance, POOL_INDICES)
+    problem_instance.add_vehicle([vroom.Vehicle(7, start=0, end=0),
+                                  vroom.Vehicle(8, start=2, end=2)])
+    problem_instance.add_jobs_from_arrays(ids=[1414, 1515, 1616, 1717],
+                                          locations=[0, 1, 2, 3])
+    solution = problem_instance.solve(exploration_level=5, nb_threads=4)
+    assert solution.summary.cost == 6411
+
+    with pytest.raises(_vroom.VroomInputException):
+        vroom.MatrixPool(durations={"car": pool_matrix()}, costs={"car": DURATIONS})
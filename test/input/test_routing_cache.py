@@ -0,0 +1,91 @@
+import gc
+import json
+import pickle
+import sqlite3
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+import vroom
+
+
+class OsrmStub(BaseHTTPRequestHandler):
+    """Minimal osrm-routed answering table queries."""
+
+    queries = []
+
+    def do_GET(self):
+        self.queries.append(self.path)
+        coordinates = self.path.split("/")[-1].split("?")[0].split(";")
+        size = len(coordinates)
+        matrix = [[abs(i - j) * 100 for j in range(size)] for i in range(size)]
+        body = json.dumps({"code": "Ok", "durations": matrix, "distances": matrix})
+        self.send_response(200)
+        self.end_headers()
+        self.wfile.write(body.encode())
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def osrm_server():
+    OsrmStub.queries = []
+    server = ThreadingHTTPServer(("127.0.0.1", 0), OsrmStub)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def solve(server, cache):
+    problem_instance = vroom.Input(servers={"car": server}, cache=cache)
+    problem_instance.add_vehicle(vroom.Vehicle(7, start=(2.44, 48.81), end=(2.44, 48.81)))
+    problem_instance.add_job([vroom.Job(1, location=(2.46, 48.7)),
+                              vroom.Job(2, location=(2.42, 48.6))])
+    return problem_instance.solve(exploration_level=5, nb_threads=4)
+
+
+def test_routing_cache(osrm_server, tmp_path):
+    expected = solve(osrm_server, cache=None).summary.cost
+    assert len(OsrmStub.queries) == 1
+
+    cache = vroom.RoutingCache(tmp_path / "routing.sqlite")
+    assert solve(osrm_server, cache).summary.cost == expected
+    assert solve(osrm_server, cache).summary.cost == expected
+    assert len(OsrmStub.queries) == 2
+    assert len(cache) == 1
+    cache.close()
+
+    # Responses survive in the file.
+    assert solve(osrm_server, tmp_path / "routing.sqlite").summary.cost == expected
+    assert len(OsrmStub.queries) == 2
+
+
+def test_routing_cache_shared(osrm_server, tmp_path):
+    path = tmp_path / "routing.sqlite"
+    problem_instance = vroom.Input(servers={"car": osrm_server}, cache=path)
+    others = [
+        vroom.Input(servers={"car": osrm_server}, cache=str(path)),
+        problem_instance.fork(),
+        pickle.loads(pickle.dumps(problem_instance)),
+    ]
+    cache = problem_instance._cache
+    assert all(other._cache is cache for other in others)
+
+    del problem_instance, others
+    gc.collect()
+    with pytest.raises(sqlite3.ProgrammingError):
+        len(cache)
+
+
+def test_routing_cache_eviction():
+    cache = vroom.RoutingCache(":memory:", max_size=10)
+    keys = [cache.key(vroom._vroom.ROUTER.OSRM, "GET", f"/table/{idx}") for idx in range(3)]
+    cache.put(keys[0], b"12345")
+    cache.put(keys[1], b"12345")
+    assert cache.get(keys[0]) == b"12345"
+    cache.put(keys[2], b"12345")
+    assert cache.get(keys[1]) is None
+    assert cache.get(keys[0]) == cache.get(keys[2]) == b"12345"
@@ -0,0 +1,110 @@
+import gc
+import json
+import threading
+import urllib.parse
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+import vroom
+from vroom import _vroom
+
+
+def travel(source, target):
+    return round((abs(source[0] - target[0]) + abs(source[1] - target[1])) * 10000)
+
+
+class RouterStub(BaseHTTPRequestHandler):
+    """Fake OSRM, ORS and Valhalla table services."""
+
+    queries = []
+
+    def do_GET(self):
+        self.queries.append(self.path)
+        if self.path.startswith("/sources_to_targets"):
+            query = json.loads(urllib.parse.unquote(self.path.split("?json=", 1)[1]))
+            sources = [(loc["lon"], loc["lat"]) for loc in query["sources"]]
+            targets = [(loc["lon"], loc["lat"]) for loc in query["targets"]]
+            table = [[{"time": travel(source, target),
+                       "distance": travel(source, target) / 1000}
+                      for target in targets] for source in sources]
+            return self.reply({"sources_to_targets": table})
+        path, _, args = self.path.partition("?")
+        coordinates = [tuple(map(float, coordinate.split(",")))
+                       for coordinate in path.split("/")[-1].split(";")]
+        args = dict(arg.split("=") for arg in args.split("&"))
+        sources = [coordinates[int(idx)] for idx in args["sources"].split(";")] \
+            if "sources" in args else coordinates
+        targets = [coordinates[int(idx)] for idx in args["destinations"].split(";")] \
+            if "destinations" in args else coordinates
+        self.reply_matrix(sources, targets, code="Ok")
+
+    def do_POST(self):
+        self.queries.append(self.path)
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        locations = [tuple(location) for location in body["locations"]]
+        sources = [locations[idx] for idx in body.get("sources", range(len(locations)))]
+        targets = [locations[idx] for idx in body.get("destinations", range(len(locations)))]
+        self.reply_matrix(sources, targets)
+
+    def reply_matrix(self, sources, targets, **extra):
+        matrix = [[travel(source, target) for target in targets] for source in sources]
+        self.reply({"durations": matrix, "distances": matrix, **extra})
+
+    def reply(self, content):
+        body = json.dumps(content).encode()
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def router_server():
+    RouterStub.queries = []
+    server = ThreadingHTTPServer(("127.0.0.1", 0), RouterStub)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def solve(server, router, **kwargs):
+    problem_instance = vroom.Input(servers={"car": server}, router=router, **kwargs)
+    problem_instance.add_vehicle(vroom.Vehicle(7, start=(2.44, 48.81), end=(2.44, 48.81)))
+    problem_instance.add_job([vroom.Job(1, location=(2.46, 48.7)),
+                              vroom.Job(2, location=(2.42, 48.6)),
+                              vroom.Job(3, location=(2.38, 48.75)),
+                              vroom.Job(4, location=(2.5, 48.9))])
+    return problem_instance.solve(exploration_level=5, nb_threads=4)
+
+
+@pytest.mark.parametrize("router", [_vroom.ROUTER.OSRM, _vroom.ROUTER.ORS, _vroom.ROUTER.VALHALLA])
+def test_tiled_matrix(router_server, router):
+    expected = solve(router_server, router)
+    assert len(RouterStub.queries) == 1
+
+    solution = solve(router_server, router, tile_size=2, max_connections=3)
+    assert len(RouterStub.queries) == 1 + 9
+    assert solution.summary.cost == expected.summary.cost
+    assert solution.routes["id"].tolist() == expected.routes["id"].tolist()
+
+
+def test_proxy_released(router_server):
+    from vroom.input.routing_proxy import _PROXIES
+
+    problem_instance = vroom.Input(servers={"car": router_server}, tile_size=2)
+    scenario = problem_instance.fork()
+    assert len(_PROXIES) == 1
+    proxy, = _PROXIES.values()
+    assert proxy.users == 2
+
+    del problem_instance
+    gc.collect()
+    assert proxy.users == 1
+    del scenario
+    gc.collect()
+    assert not _PROXIES
@@ -1,3 +1,5 @@
+import pickle
+
 import vroom
 from vroom import _vroom
 
@@ -52,3 +54,12 @@ def test_amount_indexing():
     assert amo[1] == 2
     amo[1] = 4
     assert amo == vroom.Amount([1, 4, 3])
+
+
+def test_amount_pickle():
+    amount = vroom.Amount([1, 2, 3])
+    buffers = []
+    data = pickle.dumps(amount, protocol=5, buffer_callback=buffers.append)
+    assert len(buffers) == 1
+    assert pickle.loads(data, buffers=buffers) == amount
+    assert pickle.loads(pickle.dumps(amount)) == amount
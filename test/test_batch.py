@@ -0,0 +1,126 @@
+from datetime import timedelta
+import json
+import multiprocessing
+import pickle
+
+import pytest
+
+import vroom
+from vroom import batch
+
+DURATIONS = [[0, 2104, 197, 1299],
+             [2103, 0, 2255, 3152],
+             [197, 2256, 0, 1102],
+             [1299, 3153, 1102, 0]]
+
+
+def problem(nb_jobs=2):
+    problem_instance = vroom.Input()
+    problem_instance.set_durations_matrix(profile="car", matrix_input=DURATIONS)
+    problem_instance.add_vehicle([vroom.Vehicle(47, start=0, end=0)])
+    problem_instance.add_job([vroom.Job(1414 + idx, location=1 + idx % 3)
+                              for idx in range(nb_jobs)])
+    return problem_instance
+
+
+def summary(solution):
+    result = solution.to_dict()
+    del result["summary"]["computing_times"]
+    return result
+
+
+def test_solution_pickle():
+    problem_instance = vroom.Input()
+    problem_instance.set_durations_matrix(profile="car", matrix_input=DURATIONS)
+    problem_instance.add_vehicle(vroom.Vehicle(
+        7, start=0, end=0, capacity=[2],
+        breaks=[vroom.Break(3, [vroom.TimeWindow(0, 5000)], service=5, description="lunch")],
+    ))
+    problem_instance.add_job([
+        vroom.Job(1, location=vroom.Location(1, coords=(1.5, 2.5)), delivery=[1],
+                  time_windows=[vroom.TimeWindow(0, 5000)], description="a"),
+        vroom.Job(2, location=3, delivery=[5], skills={4}),
+    ])
+    problem_instance.add_shipment(
+        vroom.ShipmentStep(5, location=2, description="p"),
+        vroom.ShipmentStep(6, location=1),
+        amount=vroom.Amount([1]),
+    )
+    solution = problem_instance.solve(exploration_level=5, nb_threads=1)
+    solution._geometry = True
+
+    copy = pickle.loads(pickle.dumps(solution))
+    assert type(copy) is vroom.solution.solution.Solution
+    assert copy._geometry
+    assert summary(copy) == summary(solution)
+    assert copy.to_dict()["summary"] == solution.to_dict()["summary"]
+    assert [job._id for job in copy.unassigned] == [2]
+    assert copy.routes.equals(solution.routes)
+
+
+def test_solve_many(tmp_path):
+    path = tmp_path / "problem.json"
+    path.write_text(json.dumps({
+        "vehicles": [{"id": 0, "start_index": 0, "end_index": 3}],
+        "jobs": [{"id": 1414, "location_index": 1}, {"id": 1515, "location_index": 2}],
+        "matrices": {"car": {"durations": DURATIONS}},
+    }))
+    inputs = [problem(2), path, problem(3)]
+    results = dict(vroom.solve_many(inputs, exploration_level=5, max_workers=2))
+    assert sorted(results) == [0, 1, 2]
+    for position, problem_instance in enumerate(inputs):
+        if isinstance(problem_instance, vroom.Input):
+            expected = problem_instance.solve(exploration_level=5, nb_threads=1)
+        else:
+            expected = vroom.Input.from_json(path).solve(exploration_level=5, nb_threads=1)
+        assert summary(results[position]) == summary(expected)
+
+    # Inputs travel to spawned workers by pickling.
+    spawned = dict(vroom.solve_many(inputs[:1], exploration_level=5, max_workers=1,
+                                    mp_context=multiprocessing.get_context("spawn")))
+    assert summary(spawned[0]) == summary(results[0])
+
+    assert list(vroom.solve_many([], exploration_level=5)) == []
+
+
+def test_solve_many_timeout():
+    inputs = [problem(2), problem(3)]
+    results = dict(vroom.solve_many(inputs, exploration_level=5, max_workers=2,
+                                    timeout=timedelta(seconds=60)))
+    for position, problem_instance in enumerate(inputs):
+        expected = problem_instance.solve(exploration_level=5, nb_threads=1)
+        assert summary(results[position]) == summary(expected)
+
+
+class Submitted(Exception):
+    """Stop a batch at its first submission."""
+
+
+def test_solve_many_budget(monkeypatch):
+    submitted = []
+
+    class Executor:
+        def __init__(self, max_workers, mp_context=None):
+            submitted.append(max_workers)
+
+        def submit(self, function, task, exploration_level, nb_threads, timeout, kwargs):
+            submitted.append((task, nb_threads))
+            raise Submitted
+
+        def shutdown(self, wait=True, cancel_futures=False):
+            pass
+
+    monkeypatch.setattr(batch, "ProcessPoolExecutor", Executor)
+    monkeypatch.setattr(batch.os, "cpu_count", lambda: 8)
+    inputs = [problem(1), problem(3), problem(2)]
+    with pytest.raises(Submitted):
+        list(vroom.solve_many(inputs, exploration_level=5, threads_per_solve=3))
+    workers, (task, nb_threads) = submitted
+    assert (workers, nb_threads) == (2, 3)
+    # Largest problem first.
+    assert task is inputs[1]
+
+    submitted.clear()
+    with pytest.raises(Submitted):
+        list(vroom.solve_many(inputs, exploration_level=5, max_workers=3, threads_per_solve=4))
+    assert submitted[0] * submitted[1][1] <= 8
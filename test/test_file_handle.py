@@ -2,6 +2,7 @@
 from pathlib import Path
 import json
 
+import numpy
 import pytest
 
 import vroom
@@ -33,3 +34,66 @@ def test_loader(example_2_reference):
     input = vroom.Input.from_json(INPUT_FILE)
     solution = input.solve(exploration_level=5, nb_threads=4)
     assert_equal(solution.to_dict(), example_2_reference)
+
+
+@pytest.mark.parametrize("source", ["str", "bytes", "binary", "text"])
+def test_loader_sources(example_2_reference, source):
+    if source == "str":
+        problem_instance = vroom.Input.from_json(str(INPUT_FILE))
+    elif source == "bytes":
+        problem_instance = vroom.Input.from_json(INPUT_FILE.read_bytes())
+    else:
+        with INPUT_FILE.open("rb" if source == "binary" else "r") as handle:
+            problem_instance = vroom.Input.from_json(handle)
+    solution = problem_instance.solve(exploration_level=5, nb_threads=4)
+    assert_equal(solution.to_dict(), example_2_reference)
+
+
+def test_loader_errors(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        vroom.Input.from_json(tmp_path / "missing.json")
+    with pytest.raises(vroom._vroom.VroomInputException):
+        vroom.Input.from_json(b'{"vehicles": [')
+
+
+def test_from_dict(example_2_reference):
+    problem = json.loads(INPUT_FILE.read_text())
+    problem["matrices"]["car"]["durations"] = numpy.asarray(
+        problem["matrices"]["car"]["durations"], dtype="uint32")
+    problem["jobs"][0]["id"] = numpy.int64(problem["jobs"][0]["id"])
+    problem_instance = vroom.Input.from_dict(problem)
+    solution = problem_instance.solve(exploration_level=5, nb_threads=4)
+    assert_equal(solution.to_dict(), example_2_reference)
+
+    with pytest.raises(TypeError):
+        vroom.Input.from_dict({"vehicles": [{"id": object()}]})
+
+
+def test_to_dict_options(example_2_reference):
+    solution = vroom.Input.from_json(INPUT_FILE).solve(exploration_level=5, nb_threads=4)
+    assert_equal(solution.to_dict(geometry=False), example_2_reference)
+    solution._distances = True
+    result = solution.to_dict(geometry=False)
+    assert result["summary"]["distance"] == 0
+    assert all("distance" in step for route in result["routes"] for step in route["steps"])
+    assert all("geometry" not in route for route in result["routes"])
+
+
+def test_to_json(example_2_reference, tmp_path):
+    solution = vroom.Input.from_json(INPUT_FILE).solve(exploration_level=5, nb_threads=4)
+    solution.to_json(tmp_path / "compact.json")
+    assert len((tmp_path / "compact.json").read_text().splitlines()) == 1
+    assert_equal(json.loads((tmp_path / "compact.json").read_text()), example_2_reference)
+
+    solution.to_json(str(tmp_path / "pretty.json"), compact=False)
+    assert len((tmp_path / "pretty.json").read_text().splitlines()) > 1
+    assert_equal(json.loads((tmp_path / "pretty.json").read_text()), example_2_reference)
+
+    with (tmp_path / "solution.ndjson").open("w") as handle:
+        solution.to_json(handle, ndjson=True)
+    header, *routes = map(json.loads, (tmp_path / "solution.ndjson").read_text().splitlines())
+    assert "routes" not in header
+    assert_equal({**header, "routes": routes}, example_2_reference)
+
+    with pytest.raises(OSError):
+        solution.to_json(tmp_path / "missing" / "solution.json")
@@ -1,3 +1,5 @@
+import pickle
+
 import vroom
 
 
@@ -114,3 +116,12 @@ def test_job_attributes():
     assert SHIPMENT2.amount == vroom.Amount([6])
     assert SHIPMENT2.skills == {7}
     assert SHIPMENT2.priority == 8
+
+
+def test_job_pickle():
+    job = vroom.Job(1, location=[1., 2.], default_service=5, delivery=[4], pickup=[7],
+                    skills={3}, priority=2, time_windows=[(3, 4)], description="a")
+    copy = pickle.loads(pickle.dumps(job))
+    assert isinstance(copy, vroom.Job)
+    assert repr(copy) == repr(job)
+    assert copy.skills == job.skills
@@ -0,0 +1,101 @@
+import pickle
+
+import numpy
+import pytest
+
+import vroom
+from vroom import _vroom
+
+DURATIONS = numpy.array([[0, 2104, 197, 1299],
+                         [2103, 0, 2255, 3152],
+                         [197, 2256, 0, 1102],
+                         [1299, 3153, 1102, 0]])
+
+
+@pytest.mark.parametrize("array", [
+    DURATIONS.astype("uint32"),
+    DURATIONS,
+    numpy.asfortranarray(DURATIONS.astype("uint32")),
+    DURATIONS.T.copy().T,
+])
+def test_matrix_from_array(array):
+    matrix = _vroom.Matrix(array)
+    assert matrix.size() == 4
+    numpy.testing.assert_array_equal(numpy.asarray(matrix), DURATIONS)
+
+
+def test_matrix_from_array_errors():
+    with pytest.raises(RuntimeError):
+        _vroom.Matrix(numpy.zeros((2, 3), dtype="uint32"))
+
+
+@pytest.mark.parametrize("array", [
+    DURATIONS.astype("uint32"),
+    DURATIONS,
+    numpy.asfortranarray(DURATIONS),
+    _vroom.Matrix(DURATIONS.astype("uint32")),
+])
+def test_set_durations_matrix(array):
+    problem_instance = vroom.Input()
+    problem_instance.set_durations_matrix("car", array)
+    problem_instance.add_vehicle([vroom.Vehicle(7, start=0, end=0),
+                                  vroom.Vehicle(8, start=2, end=2)])
+    problem_instance.add_job([vroom.Job(1414, location=0),
+                              vroom.Job(1515, location=1),
+                              vroom.Job(1616, location=2),
+                              vroom.Job(1717, location=3)])
+    solution = problem_instance.solve(exploration_level=5, nb_threads=4)
+    assert solution.summary.cost == 6411
+
+
+def test_set_durations_matrix_from_file(tmp_path):
+    numpy.save(tmp_path / "durations.npy", DURATIONS)
+    DURATIONS.astype("uint32").tofile(tmp_path / "durations.bin")
+    (tmp_path / "broken.bin").write_bytes(b"\0" * 12)
+
+    for path in [tmp_path / "durations.npy", str(tmp_path / "durations.bin")]:
+        problem_instance = vroom.Input()
+        problem_instance.set_durations_matrix("car", path)
+        problem_instance.add_vehicle(vroom.Vehicle(7, start=0, end=0))
+        problem_instance.add_job([vroom.Job(1414, location=1),
+                                  vroom.Job(1515, location=2)])
+        solution = problem_instance.solve(exploration_level=5, nb_threads=4)
+        assert solution.summary.cost == 2104 + 2255 + 197
+
+    with pytest.raises(_vroom.VroomInputException):
+        vroom.Input().set_durations_matrix("car", tmp_path / "broken.bin")
+
+
+def test_compact_matrix():
+    compact = (DURATIONS // 10).astype("uint16")
+    expected = compact.astype("uint32") * 10
+    numpy.testing.assert_array_equal(numpy.asarray(_vroom.Matrix(compact, scale=10)), expected)
+    numpy.testing.assert_array_equal(
+        numpy.asarray(_vroom.Matrix(numpy.asfortranarray(compact), scale=10)), expected)
+    numpy.testing.assert_array_equal(numpy.asarray(_vroom.Matrix(compact)), compact)
+
+    with pytest.raises(_vroom.VroomInputException):
+        _vroom.Matrix(numpy.full((2, 2), 2**31, dtype="uint32"), scale=2)
+
+
+def test_set_durations_matrix_compact(tmp_path):
+    (DURATIONS // 10).astype("uint16").tofile(tmp_path / "durations.bin")
+    for matrix_input in [tmp_path / "durations.bin", DURATIONS // 10]:
+        problem_instance = vroom.Input()
+        problem_instance.set_durations_matrix(
+            "car", matrix_input, dtype="uint16", scale=10)
+        problem_instance.add_vehicle(vroom.Vehicle(7, start=0, end=0))
+        problem_instance.add_job([vroom.Job(1414, location=1),
+                                  vroom.Job(1515, location=2)])
+        solution = problem_instance.solve(exploration_level=5, nb_threads=4)
+        assert solution.summary.cost == 2100 + 2250 + 190
+
+
+def test_matrix_pickle():
+    matrix = _vroom.Matrix(numpy.arange(9, dtype="uint32").reshape(3, 3))
+    buffers = []
+    data = pickle.dumps(matrix, protocol=5, buffer_callback=buffers.append)
+    assert len(data) < 200
+    assert bytes(buffers[0].raw()) == numpy.asarray(matrix).tobytes()
+    copy = pickle.loads(data, buffers=buffers)
+    numpy.testing.assert_array_equal(numpy.asarray(copy), numpy.asarray(matrix))
@@ -0,0 +1,119 @@
+import gc
+import pickle
+
+import pytest
+
+import vroom
+
+DURATIONS = [[0, 2104, 197, 1299],
+             [2103, 0, 2255, 3152],
+             [197, 2256, 0, 1102],
+             [1299, 3153, 1102, 0]]
+
+
+def solve():
+    problem_instance = vroom.Input()
+    problem_instance.set_durations_matrix(profile="car", matrix_input=DURATIONS)
+    problem_instance.add_vehicle(vroom.Vehicle(7, start=0, end=0, capacity=[1]))
+    problem_instance.add_job([
+        vroom.Job(1, location=1, delivery=[1]),
+        vroom.Job(2, location=2, delivery=[1]),
+    ])
+    return problem_instance.solve(exploration_level=5, nb_threads=1)
+
+
+def test_solution_references():
+    solution = solve()
+    route, = solution._routes
+    steps = route.steps
+    unassigned = solution.unassigned
+    assert [job._id for job in unassigned] == [1]
+
+    # Views on the solution, which they keep alive.
+    route.cost = 12
+    assert solution._routes[0].cost == 12
+    del solution, route
+    gc.collect()
+    assert [step._arrival for step in steps] == [0, 197, 394]
+    assert [job._id for job in unassigned] == [1]
+
+
+def test_solution_copy():
+    native = solve()
+    copy = vroom.solution.solution.Solution(native)
+    assert copy.summary.cost == native.summary.cost == 394
+    # Only solutions fresh from the solver are moved, and only once.
+    with pytest.raises(TypeError):
+        vroom.solution.solution.Solution(native, move=True)
+    problem_instance = vroom.Input()
+    problem_instance.set_durations_matrix(profile="car", matrix_input=DURATIONS)
+    problem_instance.add_vehicle(vroom.Vehicle(7, start=0, end=0))
+    problem_instance.add_job(vroom.Job(1, location=1))
+    fresh = problem_instance._solve(exploration_level=5, nb_threads=1, timeout=None)
+    moved = vroom.solution.solution.Solution._from_native(fresh)
+    assert moved.summary.cost == 4207
+    with pytest.raises(TypeError):
+        vroom.solution.solution.Solution._from_native(fresh)
+
+
+def test_routes_frame(monkeypatch):
+    solution = solve()
+    frame = solution.routes
+    assert frame["type"].tolist() == ["start", "job", "end"]
+    assert frame["id"].dtype == "Int64"
+    assert frame["id"].isna().tolist() == [True, False, True]
+    assert "longitude" not in frame
+    assert "distance" not in frame
+
+    # Built once, and handed out as copies.
+    monkeypatch.setattr(type(solution), "_build_routes", None)
+    frame.loc[0, "arrival"] = 10
+    assert solution.routes["arrival"].tolist() == [0, 197, 394]
+    copy = pickle.loads(pickle.dumps(solution))
+    assert "_routes_frame" not in copy.__dict__
+    monkeypatch.undo()
+
+    solution._distances = True
+    assert solution.routes["distance"].tolist() == [0, 0, 0]
+    assert copy.routes.equals(solve().routes)
+
+
+def test_to_arrow(tmp_path):
+    pyarrow = pytest.importorskip("pyarrow")
+    pytest.importorskip("pyarrow.parquet")
+    problem_instance = vroom.Input()
+    problem_instance.set_durations_matrix(profile="car", matrix_input=DURATIONS)
+    problem_instance.add_vehicle(vroom.Vehicle(
+        7, start=0, end=0, capacity=[2], description="van",
+        breaks=[vroom.Break(3, [vroom.TimeWindow(0, 5000)], service=5, description="lunch")],
+    ))
+    problem_instance.add_job([
+        vroom.Job(1, location=vroom.Location(1, coords=(1.5, 2.5)), delivery=[1],
+                  description="a" * 60),
+        vroom.Job(2, location=3, delivery=[1]),
+        vroom.Job(4, location=2, delivery=[5], description="too big"),
+    ])
+    solution = problem_instance.solve(exploration_level=5, nb_threads=1)
+    tables = solution.to_arrow()
+
+    steps = tables["steps"].to_pandas()
+    frame = solution.routes
+    assert steps["type"].astype(str).tolist() == frame["type"].astype(str).tolist()
+    for column in ["vehicle_id", "arrival", "duration", "setup", "service", "waiting_time"]:
+        assert steps[column].tolist() == frame[column].tolist()
+    assert tables["steps"].column("id").to_pylist() == [None, 3, 2, 1, None]
+    assert tables["steps"].column("longitude").to_pylist() == [None, None, None, 1.5, None]
+    assert tables["steps"].column("description").to_pylist()[3] == "a" * 60
+    assert tables["steps"].column("load").to_pylist() == [[2], [2], [1], [0], [0]]
+    assert "distance" not in tables["steps"].column_names
+
+    routes = tables["routes"]
+    assert routes.column("vehicle_id").to_pylist() == [7]
+    assert routes.column("description").to_pylist() == ["van"]
+    assert routes.column("delivery").to_pylist() == [[2]]
+    assert tables["unassigned"].column("id").to_pylist() == [4]
+    assert tables["unassigned"].column("type").to_pylist() == ["job"]
+
+    solution.to_parquet(tmp_path / "solution")
+    for name, table in tables.items():
+        assert pyarrow.parquet.read_table(tmp_path / "solution" / f"{name}.parquet").equals(table)
@@ -0,0 +1,94 @@
+from datetime import timedelta
+
+import pandas
+import pytest
+
+import vroom
+from vroom import tuning
+
+DURATIONS = [[0, 2104, 197, 1299],
+             [2103, 0, 2255, 3152],
+             [197, 2256, 0, 1102],
+             [1299, 3153, 1102, 0]]
+
+
+def problem(nb_jobs=2):
+    problem_instance = vroom.Input()
+    problem_instance.set_durations_matrix(profile="car", matrix_input=DURATIONS)
+    problem_instance.add_vehicle([vroom.Vehicle(47, start=0, end=0)])
+    problem_instance.add_job([vroom.Job(1414 + idx, location=1 + idx % 3)
+                              for idx in range(nb_jobs)])
+    return problem_instance
+
+
+def test_default_configurations():
+    configurations = tuning._default_configurations()
+    pairs = {(c["nb_searches"], c["depth"]) for c in configurations}
+    assert set(tuning._levels()) <= pairs
+    assert tuning._levels()[(32, 5)] == 5
+    assert {c["nb_threads"] for c in configurations} >= {1}
+
+
+def test_tune(tmp_path):
+    path = tmp_path / "problem.json"
+    path.write_text(
+        '{"vehicles": [{"id": 1, "start_index": 0, "end_index": 0}],'
+        ' "jobs": [{"id": 1, "location_index": 1}],'
+        ' "matrices": {"car": {"durations": [[0, 3], [2, 0]]}}}'
+    )
+    results = vroom.tune(
+        [problem(2), problem(3), path],
+        time_budget=timedelta(seconds=60),
+        configurations=[dict(exploration_level=2, nb_threads=2),
+                        dict(nb_searches=1, depth=0),
+                        dict(exploration_level=5, depth=1)],
+    )
+    assert list(results.columns) == [
+        "nb_searches", "depth", "nb_threads", "exploration_level",
+        "unassigned", "cost", "wall_time", "pareto",
+    ]
+    assert results["wall_time"].is_monotonic_increasing
+    assert sorted(map(tuple, results[["nb_searches", "depth", "nb_threads"]].values)) == [
+        (1, 0, 1), (12, 2, 2), (32, 1, 1)]
+    assert results["exploration_level"].isna().tolist() == [
+        nb_searches != 12 for nb_searches in results["nb_searches"]]
+    assert (results["unassigned"] == 0).all()
+    assert (results["cost"] == 4556 + 6555 + 5).all()
+    # Equal costs, so only the fastest configuration is on the front.
+    assert results["pareto"].tolist() == [True, False, False]
+
+    # The first configuration runs even with no time left.
+    results = vroom.tune([problem()], time_budget=timedelta(0), sample=1)
+    assert len(results) == 1
+    assert results.loc[0, ["nb_searches", "depth", "nb_threads"]].tolist() == [4, 0, 1]
+
+
+def test_tune_without_timeout(monkeypatch):
+    timeouts = []
+    solve = vroom.Input.solve
+
+    def record(self, *args, **kwargs):
+        timeouts.append(kwargs["timeout"])
+        return solve(self, *args, **kwargs)
+
+    monkeypatch.setattr(vroom.Input, "solve", record)
+    vroom.tune([problem(2), problem(3)], time_budget=timedelta(seconds=60),
+               configurations=[dict(exploration_level=1), dict(exploration_level=2)])
+    assert timeouts == [None] * 4
+
+
+def test_tune_invalid_threads():
+    with pytest.raises(ValueError, match="thread"):
+        vroom.tune([problem()], time_budget=timedelta(seconds=10),
+                   configurations=[dict(exploration_level=1), dict(nb_threads=0)])
+
+
+def test_pareto():
+    frame = pandas.DataFrame({
+        "unassigned": [0, 1, 0, 0],
+        "cost": [10, 5, 8, 12],
+        "wall_time": [3.0, 1.0, 4.0, 2.0],
+    })
+    assert tuning._pareto(frame).tolist() == [True, True, True, True]
+    frame["cost"] = [10, 5, 13, 9]
+    assert tuning._pareto(frame).tolist() == [False, True, False, True]
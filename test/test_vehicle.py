@@ -1,3 +1,5 @@
+import pickle
+
 import vroom
 
 
@@ -26,3 +28,14 @@ def test_repr():
     assert (repr(vroom.Vehicle(3, end=7, steps=[vroom.VehicleStep("single", 3)]))
             == """vroom.Vehicle(3, end=7, \
 steps=[vroom.VehicleStepStart(), vroom.VehicleStepSingle(3), vroom.VehicleStepEnd()])""")
+
+
+def test_pickle():
+    vehicle = vroom.Vehicle(
+        3, start=(2., 3.), end=7, capacity=[1, 2], skills={7}, speed_factor=1.25,
+        breaks=[vroom.Break(4, [(1, 2)], service=3, max_load=[1, 1])],
+        max_travel_time=100, steps=[vroom.VehicleStepStart(), vroom.VehicleStepBreak(4)],
+    )
+    copy = pickle.loads(pickle.dumps(vehicle))
+    assert isinstance(copy, vroom.Vehicle)
+    assert repr(copy) == repr(vehicle)